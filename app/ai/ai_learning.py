@@ -33,10 +33,49 @@ FIX (Apr 02 2026) — 47.P3-3: Kill C/C- grades.
                        - grade_to_label(): scores below 0.60 return 'reject'.
                        - config.py: MIN_CONFIDENCE_BY_GRADE / CONFIDENCE_CAP_BY_GRADE
                          C+/C/C- entries removed; CONFIDENCE_ABSOLUTE_FLOOR 0.55 → 0.60.
+PERF-AIL-1 (Oct 18 2026): compute_confidence() memoizes the (grade, timeframe)
+                     score with functools.lru_cache. The ticker argument is
+                     still unused, so it is kept out of the cache key rather
+                     than fragmenting the cache per symbol.
+PERF-AIL-2 (Oct 18 2026): learning state serializes with orjson (stdlib
+                     json fallback). This entry first also made the JSON
+                     file write atomic (tmp + fsync + os.replace); PERF-AIL-8
+                     moved the state into ai_learning_state, so nothing
+                     writes the JSON file any more.
+PERF-AIL-3 (Oct 18 2026): optimize_eod() runs both EOD optimizers with
+                     save=False and persists the learning state once, instead
+                     of each optimizer re-serializing the full trade history.
+PERF-AIL-5 (Oct 18 2026): the legacy JSON import in load_data() (SQLite,
+                     no ai_learning_state row yet) opens the file directly
+                     and treats FileNotFoundError as "nothing to import",
+                     dropping the os.path.exists() stat before the open().
+PERF-AIL-6 (Oct 18 2026): learning state is serialized compact (_dump_state():
+                     orjson without OPT_INDENT_2, stdlib separators=(",", ":"))
+                     for the ai_learning_state upsert (Postgres JSONB /
+                     SQLite TEXT).
+PERF-AIL-7 (Oct 18 2026): record_trade() no longer saves synchronously. It
+                     marks the state dirty and a daemon flusher (started on the
+                     first trade) writes it after a SAVE_DEBOUNCE_S window, so a
+                     burst of closes costs one write. flush() is registered
+                     with atexit; save_data() snapshots under the engine lock
+                     and serializes writers.
+PERF-AIL-8 (Oct 18 2026): without Postgres the learning state lives in the
+                     SQLite ai_learning_state table (WAL, single-row upsert)
+                     instead of a rewritten JSON file, so a second process
+                     reading or saving it gets atomic, consistent rows. The
+                     JSON file is only read once, as a legacy import, when the
+                     table has no row yet.
+PERF-AIL-9 (Oct 18 2026): the EOD optimizers report a change (and save) only
+                     when a rounded weight / FVG threshold actually differs
+                     from the stored value, so a converged system does no
+                     EOD write.
 """
 
+import atexit
 import json
-import os
+import threading
+import time
+from functools import lru_cache
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from typing import Dict, List
@@ -46,8 +85,18 @@ from utils import config
 import logging
 logger = logging.getLogger(__name__)
 
+# PERF-AIL-2: orjson for learning-state serialization (stdlib json fallback if not installed)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 ET = ZoneInfo("America/New_York")
 
+# PERF-AIL-7: coalesce learning-state writes from bursts of trade closes
+SAVE_DEBOUNCE_S = 0.5
+
 
 # =============================================================================
 # CONFIDENCE SCORING (formerly learning_policy.py)
@@ -103,6 +152,12 @@ def compute_confidence(
         Float in [0.0, 1.0] representing signal confidence.
         Falls back to MIN_CONFIDENCE (0.60) for unrecognised/C-tier grades.
     """
+    return _grade_tf_confidence(grade, timeframe)
+
+
+@lru_cache(maxsize=64)
+def _grade_tf_confidence(grade: str, timeframe: str) -> float:
+    """PERF-AIL-1: memoized body of compute_confidence() — tiny key space."""
     base = _GRADE_BASE.get(grade, MIN_CONFIDENCE)
     tf_mult = _TF_MULTIPLIER.get(timeframe, 1.00)
     score = base * tf_mult
@@ -146,9 +201,32 @@ _DEFAULT_DATA: Dict = {
 }
 
 
+def _dump_state(data: Dict) -> bytes:
+    """
+    Serialize learning state as compact JSON bytes.
+
+    PERF-AIL-6: no indentation — the state is machine-written and
+    machine-read, and rewritten on every debounced save. For a readable
+    copy, pretty-print the row: SELECT jsonb_pretty(data) FROM
+    ai_learning_state (Postgres), or pipe SQLite's data column through
+    python -m json.tool.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            pass   # e.g. a type orjson rejects; stdlib handles it below
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
 class AILearningEngine:
     def __init__(self, db_path: str = "learning_data.json"):
         self.db_path = db_path
+        # PERF-AIL-7: _lock guards self.data; _save_lock serializes writers.
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._flusher = None
         self._init_learning_table()
         # FIX #47: wrap load_data() — if Postgres row is malformed or JSON file
         # is corrupt this previously crashed the module-level singleton and took
@@ -162,21 +240,29 @@ class AILearningEngine:
             self.data = dict(_DEFAULT_DATA)
 
     def _init_learning_table(self):
-        """Create AI learning state table in PostgreSQL."""
-        if not db_connection.USE_POSTGRES:
-            return
+        """Create the AI learning state table (PostgreSQL JSONB / SQLite TEXT)."""
         conn = None
         try:
             conn = db_connection.get_conn()
             cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS ai_learning_state (
-                    id INTEGER PRIMARY KEY DEFAULT 1,
-                    data JSONB NOT NULL,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    CONSTRAINT single_row CHECK (id = 1)
-                )
-            """)
+            if db_connection.USE_POSTGRES:
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS ai_learning_state (
+                        id INTEGER PRIMARY KEY DEFAULT 1,
+                        data JSONB NOT NULL,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        CONSTRAINT single_row CHECK (id = 1)
+                    )
+                """)
+            else:
+                # PERF-AIL-8: SQLite (WAL) replaces the JSON file as the store
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS ai_learning_state (
+                        id INTEGER PRIMARY KEY CHECK (id = 1),
+                        data TEXT NOT NULL,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
             conn.commit()
         except Exception as e:
             # BUG-AIL-1: table creation failure is an error, not info.
@@ -186,73 +272,87 @@ class AILearningEngine:
                 db_connection.return_conn(conn)
 
     def load_data(self) -> Dict:
-        """Load learning data from PostgreSQL or JSON file."""
+        """Load learning data from the database (legacy JSON file on first SQLite run)."""
         default_data = dict(_DEFAULT_DATA)
 
+        conn = None
+        try:
+            conn = db_connection.get_conn()
+            cursor = db_connection.dict_cursor(conn)
+            cursor.execute("SELECT data FROM ai_learning_state WHERE id = 1")
+            row = cursor.fetchone()
+            if row:
+                d = row["data"]
+                if not isinstance(d, dict):
+                    d = json.loads(d)
+                return {**default_data, **d}
+        except Exception as e:
+            # BUG-AIL-1: DB load failure causes silent fallback to defaults — must be visible.
+            logger.warning(f"[AI] Error loading learning state from DB: {e}")
+        finally:
+            if conn:
+                db_connection.return_conn(conn)
+
         if db_connection.USE_POSTGRES:
-            conn = None
-            try:
-                conn = db_connection.get_conn()
-                cursor = db_connection.dict_cursor(conn)
-                cursor.execute("SELECT data FROM ai_learning_state WHERE id = 1")
-                row = cursor.fetchone()
-                if row:
-                    d = row["data"]
-                    if not isinstance(d, dict):
-                        d = json.loads(d)
-                    return {**default_data, **d}
-            except Exception as e:
-                # BUG-AIL-1: PG load failure causes silent fallback to defaults — must be visible.
-                logger.warning(f"[AI] Error loading from PostgreSQL: {e}")
-            finally:
-                if conn:
-                    db_connection.return_conn(conn)
             return default_data
 
-        if os.path.exists(self.db_path):
-            try:
-                with open(self.db_path, "r") as f:
-                    loaded = json.load(f)
-                if isinstance(loaded, dict):
-                    return {**default_data, **loaded}
-            except Exception as e:
-                # BUG-AIL-1: JSON load failure causes silent fallback to defaults.
-                logger.warning(f"[AI] Error loading JSON: {e}")
+        # PERF-AIL-8: no SQLite row yet — import the legacy JSON file once;
+        # the next save_data() moves it into the table.
+        # PERF-AIL-5: EAFP — open() directly; a missing file is the first-run
+        # case, not an error, so it falls through to defaults without a warning.
+        try:
+            with open(self.db_path, "r") as f:
+                loaded = json.load(f)
+            if isinstance(loaded, dict):
+                logger.info(f"[AI] Importing legacy learning state from {self.db_path}")
+                return {**default_data, **loaded}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # BUG-AIL-1: JSON load failure causes silent fallback to defaults.
+            logger.warning(f"[AI] Error loading JSON: {e}")
         return default_data
 
     def save_data(self):
-        """Save learning data to PostgreSQL or JSON file."""
-        # FIX #38: datetime.now() was naive (UTC on Railway).
-        # Use ZoneInfo ET for consistent timestamps across the codebase.
-        self.data["last_update"] = datetime.now(ET).isoformat()
-
+        """Save learning data to the database (single-row upsert)."""
+        with self._save_lock:
+            with self._lock:
+                # FIX #38: datetime.now() was naive (UTC on Railway).
+                # Use ZoneInfo ET for consistent timestamps across the codebase.
+                self.data["last_update"] = datetime.now(ET).isoformat()
+                body = _dump_state(self.data)
+            self._write_state(body)
+
+    def _write_state(self, body: bytes):
+        """Persist a serialized state snapshot (caller holds _save_lock)."""
         if db_connection.USE_POSTGRES:
-            conn = None
-            try:
-                conn = db_connection.get_conn()
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO ai_learning_state (id, data, updated_at)
-                    VALUES (1, %s::jsonb, CURRENT_TIMESTAMP)
-                    ON CONFLICT (id) DO UPDATE SET
-                        data       = EXCLUDED.data,
-                        updated_at = CURRENT_TIMESTAMP
-                """, (json.dumps(self.data),))
-                conn.commit()
-            except Exception as e:
-                # BUG-AIL-1: PG save failure means learning state is lost — must surface.
-                logger.warning(f"[AI] Error saving to PostgreSQL: {e}")
-            finally:
-                if conn:
-                    db_connection.return_conn(conn)
-            return
-
+            sql = """
+                INSERT INTO ai_learning_state (id, data, updated_at)
+                VALUES (1, %s::jsonb, CURRENT_TIMESTAMP)
+                ON CONFLICT (id) DO UPDATE SET
+                    data       = EXCLUDED.data,
+                    updated_at = CURRENT_TIMESTAMP
+            """
+        else:
+            sql = """
+                INSERT INTO ai_learning_state (id, data, updated_at)
+                VALUES (1, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT (id) DO UPDATE SET
+                    data       = excluded.data,
+                    updated_at = CURRENT_TIMESTAMP
+            """
+        conn = None
         try:
-            with open(self.db_path, "w") as f:
-                json.dump(self.data, f, indent=2)
+            conn = db_connection.get_conn()
+            cursor = conn.cursor()
+            cursor.execute(sql, (body.decode("utf-8"),))
+            conn.commit()
         except Exception as e:
-            # BUG-AIL-1: JSON save failure means learning state is lost.
-            logger.warning(f"[AI] Error saving JSON: {e}")
+            # BUG-AIL-1: save failure means learning state is lost — must surface.
+            logger.warning(f"[AI] Error saving learning state to DB: {e}")
+        finally:
+            if conn:
+                db_connection.return_conn(conn)
 
     def record_trade(self, trade: Dict):
         """Record a completed trade for learning."""
@@ -272,9 +372,10 @@ class AILearningEngine:
             "timeframe":      trade.get("timeframe", "1m")
         }
 
-        self.data["trades"].append(trade_record)
-        self.update_performance_metrics(trade_record)
-        self.save_data()
+        with self._lock:
+            self.data["trades"].append(trade_record)
+            self.update_performance_metrics(trade_record)
+        self._schedule_save()
 
         # FIX #37: print() → logger.info() — consistent with rest of codebase.
         logger.info(
@@ -282,6 +383,30 @@ class AILearningEngine:
             f"{'WIN' if trade_record['win'] else 'LOSS'} ${trade['pnl']:+.2f}"
         )
 
+    def _schedule_save(self):
+        """PERF-AIL-7: mark state dirty; the flusher writes it after the debounce window."""
+        self._dirty.set()
+        if self._flusher is None:
+            with self._save_lock:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop, daemon=True, name="ai_learning_flush"
+                    )
+                    self._flusher.start()
+                    atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            self._dirty.wait()
+            time.sleep(SAVE_DEBOUNCE_S)
+            self.flush()
+
+    def flush(self):
+        """Write pending learning state now, if any."""
+        if self._dirty.is_set():
+            self._dirty.clear()
+            self.save_data()
+
     def update_performance_metrics(self, trade: Dict):
         """Update performance tracking by pattern, ticker, timeframe."""
         ticker    = trade["ticker"]
@@ -311,8 +436,21 @@ class AILearningEngine:
             self.data["timeframe_performance"][timeframe]["wins"] += 1
         self.data["timeframe_performance"][timeframe]["total_pnl"] += pnl
 
-    def optimize_confirmation_weights(self):
-        """Analyze which confirmations correlate with wins."""
+    def optimize_eod(self) -> bool:
+        """
+        PERF-AIL-3: run every EOD optimizer, then save the state once.
+        Returns True if anything changed (and was saved).
+        """
+        with self._lock:
+            changed = self.optimize_confirmation_weights(save=False)
+            changed = self.optimize_fvg_threshold(save=False) or changed
+        if changed:
+            self._dirty.clear()   # PERF-AIL-7: this save covers any pending trades
+            self.save_data()
+        return changed
+
+    def optimize_confirmation_weights(self, save: bool = True) -> bool:
+        """Analyze which confirmations correlate with wins. Returns True if weights changed."""
         trades_with_confirmations = [
             t for t in self.data["trades"]
             if "confirmations" in t and t["confirmations"]
@@ -324,7 +462,7 @@ class AILearningEngine:
                 f"[AI] Confirmation optimization skipped — "
                 f"{len(trades_with_confirmations)}/20 trades with confirmations"
             )
-            return
+            return False
 
         all_trades = self.data["trades"]
         baseline_wr = (
@@ -349,19 +487,30 @@ class AILearningEngine:
                     if win:
                         confirmation_scores[conf_type]["wins"] += 1
 
+        weights = self.data["confirmation_weights"]
+        changed = False
         for conf_type, scores in confirmation_scores.items():
             if scores["total"] > 0:
                 win_rate   = scores["wins"] / scores["total"]
-                new_weight = win_rate / baseline_wr
-                self.data["confirmation_weights"][conf_type] = round(new_weight, 2)
+                new_weight = round(win_rate / baseline_wr, 2)
+                # PERF-AIL-9: only a real change dirties the state
+                if weights.get(conf_type) != new_weight:
+                    weights[conf_type] = new_weight
+                    changed = True
+
+        if not changed:
+            logger.debug("[AI] Confirmation weights unchanged — nothing to save")
+            return False
 
         logger.info("[AI] Confirmation weights optimized:")
-        for conf, weight in self.data["confirmation_weights"].items():
+        for conf, weight in weights.items():
             logger.info(f"  {conf}: {weight:.2f}")
-        self.save_data()
+        if save:
+            self.save_data()
+        return True
 
-    def optimize_fvg_threshold(self):
-        """Find optimal FVG size threshold."""
+    def optimize_fvg_threshold(self, save: bool = True) -> bool:
+        """Find optimal FVG size threshold. Returns True if it was updated."""
         recent_trades = self.data["trades"][-100:]
 
         if len(recent_trades) < 30:
@@ -370,7 +519,7 @@ class AILearningEngine:
                 f"[AI] FVG threshold optimization skipped — "
                 f"{len(recent_trades)}/30 trades required"
             )
-            return
+            return False
 
         winning_fvg = [
             t["fvg_size"] for t in recent_trades
@@ -378,10 +527,15 @@ class AILearningEngine:
         ]
 
         if len(winning_fvg) > 10:
-            optimal_fvg = np.median(winning_fvg)
-            self.data["fvg_size_optimal"] = round(optimal_fvg, 4)
+            optimal_fvg = round(float(np.median(winning_fvg)), 4)
+            if self.data.get("fvg_size_optimal") == optimal_fvg:
+                return False   # PERF-AIL-9: unchanged — skip the save
+            self.data["fvg_size_optimal"] = optimal_fvg
             logger.info(f"[AI] Optimal FVG size updated: {optimal_fvg:.4f}")
-            self.save_data()
+            if save:
+                self.save_data()
+            return True
+        return False
 
     def get_ticker_confidence_multiplier(self, ticker: str) -> float:
         """
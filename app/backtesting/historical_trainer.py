@@ -67,6 +67,16 @@ Bug fixes applied
   signals silently. outcome_binary was correct. Fix: use local `outcome`.
 * BUG-HT-3 (Apr 2026): summary() TIMEOUT count check now always returns
   0 after BUG-HT-2 fix — becomes a useful zero-assertion guard.
+
+Performance
+-----------
+* PERF-HT-1 (Oct 18 2026): _eodhd_intraday() called _is_market_hours() per
+  bar, i.e. one strptime per bar across a multi-month 5m history. The
+  market-hours flags are now computed for the whole response in one
+  pandas pass (_market_hours_mask). Only zero-padded stamps take the
+  pandas path; anything else (e.g. '2026-08-18 1:49:27', which strptime
+  accepts) falls back to _is_market_hours(), so the flags are the same as
+  the per-bar loop — unparseable strings are still kept.
 """
 from __future__ import annotations
 
@@ -152,6 +162,29 @@ def _is_market_hours(dt_str: str) -> bool:
         return True
 
 
+def _market_hours_mask(dt_strs: List) -> List[bool]:
+    """
+    PERF-HT-1: vectorized _is_market_hours() over a whole bar list.
+    Zero-padded 'YYYY-MM-DD HH:MM:SS' stamps (what EODHD sends) are parsed
+    in one pandas pass; any other string (unpadded fields, offsets, extra
+    whitespace) goes through the scalar version, so results match it
+    exactly. Non-strings and unparseable strings map to True.
+    """
+    if not _PANDAS_OK:
+        return [_is_market_hours(s) for s in dt_strs]
+    raw     = pd.Series([s if isinstance(s, str) else None for s in dt_strs], dtype=object)
+    cleaned = raw.str.replace('T', ' ', regex=False).str.split('.').str[0]
+    canon   = cleaned.str.fullmatch(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}').fillna(False).astype(bool)
+    dts     = pd.to_datetime(cleaned.where(canon), format='%Y-%m-%d %H:%M:%S', errors='coerce')
+    mins    = dts.dt.hour * 60 + dts.dt.minute
+    open_mins  = MARKET_OPEN_UTC_H  * 60 + MARKET_OPEN_UTC_M
+    close_mins = MARKET_CLOSE_UTC_H * 60 + MARKET_CLOSE_UTC_M
+    mask = (dts.isna() | ((mins >= open_mins) & (mins < close_mins))).tolist()
+    for i in (raw.notna() & ~canon).to_numpy().nonzero()[0]:
+        mask[i] = _is_market_hours(raw.iat[i])
+    return mask
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers — EODHD data fetching
 # ─────────────────────────────────────────────────────────────────────────────
@@ -185,9 +218,10 @@ def _eodhd_intraday(
             return []
 
         bars, skipped_hours, skipped_vol = [], 0, 0
-        for b in raw:
-            dt_str = b.get('datetime') or b.get('date', '')
-            if not _is_market_hours(dt_str):
+        dt_strs = [b.get('datetime') or b.get('date', '') for b in raw]
+        in_hours = _market_hours_mask(dt_strs)   # PERF-HT-1
+        for b, dt_str, keep in zip(raw, dt_strs, in_hours):
+            if not keep:
                 skipped_hours += 1
                 continue
             o = _safe_float(b.get('open'))
@@ -33,6 +33,29 @@ FEATURE NT-BRIDGE (2026-04-08): NinjaTrader order flow bridge added.
   NT-4: Startup banner includes NTBridge status line.
   NT-5: process_nt_signal() wired into consumer thread (2026-04-08).
         Routes actionable signals: confidence gate → risk gate → options gate → Discord.
+
+PERF-SC-1 (2026-10-18): one clock read per scan tick.
+  The loop read now_et at the top of each iteration, then is_premarket(),
+  is_market_hours(), _is_or_window() and calculate_optimal_watchlist_size()
+  each built another tz-aware datetime.now(). They now take an optional
+  `now` and the loop passes its pinned now_et, so one tick sees one time
+  (no straddling 09:30 / 09:40 between checks). _ET is resolved once.
+
+PERF-SC-2 (2026-10-18): overlapped startup init.
+  start_scanner_loop() loads the AI learning engine and counts the parquet
+  cache on a two-worker startup pool while the main thread imports sniper
+  (which builds the DB-backed singletons). Boot waits for the slowest of
+  the three instead of their sum; banner output order is unchanged.
+
+PERF-SC-3 (2026-10-18): EMERGENCY_FALLBACK is a module-level tuple, so the
+  fallback ticker set is a shared constant that no caller can mutate.
+
+PERF-SC-4 (2026-10-18): warm HTTP sessions at boot.
+  The first scan cycle paid DNS + TCP + TLS setup on the shared EODHD
+  (data_manager) and Discord (discord_helpers) sessions. A daemon
+  "session-warmup" thread now sends one HEAD through each while the rest of
+  startup runs, so the pooled keep-alive connections are already open. Best
+  effort only — failures are logged at DEBUG and never block the scanner.
 """
 from app.core.health_server import start_health_server, health_heartbeat
 
@@ -80,6 +103,7 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
+_ET                    = ZoneInfo("America/New_York")
 REGIME_TICKERS         = ["SPY", "QQQ"]
 TICKER_TIMEOUT_SECONDS = 45
 _REDEPLOY_RETRIES      = 2
@@ -170,7 +194,9 @@ else:
     logger.info("[SCANNER] ⏭️  Options intelligence disabled (OPTIONS_INTELLIGENCE_ENABLED=false)")
 
 API_KEY            = os.getenv("EODHD_API_KEY", "")
-EMERGENCY_FALLBACK = ["SPY", "QQQ", "AAPL", "MSFT", "NVDA", "TSLA", "META", "AMD"]
+# PERF-SC-3: immutable — built once at import, copied with list() where a
+# caller needs a mutable watchlist, never mutated in place.
+EMERGENCY_FALLBACK = ("SPY", "QQQ", "AAPL", "MSFT", "NVDA", "TSLA", "META", "AMD")
 
 
 def _fire_and_forget(fn, label: str):
@@ -190,7 +216,7 @@ def _get_stale_tickers(tickers: list) -> list:
     try:
         from app.data.candle_cache import candle_cache
         from datetime import timedelta
-        cutoff = datetime.now(ZoneInfo("America/New_York")) - timedelta(hours=24)
+        cutoff = datetime.now(_ET) - timedelta(hours=24)
         for ticker in tickers:
             bars = candle_cache.get_bars(ticker, limit=1) if hasattr(candle_cache, 'get_bars') else []
             if not bars:
@@ -211,16 +237,16 @@ last_data_summary_time = time.time()
 
 
 def _now_et():
-    return datetime.now(ZoneInfo("America/New_York"))
+    return datetime.now(_ET)
 
 
-def is_premarket():
-    now = _now_et().time()
+def is_premarket(now: datetime = None):
+    now = (now or _now_et()).time()
     return dtime(4, 0) <= now < dtime(9, 30)
 
 
-def is_market_hours():
-    now = _now_et()
+def is_market_hours(now: datetime = None):
+    now = now or _now_et()
     if now.weekday() >= 5:
         return False
     return config.MARKET_OPEN <= now.time() <= config.MARKET_CLOSE
@@ -228,7 +254,7 @@ def is_market_hours():
 
 def get_adaptive_scan_interval() -> int:
     global _last_logged_interval
-    now = datetime.now(ZoneInfo("America/New_York")).time()
+    now = _now_et().time()
     if   dtime(9, 30)  <= now < dtime(9, 40):  interval, label = 5,   "OR Formation (BOS build)"
     elif dtime(9, 40)  <= now < dtime(11, 0):  interval, label = 45,  "Post-OR Morning"
     elif dtime(11, 0)  <= now < dtime(14, 0):  interval, label = 180, "Midday Chop"
@@ -241,9 +267,9 @@ def get_adaptive_scan_interval() -> int:
     return interval
 
 
-def calculate_optimal_watchlist_size() -> int:
+def calculate_optimal_watchlist_size(now: datetime = None) -> int:
     global _last_logged_watchlist_size
-    now = datetime.now(ZoneInfo("America/New_York")).time()
+    now = (now or _now_et()).time()
     if   dtime(9, 30)  <= now < dtime(9, 40):  size = 30
     elif dtime(9, 40)  <= now < dtime(10, 30): size = 30
     elif dtime(10, 30) <= now < dtime(15, 0):  size = 50
@@ -255,8 +281,8 @@ def calculate_optimal_watchlist_size() -> int:
     return size
 
 
-def _is_or_window():
-    now = _now_et().time()
+def _is_or_window(now: datetime = None):
+    now = (now or _now_et()).time()
     return dtime(9, 30) <= now < dtime(9, 40)
 
 
@@ -357,30 +383,60 @@ def _start_nt_signal_consumer(bridge):
     return t
 
 
+def _load_ai_learning():
+    """Import the AI learning singleton (DB table + state load); None if unavailable."""
+    try:
+        from app.ai.ai_learning import learning_engine
+        return learning_engine
+    except ImportError:
+        return None
+
+
+def _count_cache_files() -> int:
+    cache_dir = os.path.join(os.getcwd(), 'cache')
+    os.makedirs(cache_dir, exist_ok=True)
+    return sum(1 for f in os.listdir(cache_dir) if f.endswith('.parquet'))
+
+
+def _warm_http_sessions():
+    """PERF-SC-4: open the shared EODHD / Discord keep-alive connections early."""
+    import app.data.data_manager as _dm_mod
+    import app.notifications.discord_helpers as _dh_mod
+    for session, url in ((_dm_mod._session, "https://eodhd.com/"),
+                         (_dh_mod._session, "https://discord.com/api/v10/gateway")):
+        try:
+            session.head(url, timeout=5)
+        except Exception as e:
+            logger.debug("[SCANNER] Session warm-up failed for %s: %s", url, e)
+
+
 def start_scanner_loop():
     global _nt_bridge_ref
     validate_required_env_vars()
 
-    from app.core.sniper import process_ticker, clear_armed_signals, clear_watching_signals, clear_bos_alerts
-    logger.info("[SCANNER] ✅ process_ticker loaded from sniper.py (CFW6 engine active)")
+    threading.Thread(target=_warm_http_sessions, daemon=True,
+                     name="session-warmup").start()   # PERF-SC-4
 
-    from app.notifications.discord_helpers import send_simple_message
+    # PERF-SC-2: the AI learning load and the cache-dir scan are independent
+    # of the sniper import chain — run them alongside it instead of after it.
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="startup") as startup_pool:
+        ai_future    = startup_pool.submit(_load_ai_learning)
+        cache_future = startup_pool.submit(_count_cache_files)
 
-    try:
-        from app.ai.ai_learning import learning_engine
-        HAS_AI_LEARNING = True
-    except ImportError:
-        learning_engine = None
-        HAS_AI_LEARNING = False
+        from app.core.sniper import process_ticker, clear_armed_signals, clear_watching_signals, clear_bos_alerts
+        logger.info("[SCANNER] ✅ process_ticker loaded from sniper.py (CFW6 engine active)")
+
+        from app.notifications.discord_helpers import send_simple_message
+
+        learning_engine = ai_future.result()
+        HAS_AI_LEARNING = learning_engine is not None
 
     logger.info("=" * 60)
     logger.info("WAR MACHINE CFW6 SCANNER v1.39 - STARTUP")
     logger.info("=" * 60)
 
     try:
-        cache_dir   = os.path.join(os.getcwd(), 'cache')
-        os.makedirs(cache_dir, exist_ok=True)
-        cache_files = len([f for f in os.listdir(cache_dir) if f.endswith('.parquet')])
+        cache_files = cache_future.result()
         logger.info(f"✓ CACHE          {cache_files} cached ticker files (30d history)")
     except Exception as e:
         logger.info(f"? CACHE          Status unknown: {e}")
@@ -542,7 +598,7 @@ def start_scanner_loop():
             current_time_str = now_et.strftime('%I:%M:%S %p ET')
             current_day      = now_et.strftime('%Y-%m-%d')
 
-            if is_premarket():
+            if is_premarket(now_et):   # PERF-SC-1: pinned per tick
                 _or_window_logged      = False
                 _watchlist_lock_logged = False
                 if not premarket_built:
@@ -602,8 +658,8 @@ def start_scanner_loop():
                     time.sleep(60)
                 continue
 
-            elif is_market_hours():
-                if _is_or_window():
+            elif is_market_hours(now_et):
+                if _is_or_window(now_et):
                     if not _or_window_logged:
                         logger.info(
                             f"[SCANNER] 📊 OR WINDOW — BOS+FVG building (9:30-9:40) "
@@ -645,7 +701,7 @@ def start_scanner_loop():
                     logger.error(f"[WATCHLIST] Error: {e}")
                     watchlist = premarket_watchlist if premarket_watchlist else list(EMERGENCY_FALLBACK)
 
-                optimal_size = calculate_optimal_watchlist_size()
+                optimal_size = calculate_optimal_watchlist_size(now_et)
                 watchlist    = watchlist[:optimal_size]
 
                 current_set = set(watchlist)
@@ -719,8 +775,7 @@ def start_scanner_loop():
 
                     if HAS_AI_LEARNING:
                         try:
-                            learning_engine.optimize_confirmation_weights()
-                            learning_engine.optimize_fvg_threshold()
+                            learning_engine.optimize_eod()   # PERF-AIL-3: one save
                             logger.info(learning_engine.generate_performance_report())
                         except Exception as e:
                             logger.error(f"[AI] Optimization error: {e}")
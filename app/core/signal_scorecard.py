@@ -148,10 +148,10 @@ def _score_ivr(options_rec: Optional[dict]) -> float:
 def _score_gex(options_rec: Optional[dict]) -> float:
     if not options_rec:
         return 10.0  # Phase 1.38c: raised from 8 — missing data != bad signal
-    gex_data = options_rec.get("gex_data", {})
-    if not gex_data or not gex_data.get("has_data"):
+    gex_data = options_rec.get("gex_data")
+    if not gex_data or not gex_data.has_data:
         return 10.0  # Phase 1.38c: raised from 8
-    return 15.0 if gex_data.get("neg_gex_zone") else 8.0
+    return 15.0 if gex_data.neg_gex_zone else 8.0
 
 
 def _score_mtf_trend(mtf_trend_boost: float) -> float:
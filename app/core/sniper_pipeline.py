@@ -111,6 +111,13 @@ FIX HISTORY (2026-03-26, session 1 / Issue #1):
   FIX 1-6: arm_ticker() TypeError — all 13 required args now supplied.
   compute_stop_and_targets() called before arm_ticker() to derive stop/targets.
   See CHANGELOG.md 2026-03-26 for full detail.
+
+PERF-SP-1 (2026-10-18): SMC / liquidity-sweep / order-block enrichment
+  helpers are imported once at module load instead of re-running three
+  `from ... import` statements on every signal that reaches step 11. The
+  guard catches ImportError only: a missing helper is logged once and its
+  step falls back to a neutral result (None / False). None of the three
+  names exist in app.filters yet, so steps 11a-11c are currently off.
 """
 from __future__ import annotations
 import logging
@@ -134,6 +141,24 @@ from app.filters.gex_pin_gate import is_in_gex_pin_zone
 logger = logging.getLogger(__name__)
 _ET = ZoneInfo("America/New_York")
 
+# PERF-SP-1: optional step-11 enrichment, resolved once at import. Only a
+# missing helper is tolerated (logged once); any other import error raises.
+try:
+    from app.filters.sd_zone_confluence import get_smc_delta
+except ImportError:
+    logger.info("[PIPELINE] get_smc_delta not available — SMC enrichment (11a) off")
+    def get_smc_delta(ticker, direction): return None
+try:
+    from app.filters.liquidity_sweep import has_sweep
+except ImportError:
+    logger.info("[PIPELINE] has_sweep not available — liquidity sweep (11b) off")
+    def has_sweep(ticker, bars, direction): return False
+try:
+    from app.filters.order_block_cache import has_ob_retest
+except ImportError:
+    logger.info("[PIPELINE] has_ob_retest not available — order block retest (11c) off")
+    def has_ob_retest(ticker, bars, direction): return False
+
 
 def _run_signal_pipeline(
     ticker, direction, zone_low, zone_high,
@@ -275,25 +300,13 @@ def _run_signal_pipeline(
             logger.warning(f"[{ticker}] MTF bias check skipped (non-fatal): {_mtf_err}")
 
     # -- 11a. SMC enrichment --------------------------------------------------
-    try:
-        from app.filters.sd_zone_confluence import get_smc_delta
-        smc_delta = get_smc_delta(ticker, direction)
-    except Exception:
-        smc_delta = None
+    smc_delta = get_smc_delta(ticker, direction)
 
     # -- 11b. Liquidity sweep -------------------------------------------------
-    try:
-        from app.filters.liquidity_sweep import has_sweep
-        sweep_detected = has_sweep(ticker, bars_session, direction)
-    except Exception:
-        sweep_detected = False
+    sweep_detected = has_sweep(ticker, bars_session, direction)
 
     # -- 11c. Order block retest ----------------------------------------------
-    try:
-        from app.filters.order_block_cache import has_ob_retest
-        ob_detected = has_ob_retest(ticker, bars_session, direction)
-    except Exception:
-        ob_detected = False
+    ob_detected = has_ob_retest(ticker, bars_session, direction)
 
     # -- 12. SignalScorecard --------------------------------------------------
     # BUG-SP-2: confidence_base from CFW6 now passed in — no longer discarded
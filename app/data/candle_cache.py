@@ -36,7 +36,7 @@ from collections import defaultdict
 
 from utils import config
 from app.data import db_connection
-from app.data.db_connection import get_conn, return_conn, ph, dict_cursor
+from app.data.db_connection import get_conn, return_conn, ph, dict_cursor, execute_many
 import logging
 logger = logging.getLogger(__name__)
 
@@ -146,7 +146,8 @@ class CandleCache:
                 f"   close=EXCLUDED.close, volume=EXCLUDED.volume,"
                 f"   updated_at=CURRENT_TIMESTAMP"
             )
-            cursor.executemany(
+            execute_many(   # PERF-DBC-1: batched on Postgres
+                cursor,
                 upsert_sql,
                 [(ticker, timeframe, b["datetime"], b["open"], b["high"],
                   b["low"], b["close"], b["volume"]) for b in bars]
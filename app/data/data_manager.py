@@ -81,18 +81,175 @@ DATA-3 AUDIT (MAR 31, 2026):
     deleting 4-5 extra hours of valid bars.
   - BUG-DM-2: bulk_fetch_live_snapshots() WS/API counts now tracked explicitly
     instead of deriving WS count from the final mixed result dict.
+
+PERF-DM-1 (Oct 18 2026): MONTHLY PARTITIONING FOR intraday_bars (Postgres)
+  - With PARTITION_INTRADAY_BARS=true, a fresh Postgres DB creates
+    intraday_bars PARTITION BY RANGE (datetime) with one partition per month.
+    Recent-range queries prune to the hot partition(s) instead of walking one
+    ever-growing B-tree.
+  - _ensure_bar_partitions() pre-creates partitions from
+    BARS_PARTITION_MONTHS_BACK months ago through next month; it runs at
+    startup and from the daily cleanup_old_bars() pass.
+  - Existing non-partitioned tables are left as-is (no automatic migration);
+    SQLite is unaffected.
+  - An intraday_bars_default DEFAULT partition catches rows outside the
+    monthly window (historical loads, 60-day cache warmups), so an old bar
+    can never abort an upsert with "no partition of relation found".
+  - cleanup_old_bars() drops monthly partitions that lie wholly before the
+    cutoff (DROP TABLE instead of a row-by-row DELETE); the DELETE only
+    trims the boundary month and the default partition.
+
+PERF-DM-2 (Oct 18 2026): TUPLE ROWS FOR BAR READS
+  - get_today_session_bars / get_today_5m_bars / get_latest_bar /
+    get_bars_from_memory use a plain cursor and _parse_bar_rows() unpacks
+    the tuples directly. The per-value float()/int() casts are gone: the
+    columns are REAL/INTEGER, so psycopg2 and sqlite3 already return
+    float/int (no Decimal involved).
+
+PERF-DM-3 (Oct 18 2026): BATCHED BAR UPSERTS
+  - store_bars() and materialize_5m_bars() write through
+    db_connection.execute_many(), which pages rows through psycopg2's
+    execute_batch on Postgres instead of one round trip per bar.
+
+PERF-DM-4 (Oct 18 2026): STORE_BARS INPUT CHECK + NARROW RETRY
+  - store_bars() drops bars missing datetime/OHLC in one pass up front
+    (previously a single malformed bar raised KeyError inside the retry
+    loop, costing three attempts and two 1 s sleeps before giving up).
+  - Bad-input errors (TypeError/ValueError/AttributeError, e.g. a
+    non-datetime timestamp) are logged once and return 0 instead of being
+    retried; database and pool errors keep the 3-attempt retry.
+
+PERF-DM-5 (Oct 18 2026): CLUSTERED BAR TABLES ON SQLITE
+  - On SQLite, intraday_bars / intraday_bars_5m are WITHOUT ROWID tables
+    keyed by PRIMARY KEY(ticker, datetime). The rowid layout kept three
+    B-trees per table (rowid table, the UNIQUE autoindex and
+    idx_ticker_datetime*), all touched by every INSERT OR REPLACE; now the
+    rows live in key order in one B-tree that also serves the
+    ticker/datetime range reads (scanned backwards for DESC).
+  - Existing rowid tables are rebuilt once at startup
+    (_migrate_sqlite_bars_table). The surrogate id column is dropped on
+    SQLite; nothing reads it. Postgres schema is unchanged.
+
+PERF-DM-6 (Oct 18 2026): DATETIME INDEX FOR RETENTION DELETES
+  - cleanup_old_bars() deletes by `datetime < cutoff` alone, which the
+    (ticker, datetime) key cannot serve, so each daily run scanned both
+    bar tables in full. Both tables now carry an idx_*_datetime index so
+    the DELETE is an index range scan. The update_ticker() last-bar probe
+    already reads fetch_metadata by primary key and needs no new index.
+
+PERF-DM-7 (Oct 18 2026): SKIP ALREADY-STORED BARS IN update_ticker()
+  - The "yesterday's bars" window is a whole session, so a ticker whose
+    last stored bar is from yesterday re-upserted every bar it already had.
+    update_ticker() now drops fetched bars before the
+    fetch_metadata.last_bar_time it already read, and skips store_bars()
+    and the 5m rebuild entirely when nothing came back. The bar at
+    last_bar_time itself is kept, so a partial bar the WebSocket stored
+    there is overwritten by the complete REST bar.
+
+PERF-DM-8 (Oct 18 2026): RANGE CHECK FOR TODAY'S REST BACKFILL
+  - startup_intraday_backfill_today() kept today's bars with a per-bar
+    `b["datetime"].date() == today_et`, which allocates a date object per
+    bar per ticker. The bars are already ET-naive datetimes, so the filter
+    is now a plain comparison against precomputed [today 00:00, tomorrow
+    00:00) bounds.
+
+PERF-DM-9 (Oct 18 2026): SHARED EODHD SESSION
+  - Every EODHD call (intraday, eod, real-time snapshot, VIX) used a bare
+    requests.get(), opening a fresh TCP+TLS connection to eodhd.com per
+    ticker. They now share a module-level keep-alive requests.Session with
+    a small urllib3 retry on 429/5xx for idempotent GETs. requests already
+    sends Accept-Encoding: gzip, deflate by default.
+
+PERF-DM-10 (Oct 18 2026): CONCURRENT STARTUP FETCHES
+  - startup_backfill_today() and startup_intraday_backfill_today() fetched
+    one ticker at a time, so startup paid one EODHD round trip per ticker
+    back to back. The HTTP fetches now run on FETCH_WORKERS threads
+    (_fetch_many); store_bars()/materialize_5m_bars() stay on the calling
+    thread in ticker order, so DB writes are unchanged and need no lock.
+    At most 2 x FETCH_WORKERS fetched results are held in memory at once.
+
+PERF-DM-11 (Oct 18 2026): ORJSON FOR EODHD RESPONSES
+  - EODHD bodies are decoded with orjson.loads(response.content) via
+    _json_body() instead of response.json() (stdlib json). A 30-day 1m
+    backfill is ~29k bar objects per ticker, so this is the bulk of the
+    parse cost. Falls back to response.json() if orjson is not installed.
+
+PERF-DM-12 (Oct 18 2026): ITEMGETTER FIELD ACCESS IN BAR LOOPS
+  - _fetch_range() rebuilt its required-keys list and probed each key twice
+    per bar; store_bars() made five b.get() calls per bar. Both now pull
+    all fields in one operator.itemgetter call (a single C-level call
+    returning a tuple). A missing key raises KeyError and drops to the
+    original per-key check, so malformed bars are still skipped and
+    logged exactly as before.
+
+PERF-DM-13 (Oct 18 2026): ONE TRANSACTION PER WEBSOCKET FLUSH
+  - ws_feed flushed closed and open bars with one store_bars() call per
+    ticker, i.e. one checkout, two statements and one commit per ticker
+    every FLUSH_INTERVAL. store_bars_batch() validates every ticker's bars
+    up front and writes all bar rows and fetch_metadata rows with two
+    execute_many() calls and a single commit. store_bars() shares the
+    same writer (_write_bar_rows), so retry and rollback behaviour is
+    unchanged. If the batched write fails, each ticker is retried on its
+    own, so one bad ticker (bad input, DataError, missing partition) still
+    loses only its own bars — closed bars are not rewritten by later flushes.
+
+PERF-DM-14 (Oct 18 2026): SINGLE PASS IN get_bars_from_memory()
+  - The newest-N read already walks the (ticker, datetime) key backwards
+    (PERF-DM-5 on SQLite, the DESC index on Postgres), so no new index is
+    needed. The parsed list was then copied again by list(reversed(...));
+    _parse_bar_rows() now consumes reversed(rows) directly and its output
+    is returned as-is.
+
+PERF-DM-16 (Oct 18 2026): MEMOIZED PREVIOUS-DAY OHLC
+  - get_previous_day_ohlc() hit the EODHD /eod/ endpoint (up to five calls
+    across a weekend/holiday) every time the PDH/PDL confirmation layer ran,
+    although the answer cannot change during a session. Results are now
+    cached per (ticker, as_of_date), so backtest folds still get their own
+    prior day. Misses (None) are not cached and retry on the next call.
+    clear_prev_day_cache() — already called by the scanner's daily reset —
+    empties it again.
+
+PERF-DM-17 (Oct 18 2026): STRUCTURED-ARRAY BARS
+  - get_bars_array() returns the newest N intraday bars (oldest first) in
+    one numpy record array (BAR_DTYPE: datetime64[s] + five float64
+    columns) with a single np.fromiter pass — one contiguous buffer instead
+    of six boxed objects per bar, and arr.close / arr.volume are ready for
+    vectorised math with no per-call conversion. correlation returns and
+    vwap_calculator.bars_to_soa() consume it directly. Rows are
+    normalised by _iter_bar_rows() (naive datetimes, as _parse_bar_rows()).
+
+PERF-DM-18 (Oct 18 2026): ONE WARNING PER FETCH IN _fetch_range()
+  - The EODHD bar parser nested a KeyError try inside a per-bar try and
+    logged (plus built a missing-field list for) every malformed bar, so a
+    gappy backfill spent most of its parse time formatting log lines. Each
+    bar is now one itemgetter + cast block; rejects are counted and reported
+    in a single warning that names the missing fields of the first one.
+    Accepted bars are unchanged. The bar writer already validates without
+    exceptions (PERF-DM-4 _bar_rows).
 """
 import time
 import os
 import requests
-from collections import defaultdict
+import numpy as np
+from collections import deque, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from datetime import datetime, timedelta, time as dtime, date as date_type
 from zoneinfo import ZoneInfo
 from typing import List, Dict, Optional
+
+# PERF-DM-11: orjson for EODHD response bodies (stdlib json fallback if not installed)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from utils import config
+from utils.http import make_session
 from app.data import db_connection
 from app.data.db_connection import (
-    get_conn, return_conn, ph, dict_cursor, serial_pk,
+    get_conn, return_conn, ph, dict_cursor, serial_pk, execute_many,
     upsert_bar_sql, upsert_bar_5m_sql, upsert_metadata_sql
 )
 
@@ -100,6 +257,44 @@ ET = ZoneInfo("America/New_York")
 
 _logged_skip = set()  # Track tickers we've logged skip messages for
 
+# PERF-DM-12: one C call per bar instead of a key probe per field
+_EODHD_BAR_KEYS   = ("timestamp", "open", "high", "low", "close", "volume")
+_eodhd_bar_fields = itemgetter(*_EODHD_BAR_KEYS)
+_store_bar_fields = itemgetter("datetime", "open", "high", "low", "close")
+
+# PERF-DM-17: record layout for get_bars_array()
+BAR_DTYPE = np.dtype([
+    ("datetime", "M8[s]"),
+    ("open",     "f8"),
+    ("high",     "f8"),
+    ("low",      "f8"),
+    ("close",    "f8"),
+    ("volume",   "f8"),
+])
+
+
+def _iter_bar_rows(rows):
+    """Yield (datetime, o, h, l, c, v) rows with a naive datetime (PERF-DM-17)."""
+    for dt, o, h, l, c, v in rows:
+        if isinstance(dt, str):
+            dt = datetime.fromisoformat(dt)
+        if dt.tzinfo is not None:
+            dt = dt.replace(tzinfo=None)
+        yield dt, o, h, l, c, v
+
+# PERF-DM-10: concurrent EODHD fetches during startup backfills
+FETCH_WORKERS = 8
+
+# PERF-DM-9: keep-alive connections to eodhd.com shared by all fetch paths
+_session = make_session(pool_maxsize=FETCH_WORKERS, retries=2, backoff_factor=0.5)
+
+
+def _json_body(response):
+    """Decode an EODHD response body — orjson when available (PERF-DM-11)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 def _to_aware_et(dt: datetime) -> datetime:
     """
@@ -118,6 +313,7 @@ class DataManager:
     def __init__(self, db_path: str = "market_memory.db"):
         self.db_path = db_path
         self.api_key = config.EODHD_API_KEY
+        self._prev_day_cache: Dict[tuple, Dict] = {}   # PERF-DM-16: (ticker, date) -> OHLC
         self.initialize_database()
 
     # =============================================================
@@ -170,44 +366,14 @@ class DataManager:
             cursor = conn.cursor()
 
             # 1m bars — primary store
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS intraday_bars (
-                    id          {serial_pk()},
-                    ticker      TEXT      NOT NULL,
-                    datetime    TIMESTAMP NOT NULL,
-                    open        REAL      NOT NULL,
-                    high        REAL      NOT NULL,
-                    low         REAL      NOT NULL,
-                    close       REAL      NOT NULL,
-                    volume      INTEGER   NOT NULL,
-                    created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(ticker, datetime)
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_ticker_datetime
-                ON intraday_bars(ticker, datetime DESC)
-            """)
+            # PERF-DM-1: optional monthly RANGE partitioning on Postgres
+            partitioned = self._create_partitioned_bars_table(cursor)
+            self._create_bars_table(cursor, "intraday_bars", "idx_ticker_datetime")
+            if partitioned or self._bars_table_is_partitioned(cursor):
+                self._ensure_bar_partitions(cursor)
 
             # Materialized 5m bars
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS intraday_bars_5m (
-                    id          {serial_pk()},
-                    ticker      TEXT      NOT NULL,
-                    datetime    TIMESTAMP NOT NULL,
-                    open        REAL      NOT NULL,
-                    high        REAL      NOT NULL,
-                    low         REAL      NOT NULL,
-                    close       REAL      NOT NULL,
-                    volume      INTEGER   NOT NULL,
-                    created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(ticker, datetime)
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_ticker_datetime_5m
-                ON intraday_bars_5m(ticker, datetime DESC)
-            """)
+            self._create_bars_table(cursor, "intraday_bars_5m", "idx_ticker_datetime_5m")
 
             # Fetch state
             cursor.execute("""
@@ -256,6 +422,193 @@ class DataManager:
             if conn:
                 return_conn(conn)
 
+    # =============================================================
+    # BAR TABLE LAYOUT (PERF-DM-5)
+    # =============================================================
+
+    _BAR_COLUMNS = "ticker, datetime, open, high, low, close, volume, created_at"
+
+    def _create_bars_table(self, cursor, table: str, index_name: str):
+        """
+        Create a 1m/5m bar table. Postgres keeps the serial id + UNIQUE +
+        DESC index layout; SQLite gets a WITHOUT ROWID table clustered on
+        (ticker, datetime), which makes the extra index redundant. Both get
+        a datetime-only index for cleanup_old_bars() (PERF-DM-6).
+        """
+        if db_connection.USE_POSTGRES:
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id          {serial_pk()},
+                    ticker      TEXT      NOT NULL,
+                    datetime    TIMESTAMP NOT NULL,
+                    open        REAL      NOT NULL,
+                    high        REAL      NOT NULL,
+                    low         REAL      NOT NULL,
+                    close       REAL      NOT NULL,
+                    volume      INTEGER   NOT NULL,
+                    created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(ticker, datetime)
+                )
+            """)
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS {index_name}
+                ON {table}(ticker, datetime DESC)
+            """)
+        else:
+            self._migrate_sqlite_bars_table(cursor, table)
+            cursor.execute(self._sqlite_bars_ddl(table))
+
+        # PERF-DM-6: cross-ticker `datetime < cutoff` range for retention deletes
+        cursor.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_{table}_datetime
+            ON {table}(datetime)
+        """)
+
+    @staticmethod
+    def _sqlite_bars_ddl(table: str) -> str:
+        return f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                ticker      TEXT      NOT NULL,
+                datetime    TIMESTAMP NOT NULL,
+                open        REAL      NOT NULL,
+                high        REAL      NOT NULL,
+                low         REAL      NOT NULL,
+                close       REAL      NOT NULL,
+                volume      INTEGER   NOT NULL,
+                created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (ticker, datetime)
+            ) WITHOUT ROWID
+        """
+
+    def _migrate_sqlite_bars_table(self, cursor, table: str):
+        """One-time rebuild of a rowid-layout SQLite bar table (PERF-DM-5)."""
+        cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        )
+        row = cursor.fetchone()
+        if row is None or "WITHOUT ROWID" in (row[0] or "").upper():
+            return
+
+        old = f"{table}_rowid_old"
+        logger.info(f"[DATA] Rebuilding {table} as WITHOUT ROWID (one-time)")
+        cursor.execute("SAVEPOINT bars_rebuild")   # all-or-nothing
+        cursor.execute(f"DROP TABLE IF EXISTS {old}")
+        # Indexes follow the renamed table and are dropped with it below
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {old}")
+        cursor.execute(self._sqlite_bars_ddl(table))
+        cursor.execute(
+            f"INSERT OR REPLACE INTO {table} ({self._BAR_COLUMNS}) "
+            f"SELECT {self._BAR_COLUMNS} FROM {old} ORDER BY ticker, datetime"
+        )
+        cursor.execute(f"DROP TABLE {old}")
+        cursor.execute("RELEASE bars_rebuild")
+
+    # =============================================================
+    # BAR PARTITIONING (PERF-DM-1, Postgres only)
+    # =============================================================
+
+    def _create_partitioned_bars_table(self, cursor) -> bool:
+        """
+        Create intraday_bars as a monthly RANGE-partitioned table when
+        PARTITION_INTRADAY_BARS is set and the table does not exist yet.
+
+        The UNIQUE(ticker, datetime) constraint includes the partition key, so
+        it is declared on the parent and every partition inherits it — the
+        ON CONFLICT (ticker, datetime) upsert keeps working unchanged.
+        Returns True if the partitioned table was created by this call.
+        """
+        if not (db_connection.USE_POSTGRES and config.PARTITION_INTRADAY_BARS):
+            return False
+        cursor.execute("SELECT to_regclass('intraday_bars')")
+        row = cursor.fetchone()
+        if row and row[0]:
+            return False
+        cursor.execute("""
+            CREATE TABLE intraday_bars (
+                id          BIGSERIAL,
+                ticker      TEXT      NOT NULL,
+                datetime    TIMESTAMP NOT NULL,
+                open        REAL      NOT NULL,
+                high        REAL      NOT NULL,
+                low         REAL      NOT NULL,
+                close       REAL      NOT NULL,
+                volume      INTEGER   NOT NULL,
+                created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(ticker, datetime)
+            ) PARTITION BY RANGE (datetime)
+        """)
+        logger.info("[DATA] Created intraday_bars as a monthly partitioned table")
+        return True
+
+    def _bars_table_is_partitioned(self, cursor) -> bool:
+        """True if intraday_bars is a Postgres partitioned table."""
+        if not db_connection.USE_POSTGRES:
+            return False
+        cursor.execute("""
+            SELECT 1 FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = 'intraday_bars'
+        """)
+        return cursor.fetchone() is not None
+
+    def _ensure_bar_partitions(self, cursor) -> None:
+        """
+        Create any missing monthly partitions from BARS_PARTITION_MONTHS_BACK
+        months ago through next month. Idempotent; called from
+        initialize_database() and the daily cleanup_old_bars() run so next
+        month's partition always exists before the first bar lands in it.
+        """
+        today = datetime.now(ET).date()
+        year, month = today.year, today.month - config.BARS_PARTITION_MONTHS_BACK
+        while month < 1:
+            year, month = year - 1, month + 12
+        for _ in range(config.BARS_PARTITION_MONTHS_BACK + 2):
+            nxt_year, nxt_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            # A month whose rows already sit in the default partition cannot
+            # be attached; skip it rather than abort the caller's transaction.
+            cursor.execute("SAVEPOINT bar_partition")
+            try:
+                cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS intraday_bars_{year:04d}_{month:02d}
+                    PARTITION OF intraday_bars
+                    FOR VALUES FROM ('{year:04d}-{month:02d}-01')
+                                 TO ('{nxt_year:04d}-{nxt_month:02d}-01')
+                """)
+                cursor.execute("RELEASE SAVEPOINT bar_partition")
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT bar_partition")
+                logger.warning(f"[DATA] Partition intraday_bars_{year:04d}_{month:02d} "
+                               f"not created: {e}")
+            year, month = nxt_year, nxt_month
+        # Rows outside the monthly window (old history loads) land here
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS intraday_bars_default "
+            "PARTITION OF intraday_bars DEFAULT"
+        )
+
+    def _drop_expired_bar_partitions(self, cursor, cutoff: datetime) -> int:
+        """
+        Drop monthly intraday_bars partitions that end on or before `cutoff`.
+        Returns the number of partitions dropped.
+        """
+        cursor.execute("""
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = 'intraday_bars'
+        """)
+        dropped = 0
+        for (name,) in cursor.fetchall():
+            parts = name.rsplit("_", 2)
+            if len(parts) != 3 or not (parts[1].isdigit() and parts[2].isdigit()):
+                continue   # intraday_bars_default
+            year, month = int(parts[1]), int(parts[2])
+            end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+            if end <= cutoff:
+                cursor.execute(f"DROP TABLE IF EXISTS {name}")
+                dropped += 1
+        return dropped
+
     # =============================================================
     # EODHD FETCH
     # =============================================================
@@ -275,38 +628,43 @@ class DataManager:
             "fmt":       "json"
         }
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = _session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = _json_body(response)
             if not data:
                 return []
 
+            # PERF-DM-18: one guarded block per bar, one summary warning per fetch
             bars = []
+            append = bars.append
+            skipped = 0
+            first_bad = None
             for bar in data:
                 try:
-                    required = ["timestamp", "open", "high", "low", "close", "volume"]
-                    missing = [k for k in required if k not in bar or bar[k] is None]
-
-                    if missing:
-                        logger.warning(f"[DATA] {ticker}: Skipping bar with missing fields: {missing}")
-                        continue
-
-                    dt_et = datetime.fromtimestamp(
-                        bar["timestamp"], tz=ET
-                    ).replace(tzinfo=None)
-
-                    bars.append({
-                        "datetime": dt_et,
-                        "open":     float(bar["open"]),
-                        "high":     float(bar["high"]),
-                        "low":      float(bar["low"]),
-                        "close":    float(bar["close"]),
-                        "volume":   int(bar["volume"])
+                    fields = _eodhd_bar_fields(bar)   # PERF-DM-12
+                    if None in fields:
+                        raise ValueError("null field")
+                    ts, o, h, l, c, v = fields
+                    append({
+                        "datetime": datetime.fromtimestamp(ts, tz=ET).replace(tzinfo=None),
+                        "open":     float(o),
+                        "high":     float(h),
+                        "low":      float(l),
+                        "close":    float(c),
+                        "volume":   int(v)
                     })
-                except (ValueError, TypeError, KeyError) as e:
-                    logger.warning(f"[DATA] Bar parse error for {ticker}: {e}")
-                    continue
-
+                except (ValueError, TypeError, KeyError, OverflowError, OSError):
+                    skipped += 1
+                    if first_bad is None:
+                        first_bad = bar
+
+            if skipped:
+                missing = ([k for k in _EODHD_BAR_KEYS if first_bad.get(k) is None]
+                           if isinstance(first_bad, dict) else [])
+                logger.warning(
+                    f"[DATA] {ticker}: skipped {skipped} malformed bar(s)"
+                    + (f" (missing fields: {missing})" if missing else "")
+                )
             return bars
 
         except requests.exceptions.HTTPError as e:
@@ -320,6 +678,28 @@ class DataManager:
     # STARTUP BACKFILL
     # =============================================================
 
+    def _fetch_many(self, tickers: List[str], from_ts: int, to_ts: int):
+        """
+        Yield (ticker, bars) in input order while up to FETCH_WORKERS
+        _fetch_range() calls run concurrently (PERF-DM-10).
+
+        Only the HTTP fetch runs on the pool; callers write to the DB on
+        their own thread. _fetch_range() never raises, so every ticker
+        yields a (possibly empty) list.
+        """
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS,
+                                thread_name_prefix="dm_fetch") as pool:
+            pending = deque()
+            for ticker in tickers:
+                pending.append((ticker, pool.submit(self._fetch_range, ticker, from_ts, to_ts)))
+                # Bound buffered results — a 30-day 1m fetch is ~29k bars
+                if len(pending) >= 2 * FETCH_WORKERS:
+                    t, fut = pending.popleft()
+                    yield t, fut.result()
+            while pending:
+                t, fut = pending.popleft()
+                yield t, fut.result()
+
     def startup_backfill_today(self, tickers: List[str]):
         """
         Fetch 30 days of historical bars (up to yesterday's close) for every ticker.
@@ -332,9 +712,9 @@ class DataManager:
         logger.info(f"[DATA] Startup backfill: {len(tickers)} tickers | "
                     f"30 days history -> yesterday (WebSocket handles today's bars)")
 
-        for idx, ticker in enumerate(tickers, 1):
+        fetched = self._fetch_many(tickers, from_ts, to_ts)   # PERF-DM-10
+        for idx, (ticker, bars) in enumerate(fetched, 1):
             try:
-                bars = self._fetch_range(ticker, from_ts, to_ts)
                 if bars:
                     self.store_bars(ticker, bars)
                     self.materialize_5m_bars(ticker)
@@ -357,15 +737,17 @@ class DataManager:
         from_dt  = datetime.combine(today_et, dtime(4, 0, 0))
         from_ts  = int(from_dt.replace(tzinfo=ET).timestamp())
         to_ts    = int(now_et.timestamp())
+        # PERF-DM-8: ET-naive bounds for today, compared directly per bar
+        day_start = datetime.combine(today_et, dtime(0, 0))
+        day_end   = day_start + timedelta(days=1)
 
         logger.info(f"[DATA] Today's REST backfill: {len(tickers)} tickers | "
                     f"04:00 ET -> {now_et.strftime('%H:%M ET')} (best-effort, WS is primary)")
 
         filled = 0
-        for ticker in tickers:
+        for ticker, bars in self._fetch_many(tickers, from_ts, to_ts):   # PERF-DM-10
             try:
-                bars = self._fetch_range(ticker, from_ts, to_ts)
-                bars = [b for b in bars if b["datetime"].date() == today_et]
+                bars = [b for b in bars if day_start <= b["datetime"] < day_end]
                 if bars:
                     self.store_bars(ticker, bars)
                     self.materialize_5m_bars(ticker)
@@ -561,9 +943,9 @@ class DataManager:
         from_ts = int((today_midnight - timedelta(days=days)).timestamp())
         to_ts = int((today_midnight - timedelta(seconds=1)).timestamp())
 
-        for idx, ticker in enumerate(tickers, 1):
+        fetched = self._fetch_many(tickers, from_ts, to_ts)   # PERF-DM-10
+        for idx, (ticker, bars) in enumerate(fetched, 1):
             try:
-                bars = self._fetch_range(ticker, from_ts, to_ts)
                 if bars:
                     candle_cache.cache_candles(ticker, '1m', bars)
                     logger.info(f"[CACHE] [{idx}/{len(tickers)}] {ticker}: {len(bars)} bars cached")
@@ -638,6 +1020,10 @@ class DataManager:
 
         logger.info(f"[DATA] {ticker} -> {label}")
         bars = self._fetch_range(ticker, from_ts, to_ts)
+        if bars and last_bar:
+            # PERF-DM-7: skip bars already stored; rewrite the boundary bar,
+            # which the WebSocket may have stored while still partial
+            bars = [b for b in bars if b["datetime"] >= last_bar]
 
         if bars:
             self.store_bars(ticker, bars)
@@ -649,34 +1035,47 @@ class DataManager:
     # STORAGE (FIX #4: GUARANTEED CONNECTION RETURN)
     # =============================================================
 
-    def store_bars(self, ticker: str, bars: List[Dict], quiet: bool = False) -> int:
+    def _bar_rows(self, ticker: str, bars: List[Dict]) -> List[tuple]:
+        """PERF-DM-4: validate once, no per-row exception handling."""
+        data = []
+        append = data.append
+        for b in bars:
+            try:
+                dt, o, h, l, c = _store_bar_fields(b)   # PERF-DM-12
+            except KeyError:
+                continue
+            if None in (dt, o, h, l, c):
+                continue
+            append((ticker, dt, o, h, l, c, b.get("volume") or 0))
+        if len(data) < len(bars):
+            logger.warning(f"[DATA] {ticker}: skipped {len(bars) - len(data)} malformed bar(s)")
+        return data
+
+    def _write_bar_rows(self, rows: List[tuple], meta: List[tuple], label: str) -> bool:
         """
-        Upsert 1m bars into intraday_bars and update fetch_metadata.
+        Write validated bar rows plus their fetch_metadata rows in one
+        transaction. Returns True once committed.
         FIX #4: Ensures connection is returned even on error.
         """
-        if not bars:
-            return 0
-
         max_retries = 3
         for attempt in range(max_retries):
             conn = None
             try:
                 conn = get_conn(self.db_path)
                 cursor = dict_cursor(conn)
-                data = [
-                    (ticker, b["datetime"], b["open"], b["high"],
-                     b["low"], b["close"], b["volume"])
-                    for b in bars
-                ]
-                cursor.executemany(upsert_bar_sql(), data)
-                latest_bar_dt = max(b["datetime"] for b in bars)
-                cursor.execute(upsert_metadata_sql(),
-                               (ticker, latest_bar_dt, len(bars)))
+                execute_many(cursor, upsert_bar_sql(), rows)   # PERF-DM-3
+                execute_many(cursor, upsert_metadata_sql(), meta)   # PERF-DM-13
                 conn.commit()
-                if not quiet:
-                    logger.info(f"[DATA] Stored {len(bars)} bars for {ticker} "
-                                f"(latest: {latest_bar_dt.strftime('%m/%d %H:%M')} ET)")
-                return len(bars)
+                return True
+            except (TypeError, ValueError, AttributeError) as e:
+                # PERF-DM-4: bad input, not a database failure — retrying cannot help
+                if conn:
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                logger.warning(f"[DATA] Store failed for {label}: {e}")
+                return False
             except Exception as e:
                 if conn:
                     try:
@@ -684,15 +1083,66 @@ class DataManager:
                     except Exception:
                         pass
                 logger.warning(f"[DATA] Store attempt {attempt+1}/{max_retries} "
-                               f"failed for {ticker}: {e}")
+                               f"failed for {label}: {e}")
                 if attempt < max_retries - 1:
                     time.sleep(1)
             finally:
                 if conn:
                     return_conn(conn)
 
-        logger.warning(f"[DATA] All {max_retries} store attempts failed for {ticker}")
-        return 0
+        logger.warning(f"[DATA] All {max_retries} store attempts failed for {label}")
+        return False
+
+    def store_bars(self, ticker: str, bars: List[Dict], quiet: bool = False) -> int:
+        """
+        Upsert 1m bars into intraday_bars and update fetch_metadata.
+        FIX #4: Ensures connection is returned even on error.
+        """
+        if not bars:
+            return 0
+
+        data = self._bar_rows(ticker, bars)
+        if not data:
+            return 0
+        latest_bar_dt = max(row[1] for row in data)
+
+        if not self._write_bar_rows(data, [(ticker, latest_bar_dt, len(data))], ticker):
+            return 0
+        if not quiet:
+            logger.info(f"[DATA] Stored {len(data)} bars for {ticker} "
+                        f"(latest: {latest_bar_dt.strftime('%m/%d %H:%M')} ET)")
+        return len(data)
+
+    def store_bars_batch(self, bars_by_ticker: Dict[str, List[Dict]]) -> Dict[str, int]:
+        """
+        PERF-DM-13: store_bars() for many tickers in one transaction.
+        Falls back to one transaction per ticker if the batch fails.
+        Returns {ticker: bars stored}; empty if nothing was written.
+        """
+        per_ticker: Dict[str, tuple] = {}
+        for ticker, bars in bars_by_ticker.items():
+            if not bars:
+                continue
+            data = self._bar_rows(ticker, bars)
+            if not data:
+                continue
+            per_ticker[ticker] = (data, (ticker, max(row[1] for row in data), len(data)))
+
+        if not per_ticker:
+            return {}
+        rows = [row for data, _ in per_ticker.values() for row in data]
+        meta = [m for _, m in per_ticker.values()]
+        if self._write_bar_rows(rows, meta, f"{len(per_ticker)} tickers"):
+            return {t: len(data) for t, (data, _) in per_ticker.items()}
+        if len(per_ticker) == 1:
+            return {}
+
+        # One ticker's failure must not cost the others their bars
+        counts: Dict[str, int] = {}
+        for ticker, (data, m) in per_ticker.items():
+            if self._write_bar_rows(data, [m], ticker):
+                counts[ticker] = len(data)
+        return counts
 
     def materialize_5m_bars(self, ticker: str):
         """
@@ -734,7 +1184,7 @@ class DataManager:
                  b["low"], b["close"], b["volume"])
                 for b in bars_5m
             ]
-            cursor.executemany(upsert_bar_5m_sql(), data)
+            execute_many(cursor, upsert_bar_5m_sql(), data)   # PERF-DM-3
             conn.commit()
         except Exception as e:
             logger.warning(f"[DATA] 5m materialization error for {ticker}: {e}")
@@ -752,20 +1202,25 @@ class DataManager:
     # =============================================================
 
     def _parse_bar_rows(self, rows) -> List[Dict]:
+        """
+        PERF-DM-2: rows are plain (datetime, open, high, low, close, volume)
+        tuples. The columns are REAL/INTEGER, so both drivers already hand
+        back float/int — only the datetime needs normalising.
+        """
         bars = []
-        for row in rows:
-            dt = row["datetime"]
+        append = bars.append
+        for dt, o, h, l, c, v in rows:
             if isinstance(dt, str):
                 dt = datetime.fromisoformat(dt)
-            if hasattr(dt, "tzinfo") and dt.tzinfo is not None:
+            if dt.tzinfo is not None:
                 dt = dt.replace(tzinfo=None)
-            bars.append({
+            append({
                 "datetime": dt,
-                "open":     float(row["open"]),
-                "high":     float(row["high"]),
-                "low":      float(row["low"]),
-                "close":    float(row["close"]),
-                "volume":   int(row["volume"])
+                "open":     o,
+                "high":     h,
+                "low":      l,
+                "close":    c,
+                "volume":   v,
             })
         return bars
 
@@ -783,7 +1238,7 @@ class DataManager:
         conn = None
         try:
             conn = get_conn(self.db_path)
-            cursor = dict_cursor(conn)
+            cursor = conn.cursor()   # PERF-DM-2: tuple rows
             cursor.execute(f"""
                 SELECT datetime, open, high, low, close, volume
                 FROM intraday_bars
@@ -811,7 +1266,7 @@ class DataManager:
         conn = None
         try:
             conn = get_conn(self.db_path)
-            cursor = dict_cursor(conn)
+            cursor = conn.cursor()   # PERF-DM-2: tuple rows
             cursor.execute(f"""
                 SELECT datetime, open, high, low, close, volume
                 FROM intraday_bars_5m
@@ -840,7 +1295,7 @@ class DataManager:
         conn = None
         try:
             conn = get_conn(self.db_path)
-            cursor = dict_cursor(conn)
+            cursor = conn.cursor()   # PERF-DM-2: tuple rows
             cursor.execute(f"""
                 SELECT datetime, open, high, low, close, volume
                 FROM intraday_bars
@@ -881,9 +1336,9 @@ class DataManager:
             "fmt": "json"
         }
         try:
-            response = requests.get(url, params=params, timeout=15)
+            response = _session.get(url, params=params, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = _json_body(response)
 
             if not data or len(data) == 0:
                 return None
@@ -913,10 +1368,16 @@ class DataManager:
         elif isinstance(as_of_date, datetime):
             as_of_date = as_of_date.date()
 
+        key = (ticker, as_of_date)
+        cached = self._prev_day_cache.get(key)   # PERF-DM-16
+        if cached is not None:
+            return cached
+
         for days_back in range(1, 6):
             target_date = as_of_date - timedelta(days=days_back)
             ohlc = self.get_daily_ohlc(ticker, target_date)
             if ohlc:
+                self._prev_day_cache[key] = ohlc
                 return ohlc
 
         return None
@@ -961,9 +1422,9 @@ class DataManager:
             params["s"] = extras
 
         try:
-            r = requests.get(url, params=params, timeout=15)
+            r = _session.get(url, params=params, timeout=15)
             r.raise_for_status()
-            data = r.json()
+            data = _json_body(r)
             if isinstance(data, dict):
                 data = [data]
 
@@ -995,11 +1456,8 @@ class DataManager:
     # =============================================================
 
     def clear_prev_day_cache(self) -> None:
-        """
-        DEPRECATED: signal_generator.py is deprecated. This cache clear is no longer needed
-        since sniper.py doesn't maintain a PDH/PDL cache that needs clearing.
-        """
-        pass
+        """Drop memoized previous-day OHLC (PERF-DM-16). Called on the daily reset."""
+        self._prev_day_cache.clear()
 
     # =============================================================
     # UTILITIES (FIX #4)
@@ -1016,12 +1474,21 @@ class DataManager:
         try:
             conn = get_conn(self.db_path)
             cursor = conn.cursor()
+            partitioned = self._bars_table_is_partitioned(cursor)
+            if partitioned:
+                # PERF-DM-1: whole expired months go with a DROP, not a DELETE
+                dropped = self._drop_expired_bar_partitions(cursor, cutoff)
+                if dropped:
+                    logger.info(f"[CLEANUP] Dropped {dropped} expired intraday_bars partition(s)")
             cursor.execute(
                 f"DELETE FROM intraday_bars WHERE datetime < {p}", (cutoff,)
             )
             cursor.execute(
                 f"DELETE FROM intraday_bars_5m WHERE datetime < {p}", (cutoff,)
             )
+            # PERF-DM-1: roll next month's partition forward ahead of time
+            if partitioned:
+                self._ensure_bar_partitions(cursor)
             conn.commit()
             logger.info(f"[CLEANUP] Removed bars older than {days_to_keep} days")
         finally:
@@ -1042,7 +1509,31 @@ class DataManager:
         conn = None
         try:
             conn = get_conn(self.db_path)
-            cursor = dict_cursor(conn)
+            cursor = conn.cursor()   # PERF-DM-2: tuple rows
+            cursor.execute(f"""
+                SELECT datetime, open, high, low, close, volume
+                FROM intraday_bars
+                WHERE ticker = {p}
+                ORDER BY datetime DESC
+                LIMIT {p}
+            """, (ticker, limit))
+            # PERF-DM-14: parse straight off the reversed rows — no second list
+            return self._parse_bar_rows(reversed(cursor.fetchall()))
+        finally:
+            if conn:
+                return_conn(conn)
+
+    def get_bars_array(self, ticker: str, limit: int = 390) -> np.recarray:
+        """
+        PERF-DM-17: N most recent bars (oldest first) as a BAR_DTYPE record
+        array — arr.close, arr.volume, ... are float64 columns.
+        FIX #4: Ensures connection is returned.
+        """
+        p = ph()
+        conn = None
+        try:
+            conn = get_conn(self.db_path)
+            cursor = conn.cursor()
             cursor.execute(f"""
                 SELECT datetime, open, high, low, close, volume
                 FROM intraday_bars
@@ -1051,7 +1542,9 @@ class DataManager:
                 LIMIT {p}
             """, (ticker, limit))
             rows = cursor.fetchall()
-            return list(reversed(self._parse_bar_rows(rows)))
+            return np.fromiter(
+                _iter_bar_rows(reversed(rows)), BAR_DTYPE, len(rows)
+            ).view(np.recarray)
         finally:
             if conn:
                 return_conn(conn)
@@ -1119,9 +1612,9 @@ class DataManager:
                 "fmt": "json"
             }
 
-            response = requests.get(url, params=params, timeout=5)
+            response = _session.get(url, params=params, timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_body(response)
                 return float(data.get("close", 0))
 
             return None
@@ -25,16 +25,31 @@ FIX (MAR 31, 2026) BUG-UOA-1:
   invocation. Fix: _cache_result() now stores .isoformat() string,
   consistent with check_whale_activity() which already stored
   result['timestamp'] as an ISO string.
+
+PERF-UOA-1 (Oct 18 2026):
+  - Dark-pool activity is a per-ticker quantity, but it was looked up once per
+    (ticker, direction) cache miss — twice per ticker in get_whale_alerts().
+    _check_dark_pool_activity() results are now memoized per ticker for
+    DARK_POOL_TTL_S in an LRU capped at UOA_CACHE_MAX entries.
+  - The whale-result cache is an LRU with the same cap (it grew without bound
+    over a session) and stores a monotonic timestamp, so a cache check no
+    longer parses an ISO string. result['timestamp'] is unchanged.
 """
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 import os
+import time
 import logging
 logger = logging.getLogger(__name__)
 
 ET = ZoneInfo("America/New_York")
 
+# PERF-UOA-1: bounded caches
+UOA_CACHE_MAX   = 1024   # entries per cache (whale results, dark-pool scores)
+DARK_POOL_TTL_S = 60.0
+
 
 class UnusualOptionsDetector:
     """
@@ -60,8 +75,11 @@ class UnusualOptionsDetector:
         self.unusual_whales_key = os.getenv('UNUSUAL_WHALES_API_KEY', '')
         
         # 5-minute cache to avoid API spam
-        self.cache: Dict[str, Dict] = {}  # ticker -> {data, timestamp}
+        # PERF-UOA-1: (ticker, direction) -> {data, cached_at}, LRU order
+        self.cache: "OrderedDict[tuple, Dict]" = OrderedDict()
         self.cache_ttl = 300  # 5 minutes
+        # PERF-UOA-1: ticker -> (score, cached_at monotonic), LRU order
+        self._dark_pool_cache: "OrderedDict[str, tuple]" = OrderedDict()
         
         # Thresholds for unusual activity
         self.min_premium_whale = 100000  # $100K minimum for whale classification
@@ -95,7 +113,7 @@ class UnusualOptionsDetector:
         whale_score = self._detect_large_orders(ticker, direction)
         flow_score = self._analyze_options_flow(ticker, direction)
         sweep_score = self._detect_sweeps(ticker, direction)
-        dark_pool_score = self._check_dark_pool_activity(ticker)
+        dark_pool_score = self._dark_pool_score(ticker)   # PERF-UOA-1
         
         # Calculate overall score (weighted)
         overall_score = (
@@ -250,6 +268,20 @@ class UnusualOptionsDetector:
             logger.info(f"[UOA] {ticker} sweep detection error: {e}")
             return 0.0
     
+    def _dark_pool_score(self, ticker: str) -> float:
+        """PERF-UOA-1: _check_dark_pool_activity() memoized per ticker for DARK_POOL_TTL_S."""
+        hit = self._dark_pool_cache.get(ticker)
+        now = time.monotonic()
+        if hit is not None and now - hit[1] < DARK_POOL_TTL_S:
+            self._dark_pool_cache.move_to_end(ticker)
+            return hit[0]
+        score = self._check_dark_pool_activity(ticker)
+        self._dark_pool_cache[ticker] = (score, now)
+        self._dark_pool_cache.move_to_end(ticker)
+        while len(self._dark_pool_cache) > UOA_CACHE_MAX:
+            self._dark_pool_cache.popitem(last=False)
+        return score
+
     def _check_dark_pool_activity(self, ticker: str) -> float:
         """
         Check for dark pool prints and block trades.
@@ -312,15 +344,15 @@ class UnusualOptionsDetector:
     def _is_cached(self, ticker: str, direction: str) -> bool:
         """Check if ticker+direction data is in cache and still valid."""
         cache_key = (ticker, direction)
-        if cache_key not in self.cache:
+        entry = self.cache.get(cache_key)
+        if entry is None:
             return False
         
-        # BUG-UOA-1 FIX: _cache_result() now stores .isoformat() string so
-        # fromisoformat() receives a str, not a raw datetime object.
-        cached_time = datetime.fromisoformat(self.cache[cache_key]['data']['timestamp'])
-        age_seconds = (datetime.now(ET) - cached_time).total_seconds()
-        
-        return age_seconds < self.cache_ttl
+        # PERF-UOA-1: monotonic age check (no ISO parsing); refresh LRU position
+        if time.monotonic() - entry['cached_at'] >= self.cache_ttl:
+            return False
+        self.cache.move_to_end(cache_key)
+        return True
     
     def _cache_result(self, ticker: str, direction: str, result: Dict) -> None:
         """
@@ -335,13 +367,18 @@ class UnusualOptionsDetector:
         cache_key = (ticker, direction)
         self.cache[cache_key] = {
             'data': result,
-            'timestamp': datetime.now(ET).isoformat()  # BUG-UOA-1 FIX: .isoformat() not raw datetime
+            'timestamp': datetime.now(ET).isoformat(),  # BUG-UOA-1 FIX: .isoformat() not raw datetime
+            'cached_at': time.monotonic(),               # PERF-UOA-1
         }
+        self.cache.move_to_end(cache_key)
+        while len(self.cache) > UOA_CACHE_MAX:
+            self.cache.popitem(last=False)
     
     def clear_cache(self) -> None:
         """Clear UOA cache (called at EOD reset)."""
         count = len(self.cache)
         self.cache.clear()
+        self._dark_pool_cache.clear()
         logger.info(f"[UOA] Cache cleared ({count} entries removed)")
     
     def get_whale_alerts(self, tickers: List[str], min_score: float = 6.0) -> List[Dict]:
@@ -244,7 +244,7 @@ def _flush_pending():
         [WS] Closed: NVDA×2, AAPL×1, SPY×3  (6 bars, 14:05:01 ET)
       Nothing is printed if no bars closed this cycle.
 
-    BUG-WF-1 fix: materialize_5m_bars() is only called when store_bars()
+    BUG-WF-1 fix: materialize_5m_bars() is only called when store_bars_batch()
     returns a non-zero count, avoiding a wasted DB round-trip every
     FLUSH_INTERVAL seconds per ticker when no new bars were written.
     """
@@ -258,12 +258,10 @@ def _flush_pending():
     if not snapshot:
         return
 
-    stored_counts = {}   # ticker -> bars actually stored
-    for ticker, bars in snapshot.items():
-        count = data_manager.store_bars(ticker, bars, quiet=True)  # suppress per-ticker line
-        if count:
-            data_manager.materialize_5m_bars(ticker)  # BUG-WF-1: only when bars were stored
-            stored_counts[ticker] = count
+    # PERF-DM-13: one transaction for every ticker's closed bars
+    stored_counts = data_manager.store_bars_batch(snapshot)   # ticker -> bars stored
+    for ticker in stored_counts:
+        data_manager.materialize_5m_bars(ticker)  # BUG-WF-1: only when bars were stored
 
     if stored_counts:
         total = sum(stored_counts.values())
@@ -291,9 +289,11 @@ def _flush_open():
     with _lock:
         snapshot = {t: dict(b) for t, b in _open_bars.items()}
 
-    for ticker, bar in snapshot.items():
-        if bar["datetime"].date() == today_et:
-            data_manager.store_bars(ticker, [bar], quiet=True)  # always quiet
+    # PERF-DM-13: one transaction for all open bars (store_bars_batch never logs per ticker)
+    data_manager.store_bars_batch({
+        ticker: [bar] for ticker, bar in snapshot.items()
+        if bar["datetime"].date() == today_et
+    })
 
     # Heartbeat: one line per HEARTBEAT_INTERVAL so console shows WS is alive
     now = time.monotonic()
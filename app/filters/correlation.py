@@ -147,10 +147,10 @@ def _get_returns(ticker: str, lookback_bars: int, timeframe: str) -> Optional[np
     try:
         from app.data.data_manager import data_manager
         
-        # Fetch bars from data manager
-        bars = data_manager.get_bars_from_memory(ticker, limit=lookback_bars + 1)
+        # Fetch bars from data manager (PERF-DM-17: record array, only closes are read)
+        bars = data_manager.get_bars_array(ticker, limit=lookback_bars + 1)
         
-        if not bars or len(bars) < lookback_bars:
+        if len(bars) < lookback_bars:
             logger.warning(
                 f"[CORRELATION] Insufficient data for {ticker} (need {lookback_bars}, got {len(bars)})",
                 extra={'component': 'correlation', 'symbol': ticker}
@@ -158,7 +158,7 @@ def _get_returns(ticker: str, lookback_bars: int, timeframe: str) -> Optional[np
             return None
         
         # Calculate returns (percent change from bar to bar)
-        closes = np.array([bar['close'] for bar in bars])
+        closes = bars.close
         returns = np.diff(closes) / closes[:-1]
         
         return returns[-lookback_bars:]  # Return last N returns
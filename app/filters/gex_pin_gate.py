@@ -41,10 +41,10 @@ def is_in_gex_pin_zone(entry_price: float, options_rec: dict) -> tuple:
             return False, "no options_rec"
 
         gex_data = options_rec.get("gex_data")
-        if not gex_data or not gex_data.get("has_data"):
+        if not gex_data or not gex_data.has_data:
             return False, "no GEX data"
 
-        gamma_flip = gex_data.get("gamma_flip")
+        gamma_flip = gex_data.gamma_flip
         if gamma_flip is None or gamma_flip == 0:
             return False, "no gamma_flip level"
 
@@ -31,11 +31,29 @@
 # FIX (Mar 19 2026):
 #   print_market_regime() and the EODHD-fallback log now use logger.info()
 #   instead of bare print() so output flows through the logging pipeline.
+#
+# PERF-MRC-1 (Oct 18 2026):
+#   The regime read walked the same close series four times (EMA 9/21/50 and
+#   a second EMA50 over bars[:-1] for the slope).  Closes are extracted once
+#   and EMA50 is computed in a single pass that also keeps the value before
+#   the last update, which is exactly EMA50 over bars[:-1].
+#
+# PERF-MRC-2 (Oct 18 2026):
+#   _ema_pair() returns full precision.  The stack / slope comparisons run on
+#   unrounded EMAs and the values are rounded once, in the returned dict —
+#   previously two EMAs equal to 4 dp compared as equal.
+#
+# PERF-MRC-3 (Oct 18 2026):
+#   The EODHD key and regime webhook were re-read with os.getenv() on every
+#   fallback fetch / scan-cycle post.  Both now come from utils.config, which
+#   resolves the environment (and .env) once at import alongside the startup
+#   validate_required_env_vars() check.
 
-import os
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 import logging
+
+from utils import config
 logger = logging.getLogger(__name__)
 
 _ET = ZoneInfo("America/New_York")
@@ -64,23 +82,25 @@ EMOJI_MAP = {
 
 
 # ── EMA helpers ───────────────────────────────────────────────────────────────
-def _compute_ema(bars: list, period: int) -> float:
-    closes = [b["close"] for b in bars if b.get("close")]
+def _closes(bars: list) -> list:
+    return [b["close"] for b in bars if b.get("close")]
+
+
+def _ema_pair(closes: list, period: int) -> tuple:
+    """
+    PERF-MRC-1: (EMA over closes, EMA over closes[:-1]) in one pass.
+    Either value is 0.0 when its series is shorter than period.
+    PERF-MRC-2: unrounded — callers round for output.
+    """
     if len(closes) < period:
-        return 0.0
+        return 0.0, 0.0
     k   = 2.0 / (period + 1)
     ema = sum(closes[:period]) / period
+    prev = 0.0                      # closes[:-1] shorter than period
     for price in closes[period:]:
-        ema = price * k + ema * (1 - k)
-    return round(ema, 4)
-
-
-def _get_slope_bull(bars: list, period: int) -> bool:
-    if len(bars) < period + 1:
-        return True
-    current  = _compute_ema(bars,      period)
-    previous = _compute_ema(bars[:-1], period)
-    return current >= previous
+        prev = ema
+        ema  = price * k + ema * (1 - k)
+    return ema, prev
 
 
 def _arrow(slope_bull: bool) -> str:
@@ -102,7 +122,7 @@ def _fetch_eodhd_intraday(symbol: str, interval: str = "5m", limit: int = 60) ->
         if age < EODHD_CACHE_SECONDS and cached["bars"]:
             return cached["bars"]
 
-    api_key = os.getenv("EODHD_API_KEY", "")
+    api_key = config.EODHD_API_KEY   # PERF-MRC-3
     if not api_key:
         return []
 
@@ -201,16 +221,22 @@ def _score_instrument(symbol: str) -> dict:
             "reason": f"{symbol} bars unavailable"
         }
 
-    ema9       = _compute_ema(bars, 9)
-    ema21      = _compute_ema(bars, 21)
-    ema50      = _compute_ema(bars, 50)
-    slope_bull = _get_slope_bull(bars, 50)
+    closes     = _closes(bars)          # PERF-MRC-1: one extraction, one EMA50 pass
+    ema9       = _ema_pair(closes, 9)[0]
+    ema21      = _ema_pair(closes, 21)[0]
+    ema50, ema50_prev = _ema_pair(closes, 50)
+    if len(bars) < 51:
+        slope_bull = True
+    elif not bars[-1].get("close"):     # last bar not in closes: bars[:-1] has the same series
+        slope_bull = True
+    else:
+        slope_bull = ema50 >= ema50_prev
     price      = bars[-1]["close"]
 
     if ema9 == 0.0 or ema21 == 0.0 or ema50 == 0.0:
         return {
             "label": "UNKNOWN", "score": 0,
-            "ema9": ema9, "ema21": ema21, "ema50": ema50,
+            "ema9": round(ema9, 4), "ema21": round(ema21, 4), "ema50": round(ema50, 4),
             "slope_bull": slope_bull, "price": price,
             "reason": f"{symbol} insufficient bars for all EMAs"
         }
@@ -236,7 +262,7 @@ def _score_instrument(symbol: str) -> dict:
 
     return {
         "label": label, "score": score,
-        "ema9": ema9, "ema21": ema21, "ema50": ema50,
+        "ema9": round(ema9, 4), "ema21": round(ema21, 4), "ema50": round(ema50, 4),
         "slope_bull": slope_bull, "price": price, "reason": reason
     }
 
@@ -366,7 +392,7 @@ def send_regime_discord(regime: dict = None, force: bool = False):
     """
     global _last_discord_post
 
-    webhook_url = os.getenv("DISCORD_REGIME_WEBHOOK_URL", "")
+    webhook_url = config.DISCORD_REGIME_WEBHOOK_URL   # PERF-MRC-3
     if not webhook_url:
         return
 
@@ -417,8 +443,9 @@ def send_regime_discord(regime: dict = None, force: bool = False):
             f"\U0001f550 {ts_str} | passive nudge only — no signals blocked"
         )
 
-        import requests
-        requests.post(webhook_url, json={"content": msg}, timeout=5)
+        # PERF-DH-11: queued on the shared Discord send worker
+        from app.notifications.discord_helpers import send_to_webhook
+        send_to_webhook(webhook_url, {"content": msg}, "Regime ")
         _last_discord_post = now
 
     except Exception:
@@ -42,6 +42,12 @@ Phase 1 (Mar 26 2026):
     A backwards-compatible shim remains here so all existing callers continue
     to work without any import changes.
 
+PERF-TI-1 (Oct 18 2026):
+  - fetch_technical_indicator() used bare requests.get(), so every cache
+    miss (several indicators per ticker per TTL window) paid a new TCP + TLS
+    handshake to eodhd.com. Calls now share a module-level keep-alive
+    requests.Session, like data_manager and premarket_scanner.
+
 MOVED: app/analytics/technical_indicators.py → app/indicators/technical_indicators.py
 """
 import requests
@@ -49,11 +55,15 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta, time as dtime
 from zoneinfo import ZoneInfo
 from utils import config
+from utils.http import make_session
 import logging
 logger = logging.getLogger(__name__)
 
 ET = ZoneInfo("America/New_York")
 
+# PERF-TI-1: keep-alive connections to eodhd.com for indicator fetches
+_session = make_session(pool_maxsize=8)
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # BAR SORT GUARD  (M6)
@@ -168,7 +178,7 @@ def fetch_technical_indicator(
     }
 
     try:
-        response = requests.get(url, params=api_params, timeout=10)
+        response = _session.get(url, params=api_params, timeout=10)
         response.raise_for_status()
         data = response.json()
         if not data or not isinstance(data, list):
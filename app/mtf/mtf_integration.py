@@ -57,6 +57,11 @@ logger = logging.getLogger(__name__)
 
 GRADE_RANK: Dict[str, int] = {'A+': 0, 'A': 1, 'A-': 2}
 
+# PERF-MTF-1: convergence boost and stats key by number of agreeing
+# timeframes — module constants instead of dicts rebuilt on every call.
+_TF_COUNT_BOOST: Dict[int, float] = {1: 0.00, 2: 0.02, 3: 0.03, 4: 0.05}
+_TF_COUNT_KEY: Dict[int, str] = {2: '5m_3m', 3: '5m_3m_2m', 4: '5m_3m_2m_1m'}
+
 
 def _is_better_grade(candidate: str, current_best: Optional[str]) -> bool:
     if current_best is None:
@@ -237,14 +242,13 @@ def check_mtf_convergence(ticker: str, direction: str, bars_5m: List[dict],
                 best_confirmation_grade = signal['confirmation_grade']
     num_timeframes = len(confirmed_timeframes)
     convergence    = num_timeframes > 1
-    boost_map = {1: 0.00, 2: 0.02, 3: 0.03, 4: 0.05}
-    boost = boost_map[num_timeframes]
+    boost = _TF_COUNT_BOOST[num_timeframes]
 
     with _mtf_stats_lock:
         if convergence:
             _mtf_stats['convergence_found'] += 1
             _mtf_stats['total_boost'] += boost
-            key = {2: '5m_3m', 3: '5m_3m_2m', 4: '5m_3m_2m_1m'}.get(num_timeframes)
+            key = _TF_COUNT_KEY.get(num_timeframes)
             if key:
                 _mtf_stats['timeframe_breakdown'][key] += 1
             if best_confirmation_grade:
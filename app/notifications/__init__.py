@@ -11,19 +11,16 @@ Usage:
     from app.notifications.discord_helpers import send_premarket_watchlist
     from app.notifications.discord_helpers import send_daily_summary
     from app.notifications.discord_helpers import send_simple_message
+    from app.notifications.discord_helpers import send_to_webhook
     from app.notifications.discord_helpers import test_webhook
-"""
-from app.notifications.discord_helpers import (
-    send_options_signal_alert,
-    send_equity_bos_fvg_alert,
-    send_scaling_alert,
-    send_exit_alert,
-    send_premarket_watchlist,
-    send_daily_summary,
-    send_simple_message,
-    test_webhook,
-)
 
+PERF-NTF-1 (Oct 18 2026): the re-exports below resolve lazily (PEP 562
+module __getattr__). Importing any app.notifications submodule — e.g.
+annotation_bot during boot step 2.5 in app/core/__main__.py — no longer
+drags in discord_helpers and its requests / risk_manager / numpy chain
+(~90 ms) before the scanner import. `from app.notifications import
+send_simple_message` still works; discord_helpers loads on first access.
+"""
 __all__ = [
     'send_options_signal_alert',
     'send_equity_bos_fvg_alert',
@@ -32,5 +29,14 @@ __all__ = [
     'send_premarket_watchlist',
     'send_daily_summary',
     'send_simple_message',
+    'send_to_webhook',
     'test_webhook',
 ]
+
+
+def __getattr__(name):
+    # PERF-NTF-1: import discord_helpers on first use of a re-exported name
+    if name in __all__:
+        from app.notifications import discord_helpers
+        return getattr(discord_helpers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -59,14 +59,111 @@ DIS-FUT-2 (Apr 3 2026):
 - send_futures_exit_alert() added — rich embed for exits / stops.
   Call from FuturesORBScanner._discord_exit() or any position monitor.
   reason values: STOP_HIT | T1_HIT | T2_HIT | EOD_CLOSE | free-form.
+
+PERF-DH-1 (Oct 18 2026):
+- Replaced the thread-per-alert dispatch (M10) with a single daemon worker
+  draining a queue.Queue through one shared requests.Session.  Callers only
+  pay for a queue put; the TCP/TLS connection to discord.com is reused.
+- Bursts are coalesced: when several embed-only payloads for the same
+  webhook are queued, the worker merges them into one POST (Discord allows
+  up to 10 embeds / 6000 chars per message).  The 45.M-4 rate limit now
+  lives in the worker, so it no longer needs a lock.
+
+PERF-DH-2 (Oct 18 2026):
+- Each send_* function now reads the clock once (`now = datetime.now()`)
+  and formats the footer with an f-string format spec.  The watchlist
+  footer is computed once for all chunks instead of once per chunk, and
+  send_equity_bos_fvg_alert no longer evaluates datetime.now() eagerly as
+  a .get() default when the signal already carries a timestamp.
+
+PERF-DH-3 (Oct 18 2026):
+- send_premarket_watchlist() builds its rows with one list comprehension
+  over a bound score_map.get and a single-f-string row formatter
+  (_format_watchlist_line).  Watchlists that fit in one embed skip the
+  chunking pass entirely.
+
+PERF-DH-4 (Oct 18 2026):
+- Fixed-layout embeds (scaling, exit, daily summary) take their field names
+  and inline flags from module-level skeleton tuples; each call only builds
+  the values and zips them in via _fields().
+
+PERF-DH-5 (Oct 18 2026):
+- send_options_signal_alert() and send_daily_summary() bind the dict .get
+  of options_data / greeks details / stats to a local once instead of
+  re-resolving the attribute for every key.
+
+PERF-DH-6 (Oct 18 2026):
+- send_premarket_watchlist() builds every part embed first and packs them
+  into as few webhook messages as the 10-embed / 6000-char limits allow
+  (_pack_embeds), so a multi-part watchlist costs one round trip instead of
+  one per part.  Concurrent HTTP was not used: Discord rate-limits per
+  webhook, so parallel POSTs to one URL would just earn 429s.
+
+PERF-DH-7 (Oct 18 2026):
+- The shared session mounts an HTTPAdapter (2 pools / 4 connections) with
+  a bounded urllib3 Retry: up to 2 retries with 0.2s backoff on connect
+  errors and 429/502/503/504, honouring Retry-After.  Read errors are not
+  retried (read=0) — Discord may already have posted the alert, and a
+  resend would duplicate it.  Retries run on the worker thread, so a
+  transient Discord hiccup no longer drops the alert.
+
+PERF-DH-8 (Oct 18 2026):
+- The send queue is bounded (_SEND_QUEUE_MAX = 256).  If Discord is down
+  long enough to fill it, new payloads are dropped with a warning instead
+  of growing memory or blocking the caller.
+
+PERF-DH-9 (Oct 18 2026):
+- Webhook bodies are serialized with orjson (bytes, no intermediate str)
+  and posted as data= with an explicit JSON content type.  Falls back to
+  stdlib json when orjson is missing or rejects a payload.
+- Watchlist stage labels used surrogate-pair escapes ("\\ud83d\\udd0d"),
+  which are not valid UTF-8 on their own; switched to full \\U escapes
+  (same glyphs on Discord).
+
+PERF-DH-10 (Oct 18 2026):
+- send_options_signal_alert() fills one value slot per block and zips them
+  with the module-level _OPTIONS_SIGNAL_FIELDS skeleton (absent blocks are
+  None and skipped by _fields()).  The skeletons now live together in an
+  EMBED FIELD SKELETONS section ahead of the alert builders.
+
+PERF-DH-11 (Oct 18 2026):
+- send_to_webhook(): public entry for modules that post to their own
+  channel.  news_catalyst and market_regime_context each carried a private
+  copy of the webhook POST (synchronous requests.post, own timeout, own
+  error swallowing); both now hand the payload to the shared send worker,
+  so they get the pooled session, retry policy and rate limiting and no
+  longer block the scan loop on Discord.
+
+PERF-DH-12 (Oct 18 2026):
+- Alert builders return on entry when their webhook is unset (cached
+  _SIGNALS_WEBHOOK / _WATCHLIST_WEBHOOK), instead of formatting the whole
+  embed only for _send_to_discord() to drop it.  send_simple_message()
+  builds no embed and keeps relying on the _send_to_discord() guard.
+
+PERF-DH-13 (Oct 18 2026):
+- The send worker is a daemon thread, so anything still queued when the
+  process exited (shutdown alert, last EOD report) was silently lost.
+  _flush_on_exit() is registered with atexit: it queues a _STOP sentinel
+  behind whatever is pending and waits for the worker to drain up to it,
+  so the worker stays the only consumer (order, coalescing, its carried-
+  over item and the rate limit are unchanged).  The wait is bounded by
+  _EXIT_FLUSH_TIMEOUT_S so a dead Discord cannot hang shutdown.
+
+PERF-DH-14 (Oct 18 2026):
+- The discord_sender thread is started by the first _enqueue()
+  (_ensure_worker()) instead of unconditionally at import, so importing
+  app.notifications starts no thread.
 """
-import requests
+import json
+import atexit
 import functools
+import queue
 import threading
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from typing import Dict, List, Optional
 from datetime import datetime
 from utils import config
+from utils.http import make_session
 import logging
 logger = logging.getLogger(__name__)
 # 45.H-2: Cache webhook URLs at module load — prevents TypeError on unset env vars
@@ -77,11 +174,25 @@ _WATCHLIST_WEBHOOK: str = (getattr(config, "DISCORD_WATCHLIST_WEBHOOK_URL", None
 # Falls back to _SIGNALS_WEBHOOK when not configured.
 _ANNOTATIONS_WEBHOOK: str = (getattr(config, "DISCORD_ANNOTATIONS_WEBHOOK_URL", None) or "").strip().rstrip("\n\r")
 
-# Rate-limiter state (used by Fix 45.M-4)
+# Rate-limiter interval (used by Fix 45.M-4 — enforced inside the send worker)
 import time as _time
-_last_send_ts: float = 0.0
 _RATE_LIMIT_INTERVAL: float = 0.5   # minimum seconds between Discord POSTs
-_rl_lock = threading.Lock()
+
+# PERF-DH-1: Discord per-message limits used when coalescing queued embeds.
+_MAX_EMBEDS_PER_MESSAGE: int = 10
+_MAX_EMBED_CHARS: int = 6000
+
+# PERF-DH-8: maximum payloads waiting for the send worker
+_SEND_QUEUE_MAX: int = 256
+
+# PERF-DH-9: orjson for webhook bodies (stdlib json fallback if not installed)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 # BUG-DH-2: executor for yfinance calls with timeout guard
 _yf_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yf_name")
@@ -123,6 +234,51 @@ def get_company_name(symbol: str) -> str:
         return symbol
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# EMBED FIELD SKELETONS
+# ══════════════════════════════════════════════════════════════════════════════
+
+# PERF-DH-4: static (name, inline) skeletons for the fixed-layout embeds below.
+# Only the per-call values are built at send time.
+_SCALING_FIELDS = (
+    ("💰 Partial P&L", True),
+    ("🛡️ New Stop",    True),
+    ("🎯 Next Target", True),
+)
+_EXIT_FIELDS = (
+    ("💵 Exit Price", True),
+    ("📌 Reason",     True),
+    ("💰 Total P&L",  False),
+)
+_SUMMARY_FIELDS = (
+    ("📊 Total Trades", True),
+    ("✅ Wins",          True),
+    ("❌ Losses",        True),
+    ("🎯 Win Rate",      True),
+    ("💰 Net P&L",       True),
+)
+
+
+# PERF-DH-10: every block send_options_signal_alert() can emit, in display order
+_OPTIONS_SIGNAL_FIELDS = (
+    ("Signal Quality",                                 False),
+    ("Price & Risk",                                   False),
+    ("Confirmation",                                   False),
+    ("Greeks Snapshot",                                False),
+    ("Recommended Contract [est — pre-confirmation]",  False),
+    ("Option Entry",                                   False),
+)
+
+
+def _fields(template: tuple, values: tuple) -> List[Dict]:
+    """Zip a static field skeleton with this call's values (None = omit)."""
+    return [
+        {"name": name, "value": value, "inline": inline}
+        for (name, inline), value in zip(template, values)
+        if value is not None
+    ]
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # EQUITY BOS/FVG SIGNAL ALERT (War Machine Core Scanner)
 # ══════════════════════════════════════════════════════════════════════════════
@@ -141,6 +297,10 @@ def send_equity_bos_fvg_alert(signal: Dict):
       - rvol, volume_rank, gap_pct (optional)
       - vix (optional)
     """
+    if not _SIGNALS_WEBHOOK:   # PERF-DH-12: webhook disabled — skip building the embed
+        return
+
+    now = datetime.now()   # PERF-DH-2: single clock read per alert
     ticker = signal.get("ticker", "UNKNOWN")
     direction = signal.get("direction", "bull").lower()
     
@@ -177,7 +337,7 @@ def send_equity_bos_fvg_alert(signal: Dict):
     bos_strength = signal.get("bos_strength", 0) * 100  # Convert to percentage
     
     # Context
-    timestamp = signal.get("timestamp", datetime.now())
+    timestamp = signal.get("timestamp") or now
     candle_type = signal.get("candle_type")
     mtf = signal.get("mtf_convergence")
     rvol = signal.get("rvol")
@@ -192,7 +352,7 @@ def send_equity_bos_fvg_alert(signal: Dict):
     if isinstance(timestamp, str):
         header_parts.append(f"Time: **{timestamp}**")
     else:
-        header_parts.append(f"Time: **{timestamp.strftime('%Y-%m-%d %H:%M:%S')}**")
+        header_parts.append(f"Time: **{timestamp:%Y-%m-%d %H:%M:%S}**")
     
     description = "  •  ".join(header_parts)
     
@@ -268,7 +428,7 @@ def send_equity_bos_fvg_alert(signal: Dict):
         "color": color,
         "fields": fields,
         "footer": {
-            "text": f"War Machine BOS/FVG | {datetime.now().strftime('%Y-%m-%d %I:%M %p ET')}",
+            "text": f"War Machine BOS/FVG | {now:%Y-%m-%d %I:%M %p} ET",
         },
     }
     
@@ -306,6 +466,11 @@ def send_options_signal_alert(
     ml_adjustment: float in pts (e.g. +9.0 or -5.0).  When |adjustment| >= 1pt,
     a ML Score line is appended showing the direction arrow and base->adjusted conf.
     """
+    if not _SIGNALS_WEBHOOK:   # PERF-DH-12
+        return
+
+    now = datetime.now()   # PERF-DH-2: single clock read per alert
+
     # CALL / PUT and colors
     option_side = "CALL" if direction.lower() == "bull" else "PUT"
     is_call = option_side == "CALL"
@@ -334,8 +499,9 @@ def send_options_signal_alert(
             f"({base_conf_pct:.0f}% → {conf_pct:.0f}%)"
         )
 
-    fields = []
-    
+    # PERF-DH-10: one value slot per _OPTIONS_SIGNAL_FIELDS entry; None = omitted
+    quality_val = confirm_val = greeks_val = contract_val = entry_val = None
+
     # 1) Signal Quality
     quality_bits = []
     if rvol is not None:
@@ -362,24 +528,16 @@ def send_options_signal_alert(
         quality_bits.append(f"MTF **{mtf_convergence} TF** ({mtf_label})")
     
     if quality_bits:
-        fields.append({
-            "name": "Signal Quality",
-            "value": " • ".join(quality_bits),
-            "inline": False,
-        })
+        quality_val = " • ".join(quality_bits)
     
     # 2) Price & Risk
-    fields.append({
-        "name": "Price & Risk",
-        "value": (
-            f"Entry: **${entry:.2f}**\n"
-            f"Stop: **${stop:.2f}**  (Risk **${risk:.2f}**)\n"
-            f"T1: **${t1:.2f}**  ({r1:.1f}R)\n"
-            f"T2: **${t2:.2f}**  ({r2:.1f}R)\n"
-            f"Max Reward (avg): **{avg_r:.1f}R**"
-        ),
-        "inline": False,
-    })
+    price_val = (
+        f"Entry: **${entry:.2f}**\n"
+        f"Stop: **${stop:.2f}**  (Risk **${risk:.2f}**)\n"
+        f"T1: **${t1:.2f}**  ({r1:.1f}R)\n"
+        f"T2: **${t2:.2f}**  ({r2:.1f}R)\n"
+        f"Max Reward (avg): **{avg_r:.1f}R**"
+    )
     
     # 3) Confirmation
     conf_bits = []
@@ -390,64 +548,53 @@ def send_options_signal_alert(
     if mtf_convergence is not None:
         conf_bits.append(f"Aligned TFs: **{mtf_convergence}**")
     if conf_bits:
-        fields.append({
-            "name": "Confirmation",
-            "value": " • ".join(conf_bits),
-            "inline": False,
-        })
+        confirm_val = " • ".join(conf_bits)
     
     # 4) Greeks Summary
     if greeks_data and greeks_data.get("details"):
-        g = greeks_data["details"]
-        delta = abs(g.get("delta", 0.0))
-        iv = g.get("iv", 0.0)
-        dte = g.get("dte", 0)
-        spread = g.get("spread_pct", 0.0)
-        liq_ok = g.get("liquidity_ok", False)
+        g = greeks_data["details"].get   # PERF-DH-5: bind once
+        delta = abs(g("delta", 0.0))
+        iv = g("iv", 0.0)
+        dte = g("dte", 0)
+        spread = g("spread_pct", 0.0)
+        liq_ok = g("liquidity_ok", False)
         
-        fields.append({
-            "name": "Greeks Snapshot",
-            "value": (
-                f"Δ **{delta:.2f}**  •  IV **{iv*100:.0f}%**  •  **{dte} DTE**\n"
-                f"Spread **{spread:.1f}%**  •  Liquidity **{'OK' if liq_ok else 'Thin'}**"
-            ),
-            "inline": False,
-        })
+        greeks_val = (
+            f"Δ **{delta:.2f}**  •  IV **{iv*100:.0f}%**  •  **{dte} DTE**\n"
+            f"Spread **{spread:.1f}%**  •  Liquidity **{'OK' if liq_ok else 'Thin'}**"
+        )
     
     # 5) Recommended Contract
     if options_data:
-        strike = options_data.get("strike")
-        dte = options_data.get("dte", 0)
-        delta = abs(options_data.get("delta", 0.0))
-        iv = options_data.get("iv", 0.0)
-        bid = options_data.get("bid", 0.0)
-        ask = options_data.get("ask", 0.0)
-        spread_pct = options_data.get("spread_pct", 0.0)
+        od = options_data.get   # PERF-DH-5: bind once
+        strike = od("strike")
+        dte = od("dte", 0)
+        delta = abs(od("delta", 0.0))
+        iv = od("iv", 0.0)
+        bid = od("bid", 0.0)
+        ask = od("ask", 0.0)
+        spread_pct = od("spread_pct", 0.0)
         
-        mid = options_data.get("mid")
+        mid = od("mid")
         if not mid and bid and ask:
             mid = round((bid + ask) / 2, 2)
-        limit_entry = options_data.get("limit_entry", mid or 0)
-        max_entry = options_data.get("max_entry", ask or 0)
+        limit_entry = od("limit_entry", mid or 0)
+        max_entry = od("max_entry", ask or 0)
         
-        fields.append({
-            "name": "Recommended Contract [est — pre-confirmation]",
-            "value": (
-                f"**{option_side}** @ **${strike}**\n"
-                f"{dte} DTE  •  Δ **{delta:.2f}**  •  IV **{iv*100:.0f}%**"
-            ),
-            "inline": False,
-        })
+        contract_val = (
+            f"**{option_side}** @ **${strike}**\n"
+            f"{dte} DTE  •  Δ **{delta:.2f}**  •  IV **{iv*100:.0f}%**"
+        )
         
         if bid and ask:
-            fields.append({
-                "name": "Option Entry",
-                "value": (
-                    f"Limit: **${limit_entry:.2f}**  (Max **${max_entry:.2f}**)\n"
-                    f"Bid ${bid:.2f}  •  Ask ${ask:.2f}  •  Spread {spread_pct:.1f}%"
-                ),
-                "inline": False,
-            })
+            entry_val = (
+                f"Limit: **${limit_entry:.2f}**  (Max **${max_entry:.2f}**)\n"
+                f"Bid ${bid:.2f}  •  Ask ${ask:.2f}  •  Spread {spread_pct:.1f}%"
+            )
+
+    fields = _fields(_OPTIONS_SIGNAL_FIELDS, (
+        quality_val, price_val, confirm_val, greeks_val, contract_val, entry_val,
+    ))
     
     embed = {
         "title": title,
@@ -455,7 +602,7 @@ def send_options_signal_alert(
         "color": color,
         "fields": fields,
         "footer": {
-            "text": f"War Machine Sniper v2 | {datetime.now().strftime('%Y-%m-%d %I:%M %p ET')}",
+            "text": f"War Machine Sniper v2 | {now:%Y-%m-%d %I:%M %p} ET",
         },
     }
     
@@ -475,6 +622,10 @@ def send_scaling_alert(
     breakeven_price: float
 ):
     """Alert when T1 is hit and 50% of position is scaled out."""
+    if not _SIGNALS_WEBHOOK:   # PERF-DH-12
+        return
+
+    now = datetime.now()
     embed = {
         "title": f"✂️ SCALING OUT: {ticker}",
         "color": 0xFFA500,
@@ -483,13 +634,13 @@ def send_scaling_alert(
             f"Sold **{contracts_closed} contract(s)** — "
             f"**{contracts_remaining} contract(s)** still running for T2."
         ),
-        "fields": [
-            {"name": "💰 Partial P&L",   "value": f"${partial_pnl:+.2f}",          "inline": True},
-            {"name": "🛡️ New Stop",      "value": f"${breakeven_price:.2f} (BE)",   "inline": True},
-            {"name": "🎯 Next Target",   "value": "Target 2 (3.5R)",               "inline": True},
-        ],
+        "fields": _fields(_SCALING_FIELDS, (
+            f"${partial_pnl:+.2f}",
+            f"${breakeven_price:.2f} (BE)",
+            "Target 2 (3.5R)",
+        )),
         "footer": {
-            "text": f"War Machine  |  {datetime.now().strftime('%Y-%m-%d %H:%M:%S ET')}"
+            "text": f"War Machine  |  {now:%Y-%m-%d %H:%M:%S} ET"
         }
     }
     _send_to_discord({"embeds": [embed]})
@@ -502,6 +653,10 @@ def send_exit_alert(
     total_pnl: float
 ):
     """Alert for full position close — stop, T2, or EOD."""
+    if not _SIGNALS_WEBHOOK:   # PERF-DH-12
+        return
+
+    now = datetime.now()
     win = total_pnl > 0
     emoji = "✅" if win else "❌"
     color = 0x00FF00 if win else 0xFF0000
@@ -509,18 +664,38 @@ def send_exit_alert(
     embed = {
         "title": f"{emoji} POSITION CLOSED: {ticker}",
         "color": color,
-        "fields": [
-            {"name": "💵 Exit Price", "value": f"${price:.2f}",        "inline": True},
-            {"name": "📌 Reason",     "value": reason,                 "inline": True},
-            {"name": "💰 Total P&L",  "value": f"${total_pnl:+.2f}",  "inline": False},
-        ],
+        "fields": _fields(_EXIT_FIELDS, (
+            f"${price:.2f}",
+            reason,
+            f"${total_pnl:+.2f}",
+        )),
         "footer": {
-            "text": f"War Machine  |  {datetime.now().strftime('%Y-%m-%d %H:%M:%S ET')}"
+            "text": f"War Machine  |  {now:%Y-%m-%d %H:%M:%S} ET"
         }
     }
     _send_to_discord({"embeds": [embed]})
 
 
+_NO_SCORE: Dict = {}   # shared read-only default for unscored watchlist tickers
+
+
+def _format_watchlist_line(rank: int, ticker: str, data: Dict) -> str:
+    """One watchlist row: rank, ticker, score, RVOL, gap, catalyst, price."""
+    score   = data.get("composite_score", 0)
+    rvol    = data.get("rvol", 0)
+    price   = data.get("price", 0)
+    gap_pct = (data.get("gap_data") or _NO_SCORE).get("size_pct")
+    catalyst_type = (data.get("catalyst_data") or _NO_SCORE).get("type")
+    return (
+        f"`#{rank:>2}` **{ticker}**  │  "
+        f"Score: `{f'{score:.1f}' if score else '—'}`  "
+        f"RVOL: `{f'{rvol:.2f}x' if rvol else '—'}`  "
+        f"Gap: `{f'{gap_pct:+.1f}%' if gap_pct is not None else '—'}`  "
+        f"Cat: `{catalyst_type or '—'}`  "
+        f"@ {f'${price:.2f}' if price else '—'}"
+    )
+
+
 def send_premarket_watchlist(
     tickers: List[str],
     scored_tickers: Optional[List[Dict]] = None,
@@ -541,89 +716,84 @@ def send_premarket_watchlist(
                         (contains score, rvol, gap_data, catalyst_data, price).
         stage:          Funnel stage label (wide / narrow / final / live).
     """
+    if not (_WATCHLIST_WEBHOOK or _SIGNALS_WEBHOOK):   # PERF-DH-12
+        return
+
     if not tickers:
         return
 
     stage_labels = {
-        "wide":   ("\ud83d\udd0d Wide Scan",    0x1E90FF),   # blue
-        "narrow": ("\ud83c\udfaf Narrow",       0xFFA500),   # orange
-        "final":  ("\ud83d\ude80 Final Top 3",  0xFF4500),   # red-orange
-        "live":   ("\ud83d\udfe2 Live Session", 0x00C853),   # green
+        "wide":   ("\U0001f50d Wide Scan",    0x1E90FF),   # blue
+        "narrow": ("\U0001f3af Narrow",       0xFFA500),   # orange
+        "final":  ("\U0001f680 Final Top 3",  0xFF4500),   # red-orange
+        "live":   ("\U0001f7e2 Live Session", 0x00C853),   # green
     }
     stage_label, color = stage_labels.get(stage, (f"Stage: {stage}", 0x888888))
 
     # Build a lookup from the scored_tickers list for fast access
-    score_map: Dict[str, Dict] = {}
-    if scored_tickers:
-        for t in scored_tickers:
-            score_map[t.get("ticker", "")] = t
-
-    lines = []
-    for i, ticker in enumerate(tickers, 1):
-        data = score_map.get(ticker, {})
-        score = data.get("composite_score", 0)
-        rvol  = data.get("rvol", 0)
-        price = data.get("price", 0)
-
-        gap_data      = data.get("gap_data") or {}
-        gap_pct       = gap_data.get("size_pct", None)
-        catalyst_data = data.get("catalyst_data") or {}
-        catalyst_type = catalyst_data.get("type", None)
-
-        gap_str      = f"{gap_pct:+.1f}%" if gap_pct is not None else "—"
-        catalyst_str = catalyst_type if catalyst_type else "—"
-        rvol_str     = f"{rvol:.2f}x" if rvol else "—"
-        price_str    = f"${price:.2f}" if price else "—"
-        score_str    = f"{score:.1f}" if score else "—"
-
-        lines.append(
-            f"`#{i:>2}` **{ticker}**  │  Score: `{score_str}`  RVOL: `{rvol_str}`  "
-            f"Gap: `{gap_str}`  Cat: `{catalyst_str}`  @ {price_str}"
-        )
+    score_map: Dict[str, Dict] = (
+        {t.get("ticker", ""): t for t in scored_tickers} if scored_tickers else {}
+    )
+    lookup = score_map.get   # PERF-DH-3: bind once for the comprehension
+    lines = [
+        _format_watchlist_line(i, ticker, lookup(ticker, _NO_SCORE))
+        for i, ticker in enumerate(tickers, 1)
+    ]
+
+    # PERF-DH-2: one footer for every chunk of this watchlist post
+    footer_text = f"War Machine  |  {datetime.now():%Y-%m-%d %H:%M:%S} ET"
 
     # Discord embed description has a 4096-char limit; chunk if needed
     chunk_size = 15
-    chunks = [lines[i:i + chunk_size] for i in range(0, len(lines), chunk_size)]
+    if len(lines) <= chunk_size:
+        chunks = [lines]
+    else:
+        chunks = [lines[i:i + chunk_size] for i in range(0, len(lines), chunk_size)]
 
+    embeds = []
     for idx, chunk in enumerate(chunks):
         part_suffix = f" — Part {idx + 1}/{len(chunks)}" if len(chunks) > 1 else ""
-        embed = {
+        embeds.append({
             "title": f"📋 Watchlist — {stage_label}  ({len(tickers)} tickers){part_suffix}",
             "color": color,
             "description": "\n".join(chunk),
-            "footer": {
-                "text": (
-                    f"War Machine  |  "
-                    f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S ET')}"
-                )
-            },
-        }
-        _send_to_discord_watchlist({"embeds": [embed]})
+            "footer": {"text": footer_text},
+        })
+
+    # PERF-DH-6: all parts go out in as few messages as Discord's limits allow
+    for batch in _pack_embeds(embeds):
+        _send_to_discord_watchlist({"embeds": batch})
 
 
 def send_daily_summary(stats: Dict):
     """Send end-of-day performance summary."""
-    win_rate = stats.get("win_rate", 0)
-    total_pnl = stats.get("total_pnl", 0)
-    trades = stats.get("trades", 0)
-    wins = stats.get("wins", 0)
-    losses = stats.get("losses", 0)
-    
-    color = 0x00FF00 if total_pnl >= 0 else 0xFF0000
-    emoji = "🟢" if total_pnl >= 0 else "🔴"
+    if not _SIGNALS_WEBHOOK:   # PERF-DH-12
+        return
+
+    now = datetime.now()
+    get = stats.get   # PERF-DH-5: bind once
+    win_rate  = get("win_rate", 0)
+    total_pnl = get("total_pnl", 0)
+    trades    = get("trades", 0)
+    wins      = get("wins", 0)
+    losses    = get("losses", 0)
+
+    positive = total_pnl >= 0
+    color = 0x00FF00 if positive else 0xFF0000
+    emoji = "🟢" if positive else "🔴"
     
     embed = {
-        "title": f"{emoji} Daily Summary — {datetime.now().strftime('%B %d, %Y')}",
+        "title": f"{emoji} Daily Summary — {now:%B %d, %Y}",
         "color": color,
-        "fields": [
-            {"name": "📊 Total Trades", "value": str(trades),              "inline": True},
-            {"name": "✅ Wins",          "value": str(wins),                "inline": True},
-            {"name": "❌ Losses",        "value": str(losses),              "inline": True},
-            {"name": "🎯 Win Rate",      "value": f"{win_rate:.1f}%",       "inline": True},
-            {"name": "💰 Net P&L",       "value": f"${total_pnl:+.2f}",    "inline": True},
-        ],
+        "fields": _fields(_SUMMARY_FIELDS, (
+            str(trades),
+            str(wins),
+            str(losses),
+            f"{win_rate:.1f}%",
+            f"${total_pnl:+.2f}",
+        )),
         "footer": {
-            "text": f"War Machine  |  {datetime.now().strftime('%Y-%m-%d %H:%M:%S ET')}"
+            "text": f"War Machine  |  {now:%Y-%m-%d %H:%M:%S} ET"
         }
     }
     _send_to_discord({"embeds": [embed]})
@@ -655,6 +825,10 @@ def send_futures_orb_alert(signal: dict) -> None:
       is retained as a fallback inside _discord_alert() so a missing key never
       silences the alert entirely.
     """
+    if not _SIGNALS_WEBHOOK:   # PERF-DH-12
+        return
+
+    now   = datetime.now()
     sym   = signal.get("ticker", "UNKNOWN")
     d     = signal.get("direction", "BULL").upper()
     entry = signal.get("entry_price", 0.0)
@@ -718,7 +892,7 @@ def send_futures_orb_alert(signal: dict) -> None:
         "footer": {
             "text": (
                 f"War Machine Futures ORB  |  "
-                f"{datetime.now().strftime('%Y-%m-%d %I:%M %p ET')}"
+                f"{now:%Y-%m-%d %I:%M %p} ET"
             )
         },
     }
@@ -745,6 +919,10 @@ def send_futures_exit_alert(
       Initial implementation.  Called from FuturesORBScanner._discord_exit()
       or directly from any external position monitor.
     """
+    if not _SIGNALS_WEBHOOK:   # PERF-DH-12
+        return
+
+    now    = datetime.now()
     d      = direction.upper()
     win    = reason in ("T1_HIT", "T2_HIT") or (reason not in ("STOP_HIT",) and pnl_pts > 0)
     dollar = round(abs(pnl_pts) * point_value * contracts, 2)
@@ -786,7 +964,7 @@ def send_futures_exit_alert(
         "footer": {
             "text": (
                 f"War Machine Futures ORB  |  "
-                f"{datetime.now().strftime('%Y-%m-%d %I:%M %p ET')}"
+                f"{now:%Y-%m-%d %I:%M %p} ET"
             )
         },
     }
@@ -805,6 +983,17 @@ def send_discord_message(message: str):
     _send_to_discord({"content": message})
 
 
+def send_to_webhook(webhook_url: str, payload: Dict, label: str = "") -> None:
+    """
+    PERF-DH-11: Queue a payload for an arbitrary webhook (news, regime, ...).
+    No-op when webhook_url is empty. label prefixes failure log lines.
+    """
+    webhook_url = (webhook_url or "").strip()
+    if not webhook_url:
+        return
+    _enqueue(webhook_url, payload, label)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # INTERNAL SEND HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -813,7 +1002,7 @@ def _send_to_discord_watchlist(payload: Dict):
     """
     PHASE 1.29: Send to the dedicated watchlist channel.
     Falls back to DISCORD_SIGNALS_WEBHOOK_URL if watchlist URL not configured.
-    Dispatched on a daemon thread (non-blocking).
+    Queued for the background send worker (non-blocking).
     """
     # 45.H-2: use module-level cached URLs
     webhook_url = _WATCHLIST_WEBHOOK or _SIGNALS_WEBHOOK
@@ -825,33 +1014,14 @@ def _send_to_discord_watchlist(payload: Dict):
     if not _WATCHLIST_WEBHOOK:
         logger.info("[DISCORD] ⚠️  DISCORD_WATCHLIST_WEBHOOK_URL not set — falling back to signals channel")
 
-    def _post():
-        global _last_send_ts
-        # 45.M-4: Rate limit shared across all Discord POSTs
-        with _rl_lock:
-            now = _time.monotonic()
-            wait = _RATE_LIMIT_INTERVAL - (now - _last_send_ts)
-            if wait > 0:
-                _time.sleep(wait)
-            _last_send_ts = _time.monotonic()
-        try:
-            response = requests.post(webhook_url, json=_truncate_payload(payload), timeout=5)  # 45.M-7
-            if response.status_code not in (200, 204):
-                # 45.M-10: fallback log
-                logger.info(f"[DISCORD] ❌ Watchlist HTTP {response.status_code} — payload dropped: {str(payload)[:300]}")
-        except Exception as e:
-            # 45.M-10: fallback log
-            logger.info(f"[DISCORD] ❌ Watchlist send failed ({e}) — payload dropped: {str(payload)[:300]}")
-
-    t = threading.Thread(target=_post, daemon=True)
-    t.start()
+    _enqueue(webhook_url, payload, "Watchlist ")
 
 
 def _send_annotation_to_discord(payload: Dict):
     """
     BUG-DH-6: Route annotation signals to DISCORD_ANNOTATIONS_WEBHOOK_URL when
     configured, otherwise fall back to _SIGNALS_WEBHOOK.
-    Dispatched on a daemon thread (non-blocking), shares the global rate-limiter.
+    Queued for the background send worker (non-blocking), shares its rate limit.
     """
     webhook_url = _ANNOTATIONS_WEBHOOK or _SIGNALS_WEBHOOK
     if not webhook_url:
@@ -861,23 +1031,7 @@ def _send_annotation_to_discord(payload: Dict):
     if not _ANNOTATIONS_WEBHOOK:
         logger.info("[DISCORD] ⚠️  DISCORD_ANNOTATIONS_WEBHOOK_URL not set — falling back to signals channel")
 
-    def _post():
-        global _last_send_ts
-        with _rl_lock:
-            now = _time.monotonic()
-            wait = _RATE_LIMIT_INTERVAL - (now - _last_send_ts)
-            if wait > 0:
-                _time.sleep(wait)
-            _last_send_ts = _time.monotonic()
-        try:
-            response = requests.post(webhook_url, json=_truncate_payload(payload), timeout=5)
-            if response.status_code not in (200, 204):
-                logger.info(f"[DISCORD] ❌ Annotation HTTP {response.status_code} — payload dropped: {str(payload)[:300]}")
-        except Exception as e:
-            logger.info(f"[DISCORD] ❌ Annotation send failed ({e}) — payload dropped: {str(payload)[:300]}")
-
-    t = threading.Thread(target=_post, daemon=True)
-    t.start()
+    _enqueue(webhook_url, payload, "Annotation ")
 
 
 def _truncate_payload(payload: Dict, max_chars: int = 1900) -> Dict:
@@ -908,9 +1062,9 @@ def _send_to_discord(payload: Dict):
     """
     Shared HTTP helper — all functions route through here.
 
-    M10 FIX: Dispatches the POST on a daemon Thread so webhook latency
-    or outage never blocks the scan loop. The caller always returns
-    immediately. Errors are caught and logged inside the thread.
+    PERF-DH-1: Enqueues the payload for the background send worker, so
+    webhook latency or outage never blocks the scan loop. The caller always
+    returns immediately. Errors are caught and logged inside the worker.
     """
     webhook_url = _SIGNALS_WEBHOOK  # 45.H-2: use module-level cached URL
 
@@ -918,30 +1072,225 @@ def _send_to_discord(payload: Dict):
         logger.info("[DISCORD] ❌ No webhook URL configured.")
         return
 
-    def _post():
-        global _last_send_ts
-        # 45.M-4: Rate limit — enforce minimum interval between POSTs
-        with _rl_lock:
-            now = _time.monotonic()
-            wait = _RATE_LIMIT_INTERVAL - (now - _last_send_ts)
+    _enqueue(webhook_url, payload, "")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# BACKGROUND SEND WORKER (PERF-DH-1)
+# ══════════════════════════════════════════════════════════════════════════════
+
+# PERF-DH-7: small keep-alive pool for discord.com plus bounded retries.
+# POST is opted in explicitly; only connect errors, 429 and gateway errors
+# are retried since those mean Discord did not deliver the message (a 500
+# might have). read=0: a read timeout may follow an accepted webhook, and
+# resending would post a duplicate alert.
+_session = make_session(
+    pool_maxsize=4,
+    retries=2,
+    backoff_factor=0.2,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=("GET", "POST"),
+    read=0,
+    pool_connections=2,
+)
+# PERF-DH-8: bounded so a long Discord outage cannot grow memory without limit
+_send_queue: "queue.Queue" = queue.Queue(maxsize=_SEND_QUEUE_MAX)
+# PERF-DH-13: queued by _flush_on_exit(); the worker stops when it dequeues it
+_STOP = object()
+
+
+def _enqueue(webhook_url: str, payload: Dict, label: str) -> None:
+    """Hand a payload to the send worker. label prefixes failure log lines."""
+    _ensure_worker()
+    try:
+        _send_queue.put_nowait((webhook_url, payload, label))
+    except queue.Full:
+        # PERF-DH-8: backpressure — drop rather than stall the scan loop
+        logger.warning(f"[DISCORD] ❌ {label}Send queue full — payload dropped: {str(payload)[:300]}")
+
+
+def _embed_chars(embed: Dict) -> int:
+    """Approximate Discord's per-embed character count (title/desc/fields/footer)."""
+    n = len(embed.get("title", "")) + len(embed.get("description", ""))
+    n += len((embed.get("footer") or {}).get("text", ""))
+    for field in embed.get("fields", []):
+        n += len(field.get("name", "")) + len(str(field.get("value", "")))
+    return n
+
+
+def _pack_embeds(embeds: List[Dict]) -> List[List[Dict]]:
+    """Split embeds into per-message batches within the embed/char limits."""
+    batches: List[List[Dict]] = []
+    batch: List[Dict] = []
+    chars = 0
+    for embed in embeds:
+        n = _embed_chars(embed)
+        if batch and (
+            len(batch) >= _MAX_EMBEDS_PER_MESSAGE or chars + n > _MAX_EMBED_CHARS
+        ):
+            batches.append(batch)
+            batch, chars = [], 0
+        batch.append(embed)
+        chars += n
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _is_embed_only(payload: Dict) -> bool:
+    return bool(payload.get("embeds")) and payload.keys() == {"embeds"}
+
+
+def _prepare(item: tuple) -> tuple:
+    """Apply 45.M-7 truncation to a dequeued (url, payload, label) item."""
+    url, payload, label = item
+    return url, _truncate_payload(payload), label
+
+
+def _coalesce(first: tuple, pending: "queue.Queue") -> tuple:
+    """
+    Merge queued embed-only payloads for the same webhook into `first`.
+
+    Returns (item_to_send, carry) where carry is the first dequeued item
+    that could not be merged (different webhook, plain content, or over the
+    per-message limits) — the worker sends it on its next iteration.
+    """
+    url, payload, label = first
+    if not _is_embed_only(payload):
+        return first, None
+
+    embeds = list(payload["embeds"])
+    chars  = sum(_embed_chars(e) for e in embeds)
+    carry  = None
+    while len(embeds) < _MAX_EMBEDS_PER_MESSAGE:
+        try:
+            nxt = pending.get_nowait()
+        except queue.Empty:
+            break
+        if nxt is _STOP:   # PERF-DH-13: hand the sentinel back to the worker
+            carry = nxt
+            break
+        nxt = _prepare(nxt)
+        n_url, n_payload, _ = nxt
+        if n_url != url or not _is_embed_only(n_payload):
+            carry = nxt
+            break
+        n_chars = sum(_embed_chars(e) for e in n_payload["embeds"])
+        if (
+            len(embeds) + len(n_payload["embeds"]) > _MAX_EMBEDS_PER_MESSAGE
+            or chars + n_chars > _MAX_EMBED_CHARS
+        ):
+            carry = nxt
+            break
+        embeds.extend(n_payload["embeds"])
+        chars += n_chars
+
+    if len(embeds) == len(payload["embeds"]):
+        return first, carry
+    return (url, {"embeds": embeds}, label), carry
+
+
+def _dumps(payload: Dict) -> bytes:
+    """Serialize a webhook body — orjson when available (PERF-DH-9)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(payload)
+        except orjson.JSONEncodeError:
+            pass   # e.g. lone surrogates; stdlib escapes them
+    return json.dumps(payload).encode("utf-8")
+
+
+def _post(webhook_url: str, payload: Dict, label: str) -> None:
+    try:
+        response = _session.post(
+            webhook_url,
+            data=_dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=5,
+        )
+        if response.status_code not in (200, 204):
+            # 45.M-10: fallback log on webhook failure
+            logger.info(f"[DISCORD] ❌ {label}HTTP {response.status_code} — payload dropped: {str(payload)[:300]}")
+    except Exception as e:
+        # 45.M-10: fallback log on exception
+        logger.info(f"[DISCORD] ❌ {label}Send failed ({e}) — payload dropped: {str(payload)[:300]}")
+
+
+def _discord_worker() -> None:
+    """
+    Single consumer for _send_queue — owns the session and the rate limit.
+    Returns once it dequeues _STOP, i.e. after everything queued before it.
+    """
+    last_send_ts = 0.0
+    carry = None
+    while True:
+        try:
+            if carry is not None:
+                item, carry = carry, None
+            else:
+                item = _send_queue.get()
+                if item is not _STOP:
+                    item = _prepare(item)
+            if item is _STOP:
+                return
+            # 45.M-4: Rate limit — enforce minimum interval between POSTs.
+            # Waiting before coalescing lets a burst pile up into one message.
+            wait = _RATE_LIMIT_INTERVAL - (_time.monotonic() - last_send_ts)
             if wait > 0:
                 _time.sleep(wait)
-            _last_send_ts = _time.monotonic()
-        try:
-            response = requests.post(
-                webhook_url,
-                json=_truncate_payload(payload),  # 45.M-7
-                timeout=5,
-            )
-            if response.status_code not in (200, 204):
-                # 45.M-10: fallback log on webhook failure
-                logger.info(f"[DISCORD] ❌ HTTP {response.status_code} — payload dropped: {str(payload)[:300]}")
+            item, carry = _coalesce(item, _send_queue)
+            _post(*item)
+            last_send_ts = _time.monotonic()
         except Exception as e:
-            # 45.M-10: fallback log on exception
-            logger.info(f"[DISCORD] ❌ Send failed ({e}) — payload dropped: {str(payload)[:300]}")
+            carry = None
+            logger.warning(f"[DISCORD] Send worker error: {e}")
 
-    t = threading.Thread(target=_post, daemon=True)
-    t.start()
+
+# PERF-DH-14: started on first _enqueue(), not at import time
+_worker_lock = threading.Lock()
+_worker_thread: Optional[threading.Thread] = None
+
+
+def _ensure_worker() -> None:
+    """
+    Start the discord_sender thread if it is not already running — also
+    after _flush_on_exit() stopped it, so late sends are still posted.
+    """
+    global _worker_thread
+    if _worker_thread is not None and _worker_thread.is_alive():
+        return
+    with _worker_lock:
+        if _worker_thread is None or not _worker_thread.is_alive():
+            t = threading.Thread(target=_discord_worker, daemon=True, name="discord_sender")
+            t.start()
+            _worker_thread = t
+
+
+# PERF-DH-13: upper bound on how long interpreter shutdown waits for Discord
+_EXIT_FLUSH_TIMEOUT_S: float = 5.0
+
+
+def _flush_on_exit() -> None:
+    """
+    Let the worker post whatever is still queued at interpreter exit
+    (PERF-DH-13): queue _STOP behind it and wait for the worker to return.
+    """
+    worker = _worker_thread
+    if worker is None or not worker.is_alive():
+        return   # nothing ever sent, or already stopped — no one to consume _STOP
+    deadline = _time.monotonic() + _EXIT_FLUSH_TIMEOUT_S
+    try:
+        _send_queue.put(_STOP, timeout=_EXIT_FLUSH_TIMEOUT_S)
+    except queue.Full:
+        pass
+    worker.join(max(0.0, deadline - _time.monotonic()))
+    if worker.is_alive():
+        logger.warning(
+            f"[DISCORD] Exit flush timed out — up to {_send_queue.qsize()} payload(s) dropped"
+        )
+
+
+atexit.register(_flush_on_exit)
 
 
 def test_webhook() -> None:
@@ -961,7 +1310,7 @@ def test_webhook() -> None:
 
     def _probe():
         try:
-            r = requests.post(webhook_url, json={"content": "🚀 War Machine Online!"}, timeout=5)
+            r = _session.post(webhook_url, json={"content": "🚀 War Machine Online!"}, timeout=5)
             if r.status_code in (200, 204):
                 logger.info("[DISCORD] ✅ Webhook test OK (%s)", r.status_code)
             else:
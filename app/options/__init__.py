@@ -32,6 +32,12 @@ NOTE (M8, Mar 10 2026): _get_iv_rank() is now wired to iv_tracker.compute_ivr().
 It stores each IV observation to the iv_history table and returns a real
 DB-backed IVR (0-100). Falls back to 50.0 (neutral) while history is still
 accumulating (< MIN_OBSERVATIONS data points) or on any exception.
+
+PERF-OPT-1 (Oct 18 2026): one ET date read per call.
+_select_strike_with_greeks() rebuilt ZoneInfo("America/New_York") and read
+the clock for every contract in the chain and again for every candidate in
+the min() key.  The zone is now resolved once at import (_ET), each call
+pins `today` once, and each distinct exp_date string is parsed once.
 """
 import logging
 import os
@@ -41,6 +47,8 @@ from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
+_ET = ZoneInfo("America/New_York")
+
 # EODHD UnicornBay Options API configuration
 EODHD_API_KEY = os.getenv('EODHD_API_KEY', '')
 EODHD_BASE_URL = 'https://eodhd.com/api/mp/unicornbay'
@@ -92,7 +100,8 @@ def build_options_trade(
     # STEP 2: DETERMINE DTE (DAYS TO EXPIRATION)
     # ═══════════════════════════════════════════════════════════════════
     dte = _calculate_optimal_dte(confidence)
-    target_date = datetime.now(ZoneInfo("America/New_York")).date() + timedelta(days=dte)
+    today = _today_et()
+    target_date = today + timedelta(days=dte)
 
     # ═══════════════════════════════════════════════════════════════════
     # STEP 3: SELECT STRIKE (BASED ON CONFIDENCE)
@@ -133,8 +142,7 @@ def build_options_trade(
     risk_reward = f"1:{2.5}"  # Placeholder - calculate based on targets
 
     # Calculate actual DTE from selected expiration
-    actual_dte = (datetime.strptime(expiration_date, '%Y-%m-%d').date() -
-                  datetime.now(ZoneInfo("America/New_York")).date()).days
+    actual_dte = (datetime.strptime(expiration_date, '%Y-%m-%d').date() - today).days
 
     trade = {
         'ticker': ticker,
@@ -306,14 +314,15 @@ def _select_strike_with_greeks(
     Returns:
         tuple: (strike, greeks_dict, expiration_date)
     """
+    today = _today_et()  # PERF-OPT-1: pinned once for the whole chain
     if not EODHD_API_KEY:
         strike, greeks = _fallback_strike_selection(current_price, direction, target_delta)
-        exp_date = _calculate_fallback_expiration((target_date - datetime.now(ZoneInfo("America/New_York")).date()).days)
+        exp_date = _calculate_fallback_expiration((target_date - today).days)
         return strike, greeks, exp_date
 
     try:
         # Calculate target DTE range
-        target_dte = (target_date - datetime.now(ZoneInfo("America/New_York")).date()).days
+        target_dte = (target_date - today).days
         min_dte = max(1, target_dte - 7)  # Look 7 days before target
         max_dte = target_dte + 7  # Look 7 days after target
 
@@ -352,6 +361,7 @@ def _select_strike_with_greeks(
         # Group by expiration date
         from collections import defaultdict
         by_expiration = defaultdict(list)
+        parsed_exp = {}  # PERF-OPT-1: exp_date string -> date, parsed once
 
         for contract in contracts:
             attrs = contract.get('attributes', {})
@@ -361,8 +371,10 @@ def _select_strike_with_greeks(
                 continue
 
             try:
-                exp_date = datetime.strptime(exp_date_str, '%Y-%m-%d').date()
-                dte = (exp_date - datetime.now(ZoneInfo("America/New_York")).date()).days
+                exp_date = parsed_exp.get(exp_date_str)
+                if exp_date is None:
+                    exp_date = parsed_exp[exp_date_str] = datetime.strptime(exp_date_str, '%Y-%m-%d').date()
+                dte = (exp_date - today).days
 
                 # Only consider valid contracts
                 if dte > 0:
@@ -381,9 +393,9 @@ def _select_strike_with_greeks(
 
         # Find expiration closest to target date
         closest_exp = min(by_expiration.keys(),
-                         key=lambda d: abs((d - datetime.now(ZoneInfo("America/New_York")).date()).days - target_dte))
+                         key=lambda d: abs((d - today).days - target_dte))
 
-        logger.info(f"[OPTIONS] Selected expiration {closest_exp} (target DTE: {target_dte}, actual: {(closest_exp - datetime.now(ZoneInfo('America/New_York')).date()).days})")
+        logger.info(f"[OPTIONS] Selected expiration {closest_exp} (target DTE: {target_dte}, actual: {(closest_exp - today).days})")
 
         # From contracts with closest expiration, find best delta match
         candidates = by_expiration[closest_exp]
@@ -499,9 +511,14 @@ def _fallback_strike_selection(current_price: float, direction: str, target_delt
     return strike, greeks
 
 
+def _today_et():
+    """Current date in America/New_York."""
+    return datetime.now(_ET).date()
+
+
 def _calculate_fallback_expiration(target_dte: int) -> str:
     """Calculate next Friday as fallback expiration."""
-    today = datetime.now(ZoneInfo("America/New_York"))
+    today = datetime.now(_ET)
     target_date = today + timedelta(days=target_dte)
 
     # Round to next Friday
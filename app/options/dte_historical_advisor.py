@@ -5,6 +5,11 @@ Queries positions database to recommend DTE based on historical win rates
 under similar market conditions (hour, ADX, VIX, target distance).
 
 FIXED (Mar 10 2026): All get_conn() calls now use try/finally: return_conn(conn) — no leaks.
+
+PERF-DTE-1 (Oct 18 2026): get_recommendation() no longer pulls every closed
+  trade in the lookback window and buckets/counts them in Python. The
+  current context's bucket bounds go into the WHERE clause and the
+  per-DTE trade/win counts come back from a single GROUP BY dte_selected.
 """
 from typing import Dict
 from datetime import datetime, timedelta
@@ -30,6 +35,13 @@ class DTEHistoricalAdvisor:
             if low <= val < high:
                 return label
         return "UNKNOWN"
+
+    def _bounds(self, val: float, buckets: list):
+        """Return the (low, high) range of the bucket containing val, or None."""
+        for low, high, _label in buckets:
+            if low <= val < high:
+                return low, high
+        return None
     
     def get_recommendation(self, hour_of_day: int, adx: float, vix: float, target_pct: float,
                           direction: str = None, grade: str = None, lookback_days: int = 90) -> Dict:
@@ -40,9 +52,20 @@ class DTEHistoricalAdvisor:
         target_bucket = self._bucket(target_pct, self.target_buckets)
         context = f"{hour_bucket}_{adx_bucket}_{vix_bucket}_{target_bucket}"
         
+        # PERF-DTE-1: filter to the matching context in SQL and aggregate per DTE
+        bounds = [
+            ("CAST(strftime('%H', entry_time) AS INTEGER)", self._bounds(hour_of_day, self.hour_buckets)),
+            ("adx_at_entry",  self._bounds(adx, self.adx_buckets)),
+            ("vix_at_entry",  self._bounds(vix, self.vix_buckets)),
+            ("target_pct_t1", self._bounds(target_pct, self.target_buckets)),
+        ]
+        if any(b is None for _, b in bounds):
+            return {'has_preference': False, 'reason': 'Context outside known buckets',
+                    'context': context, 'confidence': 0.0}
+
         p = ph()
         conn = None
-        trades = []
+        rows = []
         try:
             conn = get_conn(self.db_path)
             cursor = dict_cursor(conn)
@@ -51,6 +74,9 @@ class DTEHistoricalAdvisor:
             where = ["status = 'CLOSED'", f"DATE(exit_time) >= {p}", "dte_selected IS NOT NULL", 
                      "adx_at_entry IS NOT NULL", "vix_at_entry IS NOT NULL", "target_pct_t1 IS NOT NULL"]
             params = [cutoff]
+            for col, (low, high) in bounds:
+                where.append(f"{col} >= {p} AND {col} < {p}")
+                params.extend([low, high])
             if direction:
                 where.append(f"direction = {p}")
                 params.append(direction)
@@ -58,53 +84,54 @@ class DTEHistoricalAdvisor:
                 where.append(f"grade = {p}")
                 params.append(grade)
             
-            query = f"SELECT dte_selected, pnl, adx_at_entry, vix_at_entry, target_pct_t1, CAST(strftime('%H', entry_time) AS INTEGER) as hr FROM positions WHERE {' AND '.join(where)}"
+            query = f"""
+                SELECT dte_selected,
+                       COUNT(*)                                  AS total,
+                       SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) AS wins
+                FROM positions
+                WHERE {' AND '.join(where)}
+                GROUP BY dte_selected
+            """
             cursor.execute(query, tuple(params))
-            trades = cursor.fetchall()
+            rows = cursor.fetchall()
         except Exception as e:
             logger.info(f"[DTE-ADVISOR] DB query error: {e}")
         finally:
             if conn:
                 return_conn(conn)
         
-        if not trades:
+        if not rows:
             return {'has_preference': False, 'reason': 'No historical trades', 'context': context, 'confidence': 0.0}
         
-        # Filter to matching context bucket
-        matching = [t for t in trades if 
-                   self._bucket(t['hr'], self.hour_buckets) == hour_bucket and
-                   self._bucket(t['adx_at_entry'], self.adx_buckets) == adx_bucket and
-                   self._bucket(t['vix_at_entry'], self.vix_buckets) == vix_bucket and
-                   self._bucket(t['target_pct_t1'], self.target_buckets) == target_bucket]
+        by_dte = {r['dte_selected']: (r['total'], r['wins'] or 0) for r in rows}
+        sample_size = sum(total for total, _ in by_dte.values())
         
-        if len(matching) < self.min_sample_size:
-            return {'has_preference': False, 'reason': f'Insufficient data ({len(matching)}/{self.min_sample_size})', 
+        if sample_size < self.min_sample_size:
+            return {'has_preference': False, 'reason': f'Insufficient data ({sample_size}/{self.min_sample_size})', 
                     'context': context, 'confidence': 0.0}
         
-        dte0 = [t for t in matching if t['dte_selected'] == 0]
-        dte1 = [t for t in matching if t['dte_selected'] == 1]
-        if not dte0 or not dte1:
+        if 0 not in by_dte or 1 not in by_dte:
             return {'has_preference': False, 'reason': 'Missing DTE comparison', 'context': context, 'confidence': 0.0}
         
-        wr0 = sum(1 for t in dte0 if t['pnl'] > 0) / len(dte0) * 100
-        wr1 = sum(1 for t in dte1 if t['pnl'] > 0) / len(dte1) * 100
+        wr0 = by_dte[0][1] / by_dte[0][0] * 100
+        wr1 = by_dte[1][1] / by_dte[1][0] * 100
         
         if abs(wr0 - wr1) < 5.0:
             return {'has_preference': False, 'reason': f'Win rates too close ({wr0:.1f}% vs {wr1:.1f}%)', 
                     'context': context, 'confidence': 0.0}
         
         rec = 0 if wr0 > wr1 else 1
-        conf = min(100, (len(matching) / self.min_sample_size) * 75 + min(25, abs(wr0 - wr1)))
+        conf = min(100, (sample_size / self.min_sample_size) * 75 + min(25, abs(wr0 - wr1)))
         
         return {
             'has_preference': True, 
             'recommended_dte': rec, 
             'win_rate_0dte': round(wr0, 1),
             'win_rate_1dte': round(wr1, 1), 
-            'sample_size': len(matching), 
+            'sample_size': sample_size, 
             'confidence': round(conf, 1), 
             'context': context,
-            'reason': f"{rec}DTE wins {max(wr0,wr1):.1f}% in {context} (n={len(matching)})"
+            'reason': f"{rec}DTE wins {max(wr0,wr1):.1f}% in {context} (n={sample_size})"
         }
 
 try:
@@ -30,14 +30,99 @@ Signal multiplier logic:
   Positive GEX + pin is headwind  : ×0.92  (price pulled AWAY from target)
   Positive GEX + neutral          : ×0.97  (suppressed vol / pinning environment)
   No gamma data in chain          : ×1.00  (neutral, no penalty)
+
+PERF-GEX-1 (Oct 18 2026):
+  compute_gex_levels() collects (strike, gamma, OI, ±1) in one flat pass over
+  the chain, then masks zero gamma/OI, computes every contribution and sums
+  per strike with numpy (np.unique + np.add.at) instead of a dict update per
+  option. Contributions are accumulated in the same order as before, so the
+  per-strike totals are bit-for-bit identical.
+
+PERF-GEX-2 (Oct 18 2026):
+  gamma_pin / gamma_flip / total_gex / top levels are derived from the
+  strike-sorted numpy arrays (argmax, one cumsum, one stable argsort)
+  instead of a dict comprehension plus two sorted() passes. Rounding is
+  unchanged; exact-GEX ties resolve to the lower strike (gex_by_strike is
+  now strike-ordered rather than chain-ordered).
+
+PERF-GEX-3 (Oct 18 2026):
+  The per-strike aggregation is factored into _aggregate(): one stable
+  argsort, a boundary scan for the segments and np.bincount for the
+  segmented sum, replacing np.unique(return_inverse) + np.add.at (the
+  slowest step, unbuffered). bincount adds in index order and the stable
+  sort keeps chain order inside each strike, so totals stay bit-identical.
+  No JIT: numba is not a dependency and the arrays are a few thousand
+  elements, where the sort dominates.
+
+PERF-GEX-4 (Oct 18 2026):
+  Expirations where no quote carries a gamma value are skipped before the
+  per-side arrays are built (far-dated / illiquid expiries). EODHD also
+  nulls Greeks per contract (deep OTM, zero bid), so the check scans for
+  any non-null gamma rather than trusting the first quote; it stops at the
+  first hit. Null gammas that remain count as 0 and are masked out in
+  _aggregate().
+
+PERF-GEX-5 (Oct 18 2026):
+  compute_gex_levels() returns a GEXLevels NamedTuple instead of an 8-key
+  dict; consumers read gex.gamma_pin etc. by attribute. Use ._asdict() where
+  a plain dict is needed.
+
+PERF-GEX-6 (Oct 18 2026):
+  The chain is flattened per expiration side with np.fromiter (strike keys,
+  gamma, OI) instead of a per-option Python loop with float() and four list
+  appends; the side arrays are concatenated once. Missing gamma/OI become
+  0 and fall out in _aggregate()'s mask, same as before.
 """
-from typing import Dict, List, Optional, Tuple
+from itertools import chain
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
 
 CONTRACT_SIZE = 100   # standard US equity options contract multiplier
 
 
+class GEXLevels(NamedTuple):
+    """Output of compute_gex_levels() — see its docstring for the fields."""
+    has_data:      bool
+    gex_by_strike: Dict[float, float]
+    total_gex:     float
+    gamma_pin:     Optional[float]
+    gamma_flip:    Optional[float]
+    neg_gex_zone:  bool
+    top_positive:  List[Tuple[float, float]]
+    top_negative:  List[Tuple[float, float]]
+
+
+def _no_gex_data() -> GEXLevels:
+    return GEXLevels(
+        has_data=False, gex_by_strike={}, total_gex=0.0,
+        gamma_pin=None, gamma_flip=None, neg_gex_zone=False,
+        top_positive=[], top_negative=[],
+    )
+
+
+def _aggregate(strikes: np.ndarray, gammas: np.ndarray, ois: np.ndarray,
+               signs: np.ndarray, price: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Net GEX per strike. Returns (unique_strikes ascending, totals); both are
+    empty when no option has non-zero gamma and OI.
+    """
+    mask = (gammas != 0) & (ois != 0)
+    contrib = gammas[mask] * ois[mask] * CONTRACT_SIZE * price * signs[mask]
+    if not contrib.size:
+        return contrib, contrib
+    order      = np.argsort(strikes[mask], kind="stable")
+    sorted_k   = strikes[mask][order]
+    new_strike = np.empty(sorted_k.size, dtype=bool)
+    new_strike[0]  = True
+    new_strike[1:] = sorted_k[1:] != sorted_k[:-1]
+    segment = np.cumsum(new_strike) - 1
+    totals  = np.bincount(segment, weights=contrib[order])
+    return sorted_k[new_strike], totals
+
+
 # ─────────────────────────────────────────────────────────────
-def compute_gex_levels(chain_data: dict, current_price: float) -> dict:
+def compute_gex_levels(chain_data: dict, current_price: float) -> GEXLevels:
     """
     Compute Gamma Exposure at every strike in the options chain.
 
@@ -45,7 +130,7 @@ def compute_gex_levels(chain_data: dict, current_price: float) -> dict:
       chain_data    : raw EODHD chain dict (chain_data["data"][expiry][calls/puts][strike])
       current_price : current stock price (used for GEX formula and zone detection)
 
-    Returns a dict with keys:
+    Returns a GEXLevels with fields:
       has_data      : bool  — False if no options had a valid gamma field
       gex_by_strike : {float_strike: float_gex}  — net GEX per strike (all expirations summed)
       total_gex     : float — sum of all per-strike GEX values
@@ -55,92 +140,95 @@ def compute_gex_levels(chain_data: dict, current_price: float) -> dict:
       top_positive  : list of (strike, gex) tuples, sorted desc, up to 5
       top_negative  : list of (strike, gex) tuples, sorted asc (most negative first), up to 5
     """
-    gex_by_strike: Dict[float, float] = {}
-    gamma_field_found = False
-
-    for expiration_date, options_data in chain_data.get("data", {}).items():
-
-        # ── Calls ───────────────────────────────────────────────────────────
-        for strike_str, option in options_data.get("calls", {}).items():
-            gamma = option.get("gamma")
-            oi    = option.get("openInterest", 0) or 0
-            if gamma is None or gamma == 0 or oi == 0:
+    # ── PERF-GEX-1 / PERF-GEX-6: per-side arrays, then vectorized contributions ──
+    strike_parts: List[np.ndarray] = []
+    gamma_parts:  List[np.ndarray] = []
+    oi_parts:     List[np.ndarray] = []
+    sign_parts:   List[np.ndarray] = []
+
+    for options_data in chain_data.get("data", {}).values():
+        calls = options_data.get("calls", {})
+        puts  = options_data.get("puts", {})
+        # PERF-GEX-4: skip expirations with no gamma on any contract
+        if not any(q.get("gamma") is not None
+                   for q in chain(calls.values(), puts.values())):
+            continue
+        # Puts subtract from GEX (dealer is long put = short gamma exposure to market)
+        for side_data, sign in ((calls, 1.0), (puts, -1.0)):
+            n = len(side_data)
+            if not n:
                 continue
-            gamma_field_found = True
-            strike = float(strike_str)
-            contribution = float(gamma) * oi * CONTRACT_SIZE * current_price
-            gex_by_strike[strike] = gex_by_strike.get(strike, 0.0) + contribution
-
-        # ── Puts ───────────────────────────────────────────────────────────
-        for strike_str, option in options_data.get("puts", {}).items():
-            gamma = option.get("gamma")
-            oi    = option.get("openInterest", 0) or 0
-            if gamma is None or gamma == 0 or oi == 0:
-                continue
-            gamma_field_found = True
-            strike = float(strike_str)
-            # Puts subtract from GEX (dealer is long put = short gamma exposure to market)
-            contribution = float(gamma) * oi * CONTRACT_SIZE * current_price
-            gex_by_strike[strike] = gex_by_strike.get(strike, 0.0) - contribution
-
-    if not gamma_field_found or not gex_by_strike:
-        return {
-            "has_data": False, "gex_by_strike": {}, "total_gex": 0.0,
-            "gamma_pin": None, "gamma_flip": None, "neg_gex_zone": False,
-            "top_positive": [], "top_negative": []
-        }
+            quotes = side_data.values()
+            strike_parts.append(np.fromiter(map(float, side_data), dtype=np.float64, count=n))
+            gamma_parts.append(np.fromiter(
+                (q.get("gamma") or 0.0 for q in quotes), dtype=np.float64, count=n))
+            oi_parts.append(np.fromiter(
+                (q.get("openInterest") or 0 for q in quotes), dtype=np.float64, count=n))
+            sign_parts.append(np.full(n, sign))
+
+    if not strike_parts:
+        return _no_gex_data()
+
+    uniq, totals = _aggregate(
+        np.concatenate(strike_parts), np.concatenate(gamma_parts),
+        np.concatenate(oi_parts), np.concatenate(sign_parts), current_price,
+    )
+    if not uniq.size:
+        return _no_gex_data()
+    gex_by_strike: Dict[float, float] = dict(zip(uniq.tolist(), totals.tolist()))
+
+    # ── PERF-GEX-2: pin / flip / top levels straight off the sorted arrays ──
+    # _aggregate() returns strikes ascending (stable argsort + segmented
+    # bincount), so one cumsum covers the flip and one stable argsort covers
+    # both top-N lists.
+    positive = totals > 0
 
     # ── Gamma pin ─────────────────────────────────────────────────────────
-    positive_strikes = {s: g for s, g in gex_by_strike.items() if g > 0}
-    gamma_pin = max(positive_strikes, key=positive_strikes.get) if positive_strikes else None
+    gamma_pin = (
+        float(uniq[np.argmax(np.where(positive, totals, -np.inf))])
+        if positive.any() else None
+    )
 
     # ── Gamma flip (zero-crossing in cumulative GEX sorted by strike) ────────────
-    sorted_strikes = sorted(gex_by_strike.keys())
-    cumulative     = 0.0
-    gamma_flip     = None
-    prev_strike    = None
-    prev_cum       = 0.0
-
-    for strike in sorted_strikes:
-        cumulative += gex_by_strike[strike]
-        if prev_strike is not None and prev_cum * cumulative < 0:
-            # Linear interpolation of zero-crossing between prev_strike and strike
-            gamma_flip = prev_strike + (strike - prev_strike) * (
-                abs(prev_cum) / (abs(prev_cum) + abs(cumulative))
-            )
-            gamma_flip = round(gamma_flip, 2)
-            break
-        prev_strike = strike
-        prev_cum    = cumulative
-
-    # If no zero-crossing found, use the strike closest to current_price
-    if gamma_flip is None:
-        gamma_flip = min(gex_by_strike.keys(),
-                         key=lambda s: abs(s - current_price))
-        gamma_flip = round(gamma_flip, 2)
+    cumulative = np.cumsum(totals)
+    crossings  = np.flatnonzero(cumulative[:-1] * cumulative[1:] < 0)
+    if crossings.size:
+        i = int(crossings[0])
+        prev_strike, strike = float(uniq[i]), float(uniq[i + 1])
+        prev_cum, cum       = float(cumulative[i]), float(cumulative[i + 1])
+        # Linear interpolation of zero-crossing between prev_strike and strike
+        gamma_flip = round(prev_strike + (strike - prev_strike) * (
+            abs(prev_cum) / (abs(prev_cum) + abs(cum))
+        ), 2)
+    else:
+        # No zero-crossing found — use the strike closest to current_price
+        gamma_flip = round(float(uniq[np.argmin(np.abs(uniq - current_price))]), 2)
 
     neg_gex_zone = (gamma_flip is not None) and (current_price < gamma_flip)
-    total_gex    = sum(gex_by_strike.values())
+    total_gex    = float(cumulative[-1])
 
     # ── Top levels ───────────────────────────────────────────────────────────
-    sorted_by_gex = sorted(gex_by_strike.items(), key=lambda x: x[1], reverse=True)
-    top_positive  = [(s, round(g, 0)) for s, g in sorted_by_gex if g > 0][:5]
-    top_negative  = [(s, round(g, 0)) for s, g in sorted_by_gex if g < 0][-5:][::-1]
-
-    return {
-        "has_data":      True,
-        "gex_by_strike": gex_by_strike,
-        "total_gex":     round(total_gex, 0),
-        "gamma_pin":     gamma_pin,
-        "gamma_flip":    gamma_flip,
-        "neg_gex_zone":  neg_gex_zone,
-        "top_positive":  top_positive,
-        "top_negative":  top_negative
-    }
+    order      = np.argsort(-totals, kind="stable")
+    by_gex     = totals[order]
+    pos_idx    = order[by_gex > 0][:5]
+    neg_idx    = order[by_gex < 0][-5:][::-1]
+    top_positive = [(s, round(g, 0)) for s, g in zip(uniq[pos_idx].tolist(), totals[pos_idx].tolist())]
+    top_negative = [(s, round(g, 0)) for s, g in zip(uniq[neg_idx].tolist(), totals[neg_idx].tolist())]
+
+    return GEXLevels(
+        has_data      = True,
+        gex_by_strike = gex_by_strike,
+        total_gex     = round(total_gex, 0),
+        gamma_pin     = gamma_pin,
+        gamma_flip    = gamma_flip,
+        neg_gex_zone  = neg_gex_zone,
+        top_positive  = top_positive,
+        top_negative  = top_negative,
+    )
 
 
 # ─────────────────────────────────────────────────────────────
-def get_gex_signal_context(gex_data: dict, direction: str,
+def get_gex_signal_context(gex_data: GEXLevels, direction: str,
                            entry_price: float,
                            stop_price: float,
                            target_price: float) -> Tuple[float, str, dict]:
@@ -157,12 +245,12 @@ def get_gex_signal_context(gex_data: dict, direction: str,
     Returns:
       (multiplier: float, label: str, context: dict)
     """
-    if not gex_data.get("has_data"):
+    if not gex_data.has_data:
         return 1.0, "GEX-NO-DATA", {}
 
-    gamma_pin    = gex_data["gamma_pin"]
-    gamma_flip   = gex_data["gamma_flip"]
-    neg_gex_zone = gex_data["neg_gex_zone"]
+    gamma_pin    = gex_data.gamma_pin
+    gamma_flip   = gex_data.gamma_flip
+    neg_gex_zone = gex_data.neg_gex_zone
 
     multiplier = 1.0
     tags       = []
@@ -23,8 +23,49 @@ Data lifecycle:
   - compute_ivr() uses the last LOOKBACK_DAYS days of stored observations
   - Requires MIN_OBSERVATIONS before producing a reliable IVR (else returns neutral)
   - DB table: iv_history (ticker TEXT, iv REAL, recorded_at TIMESTAMP)
+
+PERF-IV-1 (Oct 18 2026):
+  - iv_history DDL (CREATE TABLE / CREATE INDEX IF NOT EXISTS) moved out of
+    store_iv_observation() into _ensure_iv_history_table(), run once, on
+    the first flush or IVR query rather than at import (importing the
+    module opens no DB connection, so it creates no SQLite file). Each
+    observation is now a single INSERT; a failed DDL is retried on the
+    next flush / query.
+
+PERF-IV-2 (Oct 18 2026):
+  - store_iv_observation() appends to an in-process buffer; the buffer is
+    written with one execute_many() + commit once IV_FLUSH_BATCH rows are
+    pending or IV_FLUSH_INTERVAL_S has passed since the last flush (checked
+    on append), and at interpreter exit. A scan pass becomes a handful of
+    transactions instead of one per best-strike.
+  - recorded_at keeps the DB-side CURRENT_TIMESTAMP default, so stamps are
+    flush time — at most a few seconds late against a 30-day lookback.
+  - compute_ivr() folds this ticker's still-buffered observations into the
+    DB min/max/count, so the store-then-rank sequence used by every caller
+    sees the value it just stored. A DB with no rows for the ticker now
+    returns (None, 0, False) without logging a compute error.
+
+PERF-IV-3 (Oct 18 2026):
+  - compute_ivr_batch() ranks many tickers with one
+    SELECT ticker, MIN, MAX, COUNT ... WHERE ticker IN (...) GROUP BY ticker
+    instead of one compute_ivr() query per ticker. Both paths share
+    _rank_from_stats(), so results (including buffered observations) are
+    identical to calling compute_ivr() in a loop.
+
+PERF-IV-4 (Oct 18 2026):
+  - The DB (min, max, count) triple per (ticker, lookback) is cached for
+    IVR_STATS_TTL_S in a small LRU (IVR_STATS_CACHE_MAX entries). Repeat
+    compute_ivr()/compute_ivr_batch() calls within a scan cycle skip the
+    query and only redo the rank arithmetic. Buffered observations are
+    still merged on every call, and a flush drops the cached triples for
+    the tickers it wrote, so a stored IV is never missed.
 """
+import atexit
+import threading
+from collections import OrderedDict
+import time
 from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
 from zoneinfo import ZoneInfo
 import logging
 logger = logging.getLogger(__name__)
@@ -32,26 +73,61 @@ logger = logging.getLogger(__name__)
 MIN_OBSERVATIONS = 10   # data points required before IVR is considered reliable
 LOOKBACK_DAYS    = 30   # rolling lookback window for min/max IV computation
 
+# PERF-IV-2: buffered writes
+IV_FLUSH_BATCH      = 50    # flush once this many observations are pending
+IV_FLUSH_INTERVAL_S = 5.0   # ...or this long after the previous flush
+
+_iv_buf: List[Tuple[str, float]] = []
+_iv_buf_lock   = threading.Lock()
+_iv_last_flush = time.monotonic()
+
+
+# PERF-IV-4: short-lived cache of DB (min_iv, max_iv, count) per (ticker, lookback)
+IVR_STATS_TTL_S     = 60.0
+IVR_STATS_CACHE_MAX = 512
+
+_ivr_stats: "OrderedDict[tuple, tuple]" = OrderedDict()   # key -> (expires_at, row)
+_ivr_stats_lock = threading.Lock()
+
+
+def _stats_get(key: tuple):
+    """Return the cached DB row for key, or None if missing/expired."""
+    with _ivr_stats_lock:
+        hit = _ivr_stats.get(key)
+        if hit is None:
+            return None
+        if hit[0] < time.monotonic():
+            del _ivr_stats[key]
+            return None
+        _ivr_stats.move_to_end(key)
+        return hit[1]
+
+
+def _stats_put(key: tuple, row) -> None:
+    with _ivr_stats_lock:
+        _ivr_stats[key] = (time.monotonic() + IVR_STATS_TTL_S, row)
+        _ivr_stats.move_to_end(key)
+        while len(_ivr_stats) > IVR_STATS_CACHE_MAX:
+            _ivr_stats.popitem(last=False)
+
+
+def _stats_invalidate(tickers) -> None:
+    with _ivr_stats_lock:
+        for key in [k for k in _ivr_stats if k[0] in tickers]:
+            del _ivr_stats[key]
+
 
 def _now_et() -> datetime:
     return datetime.now(ZoneInfo("America/New_York"))
 
 
-def store_iv_observation(ticker: str, iv: float) -> None:
-    """
-    Persist a single IV observation to the iv_history table.
-
-    Called from options_filter.py whenever a valid best-strike is found.
-    Silent no-op if iv is zero/None or if DB is unavailable.
-    """
-    if not iv or iv <= 0:
-        return
-    from app.data.db_connection import get_conn, return_conn, ph, serial_pk
+def _ensure_iv_history_table() -> None:
+    global _iv_table_ready
+    from app.data.db_connection import get_conn, return_conn, serial_pk
     conn = None
     try:
         conn   = get_conn()
         cursor = conn.cursor()
-        p      = ph()
         cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS iv_history (
                 id          {serial_pk()},
@@ -64,15 +140,72 @@ def store_iv_observation(ticker: str, iv: float) -> None:
             CREATE INDEX IF NOT EXISTS idx_iv_history_ticker_time
             ON iv_history (ticker, recorded_at)
         """)
-        cursor.execute(
+        conn.commit()
+        _iv_table_ready = True
+    except Exception as e:
+        logger.warning(f"[IVR] iv_history init error (non-fatal): {e}")
+    finally:
+        return_conn(conn)
+
+
+_iv_table_ready = False   # set by the first successful _ensure_iv_history_table()
+
+
+def store_iv_observation(ticker: str, iv: float) -> None:
+    """
+    Queue a single IV observation for the iv_history table.
+
+    Called from options_filter.py whenever a valid best-strike is found.
+    Silent no-op if iv is zero/None. Written in batches (PERF-IV-2).
+    """
+    if not iv or iv <= 0:
+        return
+    with _iv_buf_lock:
+        _iv_buf.append((ticker, round(iv, 6)))
+        due = (len(_iv_buf) >= IV_FLUSH_BATCH
+               or time.monotonic() - _iv_last_flush >= IV_FLUSH_INTERVAL_S)
+    if due:
+        flush_iv_observations()
+
+
+def flush_iv_observations() -> int:
+    """
+    Write all buffered observations in one transaction. Returns the number
+    written (0 on error — the batch is dropped and logged, as a failed
+    single-row store was before).
+    """
+    global _iv_last_flush
+    with _iv_buf_lock:
+        rows = _iv_buf[:]
+        _iv_buf.clear()
+        _iv_last_flush = time.monotonic()
+    if not rows:
+        return 0
+    if not _iv_table_ready:
+        _ensure_iv_history_table()
+
+    from app.data.db_connection import get_conn, return_conn, ph, execute_many
+    conn = None
+    try:
+        conn = get_conn()
+        p    = ph()
+        execute_many(
+            conn.cursor(),
             f"INSERT INTO iv_history (ticker, iv) VALUES ({p}, {p})",
-            (ticker, round(iv, 6))
+            rows,
         )
         conn.commit()
+        return len(rows)
     except Exception as e:
-        logger.warning(f"[IVR] store error for {ticker}: {e}")
+        logger.warning(f"[IVR] flush error ({len(rows)} observations dropped): {e}")
+        return 0
     finally:
         return_conn(conn)
+        # PERF-IV-4: these rows left the buffer — cached DB stats no longer cover them
+        _stats_invalidate({t for t, _ in rows})
+
+
+atexit.register(flush_iv_observations)
 
 
 def compute_ivr(ticker: str, current_iv: float,
@@ -93,45 +226,143 @@ def compute_ivr(ticker: str, current_iv: float,
     from app.data.db_connection import get_conn, return_conn, ph
     conn = None
     try:
-        conn   = get_conn()
-        cursor = conn.cursor()
-        p      = ph()
-
-        cutoff = _now_et() - timedelta(days=lookback_days)
-
-        cursor.execute(
-            f"""
-            SELECT MIN(iv), MAX(iv), COUNT(*)
-            FROM   iv_history
-            WHERE  ticker      = {p}
-              AND  recorded_at >= {p}
-              AND  iv          > 0
-            """,
-            (ticker, cutoff)
-        )
-        row = cursor.fetchone()
+        key = (ticker, lookback_days)
+        row = _stats_get(key)   # PERF-IV-4
+        if row is None:
+            if not _iv_table_ready:
+                _ensure_iv_history_table()
+            conn   = get_conn()
+            cursor = conn.cursor()
+            p      = ph()
 
-        if not row or row[2] is None:
-            return None, 0, False
+            cutoff = _now_et() - timedelta(days=lookback_days)
 
-        min_iv, max_iv, count = float(row[0]), float(row[1]), int(row[2])
-
-        if count < MIN_OBSERVATIONS:
-            return None, count, False
+            cursor.execute(
+                f"""
+                SELECT MIN(iv), MAX(iv), COUNT(*)
+                FROM   iv_history
+                WHERE  ticker      = {p}
+                  AND  recorded_at >= {p}
+                  AND  iv          > 0
+                """,
+                (ticker, cutoff)
+            )
+            row = tuple(cursor.fetchone() or (None, None, 0))
+            _stats_put(key, row)
 
-        if max_iv <= min_iv:
-            # Flat IV history – assign neutral rank
-            return 50.0, count, True
+        # PERF-IV-2: include observations still waiting in the write buffer
+        with _iv_buf_lock:
+            pending = [v for t, v in _iv_buf if t == ticker]
 
-        ivr = ((current_iv - min_iv) / (max_iv - min_iv)) * 100.0
-        ivr = max(0.0, min(100.0, ivr))
-        return round(ivr, 1), count, True
+        return _rank_from_stats(current_iv, row, pending)
 
     except Exception as e:
         logger.warning(f"[IVR] compute error for {ticker}: {e}")
         return None, 0, False
     finally:
-        return_conn(conn)
+        if conn:
+            return_conn(conn)
+
+
+def _rank_from_stats(current_iv: float, row, pending: List[float]) -> tuple:
+    """
+    Turn a DB (min_iv, max_iv, count) row plus still-buffered observations
+    into the compute_ivr() result tuple.
+    """
+    count = int(row[2] or 0) if row else 0
+    if count:
+        min_iv, max_iv = float(row[0]), float(row[1])
+        if pending:
+            min_iv = min(min_iv, min(pending))
+            max_iv = max(max_iv, max(pending))
+    elif pending:
+        min_iv, max_iv = min(pending), max(pending)
+    else:
+        return None, 0, False
+    count += len(pending)
+
+    if count < MIN_OBSERVATIONS:
+        return None, count, False
+
+    if max_iv <= min_iv:
+        # Flat IV history – assign neutral rank
+        return 50.0, count, True
+
+    ivr = ((current_iv - min_iv) / (max_iv - min_iv)) * 100.0
+    ivr = max(0.0, min(100.0, ivr))
+    return round(ivr, 1), count, True
+
+
+def compute_ivr_batch(current_ivs: Dict[str, float],
+                      lookback_days: int = LOOKBACK_DAYS) -> Dict[str, tuple]:
+    """
+    compute_ivr() for many tickers with a single grouped query (PERF-IV-3).
+
+    Args:
+      current_ivs: {ticker: current_iv}
+
+    Returns:
+      {ticker: (ivr, observations, is_reliable)} for every input ticker.
+      Tickers with a missing/zero current IV get (None, 0, False); on a DB
+      error every ticker does.
+    """
+    results = {t: (None, 0, False) for t in current_ivs}
+    tickers = [t for t, iv in current_ivs.items() if iv and iv > 0]
+    if not tickers:
+        return results
+
+    from app.data.db_connection import get_conn, return_conn, ph
+    conn = None
+    try:
+        # PERF-IV-4: only query tickers without a fresh cached triple
+        stats = {}
+        for t in tickers:
+            row = _stats_get((t, lookback_days))
+            if row is not None:
+                stats[t] = row
+        misses = [t for t in tickers if t not in stats]
+
+        if misses:
+            if not _iv_table_ready:
+                _ensure_iv_history_table()
+            conn   = get_conn()
+            cursor = conn.cursor()
+            p      = ph()
+
+            cutoff = _now_et() - timedelta(days=lookback_days)
+            in_list = ", ".join([p] * len(misses))
+
+            cursor.execute(
+                f"""
+                SELECT ticker, MIN(iv), MAX(iv), COUNT(*)
+                FROM   iv_history
+                WHERE  ticker      IN ({in_list})
+                  AND  recorded_at >= {p}
+                  AND  iv          > 0
+                GROUP  BY ticker
+                """,
+                (*misses, cutoff)
+            )
+            fetched = {r[0]: tuple(r[1:]) for r in cursor.fetchall()}
+            for t in misses:
+                stats[t] = fetched.get(t, (None, None, 0))
+                _stats_put((t, lookback_days), stats[t])
+
+        pending: Dict[str, List[float]] = {}
+        with _iv_buf_lock:
+            for t, v in _iv_buf:
+                pending.setdefault(t, []).append(v)
+
+        for t in tickers:
+            results[t] = _rank_from_stats(current_ivs[t], stats.get(t), pending.get(t, []))
+        return results
+
+    except Exception as e:
+        logger.warning(f"[IVR] batch compute error ({len(tickers)} tickers): {e}")
+        return {t: (None, 0, False) for t in current_ivs}
+    finally:
+        if conn:
+            return_conn(conn)
 
 
 def ivr_to_confidence_multiplier(ivr, is_reliable: bool) -> tuple:
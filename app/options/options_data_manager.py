@@ -54,6 +54,10 @@ Usage:
 
     odm = OptionsDataManager()
     chain = odm.get_optimized_chain(ticker="NVDA", direction="CALL", for_0dte=True)
+
+PERF-ODM-1 (Oct 18 2026): contract fetches reuse a module-level keep-alive
+requests.Session instead of opening a new TCP + TLS connection per call.
+No adapter-level retries: the fetch loop already retries 3 times itself.
 """
 import logging
 import os
@@ -64,6 +68,8 @@ from typing import Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 from collections import defaultdict
 
+from utils.http import make_session
+
 logger = logging.getLogger(__name__)
 
 # EODHD Configuration
@@ -71,6 +77,9 @@ EODHD_API_KEY = os.getenv('EODHD_API_KEY', '')
 EODHD_BASE_URL = 'https://eodhd.com/api/mp/unicornbay'
 REQUEST_TIMEOUT = 30
 
+# PERF-ODM-1: keep-alive connections to eodhd.com
+_session = make_session(pool_maxsize=10)
+
 # Cache Configuration
 CACHE_TTL = 60  # 60 seconds cache for Greeks during rapid scanning
 
@@ -191,7 +200,7 @@ class OptionsDataManager:
                     'api_token': EODHD_API_KEY
                 }
 
-                response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
+                response = _session.get(url, params=params, timeout=REQUEST_TIMEOUT)   # PERF-ODM-1
                 response.raise_for_status()
                 data = response.json()
 
@@ -25,7 +25,11 @@ validate_for_trading() return schema:
   reason:             str   - Concise pass/fail (e.g. GEX-NEG|IVR-32|OI-1200|VOL-450)
   gex_context:        str   - One-line GEX summary (e.g. GEX-NEG|PIN-$225|FLIP-$218)
   tradeable_warnings: list  - Soft flags present even when tradeable=True
-  gex_data:           dict  - Full GEX levels dict (None only if chain unavailable)
+  gex_data:           GEXLevels - gex_engine.GEXLevels NamedTuple, read by
+                                  attribute (None only if chain unavailable):
+                                  has_data, gex_by_strike, total_gex,
+                                  gamma_pin, gamma_flip, neg_gex_zone,
+                                  top_positive, top_negative
   ivr_data:           dict  - IV rank dict (None if unavailable)
 
 Performance:
@@ -39,6 +43,13 @@ FIX #20 (Mar 27 2026): UOA scoring was completely dead in production.
   both callers passed None, so every call early-returned 0.0. Fixed by
   computing chain-relative median baselines before each scan loop and passing
   them per-contract. UOA detection is now fully operational.
+
+PERF-OI-1 (Oct 18 2026): get_chain() held self._lock across the EODHD
+  chain request (~200ms), so one ticker's cache miss blocked every other
+  thread's chain, score, GEX and IVR lookups — even pure cache hits. The
+  HTTP fetch now runs outside the lock; only the cache read and write are
+  locked, so concurrent callers overlap their network waits. Two threads
+  missing the same ticker at once may both fetch; the later write wins.
 """
 
 import logging
@@ -120,31 +131,34 @@ class OptionsIntelligence:
                 if age < self.cache_ttl:
                     return cached['data']
 
+        # PERF-OI-1: network fetch outside the lock
+        chain = None
+        try:
+            from app.validation.validation import get_options_filter
+            # PERF-OF-6: this cache is the only layer here — always fetch
+            # (refreshing OptionsFilter's cache for find_best_strike)
+            chain = get_options_filter().get_options_chain(ticker, use_cache=False)
+        except Exception as e:
+            logger.info(f"[OPTIONS-DM] Chain fetch error for {ticker}: {e}")
             chain = None
-            try:
-                from app.validation.validation import OptionsFilter
-                _filter = OptionsFilter()
-                chain = _filter.get_options_chain(ticker)
-            except Exception as e:
-                logger.info(f"[OPTIONS-DM] Chain fetch error for {ticker}: {e}")
-                chain = None
-
-            if chain:
-                if ticker in self._chain_cache:
-                    self._prev_chains[ticker] = self._chain_cache[ticker]['data']
-                
-                self._chain_cache[ticker] = {
-                    'data': chain,
-                    'timestamp': now
-                }
-                
-                self._score_cache.pop(ticker, None)
-                self._gex_cache.pop(ticker, None)
-                self._uoa_cache.pop(ticker, None)
-                
-                return chain
-            
+
+        if not chain:
             return None
+
+        with self._lock:
+            if ticker in self._chain_cache:
+                self._prev_chains[ticker] = self._chain_cache[ticker]['data']
+
+            self._chain_cache[ticker] = {
+                'data': chain,
+                'timestamp': now
+            }
+
+            self._score_cache.pop(ticker, None)
+            self._gex_cache.pop(ticker, None)
+            self._uoa_cache.pop(ticker, None)
+
+        return chain
     
     # ══════════════════════════════════════════════════════════════════════
     # SCANNER INTEGRATION: Fast Options Scoring
@@ -276,10 +290,10 @@ class OptionsIntelligence:
 
         gex_context_parts = []
 
-        if gex_data.get('has_data'):
-            pin      = gex_data.get('gamma_pin')
-            flip     = gex_data.get('gamma_flip')
-            neg_zone = gex_data.get('neg_gex_zone', False)
+        if gex_data.has_data:
+            pin      = gex_data.gamma_pin
+            flip     = gex_data.gamma_flip
+            neg_zone = gex_data.neg_gex_zone
 
             gex_context_parts.append('GEX-NEG' if neg_zone else 'GEX-POS')
             if pin:
@@ -374,23 +388,23 @@ class OptionsIntelligence:
             return {'has_data': False}
         
         gex_data = compute_gex_levels(chain, current_price)
-        if not gex_data['has_data']:
+        if not gex_data.has_data:
             return {'has_data': False}
         
-        pin  = gex_data['gamma_pin']
-        flip = gex_data['gamma_flip']
+        pin  = gex_data.gamma_pin
+        flip = gex_data.gamma_flip
         
         result = {
             'has_data': True,
             'gamma_pin': pin,
             'gamma_flip': flip,
-            'neg_gex_zone': gex_data['neg_gex_zone'],
-            'zone': 'NEGATIVE' if gex_data['neg_gex_zone'] else 'POSITIVE',
+            'neg_gex_zone': gex_data.neg_gex_zone,
+            'zone': 'NEGATIVE' if gex_data.neg_gex_zone else 'POSITIVE',
             'pin_distance': ((pin - current_price) / current_price) * 100 if pin else None,
             'pin_headwind': False,
-            'total_gex': gex_data['total_gex'],
-            'top_positive': gex_data['top_positive'],
-            'top_negative': gex_data['top_negative']
+            'total_gex': gex_data.total_gex,
+            'top_positive': gex_data.top_positive,
+            'top_negative': gex_data.top_negative
         }
         
         with self._lock:
@@ -597,17 +611,17 @@ class OptionsIntelligence:
     def _compute_gex_score(self, ticker: str, chain: Dict, current_price: float) -> Dict:
         """Compute GEX favorability score (0-25 points)."""
         gex_data = compute_gex_levels(chain, current_price)
-        if not gex_data['has_data']:
+        if not gex_data.has_data:
             return {'score': 0.0, 'reason': 'No GEX data'}
         
         score   = 0.0
         factors = []
         
-        if gex_data['neg_gex_zone']:
+        if gex_data.neg_gex_zone:
             score += 15
             factors.append('NEG-GEX-ZONE')
         
-        pin = gex_data['gamma_pin']
+        pin = gex_data.gamma_pin
         if pin:
             if pin > current_price * 1.01:
                 score += 10
@@ -620,8 +634,8 @@ class OptionsIntelligence:
             'score': min(score, 25),
             'reason': '+'.join(factors) if factors else 'Neutral',
             'gamma_pin': pin,
-            'gamma_flip': gex_data['gamma_flip'],
-            'neg_gex_zone': gex_data['neg_gex_zone']
+            'gamma_flip': gex_data.gamma_flip,
+            'neg_gex_zone': gex_data.neg_gex_zone
         }
     
     def _compute_ivr_score(self, ticker: str, chain: Dict) -> Dict:
@@ -829,7 +843,7 @@ class OptionsIntelligence:
 # ══════════════════════════════════════════════════════════════════════
 # GLOBAL INSTANCE
 # ══════════════════════════════════════════════════════════════════════
-options_intelligence = OptionsIntelligence(cache_ttl_seconds=300)
+options_intelligence = OptionsIntelligence(cache_ttl_seconds=config.OPTIONS_CHAIN_CACHE_TTL_SEC)
 
 # Backward compatibility alias (used by ai_learning.get_options_flow_weight)
 options_dm = options_intelligence
@@ -23,14 +23,45 @@ BUG-EOD-1 (Apr 02 2026): _get_winrate_adjustment() queried positions.signal_type
   exception and permanent 0.00 return — win-rate adjustment was permanently disabled.
   Fix: column now added by position_manager._migrate_signal_type_column() on every
   startup. Also added logger.info() so win-rate influence is visible in session logs.
+PERF-DT-1 (Oct 18 2026): _get_winrate_adjustment() ran its last-20-trades query on
+  every get_dynamic_threshold() call, i.e. once per evaluated signal, although the
+  answer only changes when a position closes. Results are now memoized per
+  (signal_type, grade); PositionManager busts the cache after every close
+  (invalidate_winrate_cache()) and entries also expire after WINRATE_CACHE_TTL_S
+  in case positions are closed by another process.
+
+PERF-DT-2 (Oct 18 2026): lock-free win-rate cache reads.
+  _winrate_cache is copy-on-write: writers build a new dict under
+  _winrate_cache_lock and rebind the module global; readers take the current
+  reference without locking, so concurrent threshold lookups never contend.
+  Each invalidate_winrate_cache() bumps _winrate_cache_gen; a lookup whose
+  query started before an invalidation returns its value but does not
+  store it, so a pre-close win rate cannot be republished after the bust.
 """
 
+import threading
+import time as _time
 from datetime import datetime, time, timedelta
 from zoneinfo import ZoneInfo
 from utils import config
 import logging
 logger = logging.getLogger(__name__)
 
+# PERF-DT-1: (signal_type, grade) -> (adjustment, computed_at monotonic)
+# PERF-DT-2: never mutated in place — writers rebind, readers take no lock.
+WINRATE_CACHE_TTL_S = 300.0
+_winrate_cache: dict = {}
+_winrate_cache_lock = threading.Lock()   # serializes writers only
+_winrate_cache_gen = 0   # bumped by invalidate_winrate_cache(), under the lock
+
+
+def invalidate_winrate_cache() -> None:
+    """Drop memoized win-rate adjustments — call after any position close."""
+    global _winrate_cache, _winrate_cache_gen
+    with _winrate_cache_lock:
+        _winrate_cache = {}
+        _winrate_cache_gen += 1
+
 
 def _now_et():
     """Get current time in Eastern timezone."""
@@ -139,6 +170,27 @@ def _get_atr_volatility_adjustment(bars_session: list, ticker: str = "") -> tupl
 
 
 def _get_winrate_adjustment(signal_type, grade):
+    """PERF-DT-1: memoized _query_winrate_adjustment()."""
+    global _winrate_cache
+    key = (signal_type, grade)
+    hit = _winrate_cache.get(key)
+    if hit is not None and _time.monotonic() - hit[1] < WINRATE_CACHE_TTL_S:
+        return hit[0]
+    gen = _winrate_cache_gen
+    adj = _query_winrate_adjustment(signal_type, grade)
+    if adj is None:   # lookup error — retry on the next call
+        return 0.00
+    with _winrate_cache_lock:
+        if gen != _winrate_cache_gen:
+            # invalidated while the query ran — it may predate the close
+            return adj
+        updated = dict(_winrate_cache)
+        updated[key] = (adj, _time.monotonic())
+        _winrate_cache = updated
+    return adj
+
+
+def _query_winrate_adjustment(signal_type, grade):
     """
     FIX #27 (Mar 26 2026): Query now filters on BOTH grade AND signal_type.
     Previously signal_type was accepted as a parameter but never used in the
@@ -204,7 +256,7 @@ def _get_winrate_adjustment(signal_type, grade):
 
     except Exception as e:
         logger.warning(f"[DYNAMIC-THRESH] Win rate lookup error: {e}")
-        return 0.00
+        return None   # PERF-DT-1: caller falls back to 0.00 without caching
 
 def get_dynamic_threshold(signal_type: str, grade: str,
                           bars_session: list = None, ticker: str = "") -> float:
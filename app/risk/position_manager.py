@@ -87,6 +87,12 @@ BUG-EOD-1 (APR 02, 2026):
     and writes it to the INSERT. _load_session_state() maps the column into
     the in-memory cache. get_todays_closed_trades() includes signal_type in
     its SELECT for downstream ML training use.
+
+PERF-PM-1 (Oct 18 2026):
+  - close_position() now delegates to close_positions_bulk(), which reads all
+    target rows with one SELECT, writes every close with one batched
+    UPDATE and commits once. close_all_eod() hands the whole EOD flush to it,
+    so N positions cost one commit/fsync instead of N.
 """
 from utils import config
 from datetime import datetime, timedelta
@@ -98,7 +104,7 @@ _ET = ZoneInfo("America/New_York")
 
 from typing import Dict, List, Optional, Tuple
 from app.data import db_connection
-from app.data.db_connection import get_conn, return_conn, ph, dict_cursor, serial_pk, USE_POSTGRES
+from app.data.db_connection import get_conn, return_conn, ph, dict_cursor, serial_pk, execute_many, USE_POSTGRES
 import time
 
 # ── Import helpers from position_helpers ───────────────────────────────────────────────────────────────────
@@ -176,6 +182,12 @@ class PositionManager:
         self._daily_stats_ts       = 0.0
         self._open_positions_cache = None
         self._open_positions_ts    = 0.0
+        # PERF-DT-1: closed trades feed the dynamic-threshold win-rate adjustment
+        try:
+            from app.risk.dynamic_thresholds import invalidate_winrate_cache
+            invalidate_winrate_cache()
+        except Exception:
+            pass
     # ───────────────────────────────────────────────────────────────────────────
 
     def _load_session_state(self) -> None:
@@ -875,32 +887,59 @@ class PositionManager:
 
     def close_position(self, position_id: int, exit_price: float, exit_reason: str):
         """Close a position fully and record final P&L."""
+        self.close_positions_bulk([(position_id, exit_price, exit_reason)])
+
+    def close_positions_bulk(self, closes: List[Tuple[int, float, str]]):
+        """
+        Close several positions in one transaction and record final P&L.
+
+        PERF-PM-1: every row is read with one SELECT ... IN (...) and written
+        with one batched UPDATE (execute_many) + a single commit, so an EOD flush of N
+        positions costs one fsync instead of N.  Per-position side effects
+        (ml_signals write-back, AI learning, Discord exit alert) still run for
+        each close; the streak refresh (done first, so the close log lines
+        report the updated streak) and circuit-breaker check run once.
+        Ids that are unknown or no longer OPEN are skipped, so a repeated
+        close cannot overwrite the recorded exit or double-count its P&L.
+
+        Args:
+            closes: (position_id, exit_price, exit_reason) tuples.
+        """
+        if not closes:
+            return
         conn = None
         try:
             p      = ph()
             conn   = get_conn()
             cursor = dict_cursor(conn)
-            cursor.execute(f"SELECT * FROM positions WHERE id = {p}", (position_id,))
-            pos = cursor.fetchone()
-            if not pos:
-                return
-
-            ticker    = pos["ticker"]
-            direction = pos["direction"]
-            entry     = pos["entry_price"]
-            grade     = pos["grade"] or "A"
-            remaining = pos["remaining_contracts"]
-            prior_pnl = pos["pnl"] or 0.0
-
-            pnl_per_share = (
-                (exit_price - entry) if direction == "bull"
-                else (entry - exit_price)
+            ids    = [c[0] for c in closes]
+            cursor.execute(
+                f"SELECT * FROM positions WHERE id IN ({', '.join([p] * len(ids))})",
+                ids,
             )
-            final_pnl = prior_pnl + (pnl_per_share * 100 * remaining)
+            rows = {row["id"]: row for row in cursor.fetchall()}
 
             exit_time = datetime.now(_ET)
+            closed    = []   # (pos, exit_price, exit_reason, final_pnl)
+            for position_id, exit_price, exit_reason in closes:
+                pos = rows.get(position_id)
+                if not pos or pos["status"] != "OPEN":
+                    continue
+                entry     = pos["entry_price"]
+                remaining = pos["remaining_contracts"]
+                prior_pnl = pos["pnl"] or 0.0
+
+                pnl_per_share = (
+                    (exit_price - entry) if pos["direction"] == "bull"
+                    else (entry - exit_price)
+                )
+                final_pnl = prior_pnl + (pnl_per_share * 100 * remaining)
+                closed.append((pos, exit_price, exit_reason, final_pnl))
 
-            cursor.execute(f"""
+            if not closed:
+                return
+
+            execute_many(cursor, f"""
                 UPDATE positions
                 SET exit_price  = {p},
                     exit_reason = {p},
@@ -908,45 +947,23 @@ class PositionManager:
                     exit_time   = {p},
                     status      = 'CLOSED'
                 WHERE id = {p}
-            """, (exit_price, exit_reason, final_pnl, exit_time, position_id))
+            """, [
+                (exit_price, exit_reason, final_pnl, exit_time, pos["id"])
+                for pos, exit_price, exit_reason, final_pnl in closed
+            ])
             conn.commit()
             self._invalidate_caches()
 
-            self.positions = [pos for pos in self.positions if pos["id"] != position_id]
-
-            # FIX #4: write completed_at back to ml_signals
-            if exit_reason != "STALE_EOD":
-                _ml_outcome = "WIN" if final_pnl > 0 else "LOSS"
-                _write_completed_at(ticker, direction, _ml_outcome, exit_price, exit_time)
+            closed_ids = {pos["id"] for pos, _, _, _ in closed}
+            self.positions = [pos for pos in self.positions if pos["id"] not in closed_ids]
 
-            if exit_reason != "STALE_EOD":
+            # Refresh the streak before the per-close log lines report it
+            if any(reason != "STALE_EOD" for _, _, reason, _ in closed):
                 closed_trades = self.get_todays_closed_trades()
                 self._update_performance_streak(closed_trades)
 
-            emoji = "\u2705" if final_pnl > 0 else "\u274c"
-            logger.info(f"[POSITION] {emoji} CLOSED {ticker} @ {exit_price:.2f} | {exit_reason}")
-            logger.info(f"  Total P&L: ${final_pnl:.2f}  Streak: {self._format_streak()}")
-
-            if exit_reason != "STALE_EOD":
-                try:
-                    from app.ai.ai_learning import learning_engine
-                    learning_engine.record_trade({
-                        "ticker":    ticker,
-                        "direction": direction,
-                        "grade":     grade,
-                        "entry":     entry,
-                        "exit":      exit_price,
-                        "pnl":       final_pnl,
-                        "timeframe": "5m"
-                    })
-                except Exception as e:
-                    logger.warning(f"[POSITION] AI record error: {e}")
-
-            try:
-                from app.notifications.discord_helpers import send_exit_alert
-                send_exit_alert(ticker, exit_price, exit_reason, final_pnl)
-            except Exception as e:
-                logger.warning(f"[POSITION] Discord exit alert failed: {e}")
+            for pos, exit_price, exit_reason, final_pnl in closed:
+                self._after_close(pos, exit_price, exit_reason, final_pnl, exit_time)
 
             # FIX #8: use real session P&L from DB (cache already busted above)
             session_stats = self.get_daily_stats()
@@ -958,13 +975,50 @@ class PositionManager:
             if conn:
                 return_conn(conn)
 
+    def _after_close(self, pos, exit_price: float, exit_reason: str,
+                     final_pnl: float, exit_time: datetime) -> None:
+        """Logging, ml_signals write-back, AI learning and Discord for one close."""
+        ticker    = pos["ticker"]
+        direction = pos["direction"]
+
+        # FIX #4: write completed_at back to ml_signals
+        if exit_reason != "STALE_EOD":
+            _ml_outcome = "WIN" if final_pnl > 0 else "LOSS"
+            _write_completed_at(ticker, direction, _ml_outcome, exit_price, exit_time)
+
+        emoji = "\u2705" if final_pnl > 0 else "\u274c"
+        logger.info(f"[POSITION] {emoji} CLOSED {ticker} @ {exit_price:.2f} | {exit_reason}")
+        logger.info(f"  Total P&L: ${final_pnl:.2f}  Streak: {self._format_streak()}")
+
+        if exit_reason != "STALE_EOD":
+            try:
+                from app.ai.ai_learning import learning_engine
+                learning_engine.record_trade({
+                    "ticker":    ticker,
+                    "direction": direction,
+                    "grade":     pos["grade"] or "A",
+                    "entry":     pos["entry_price"],
+                    "exit":      exit_price,
+                    "pnl":       final_pnl,
+                    "timeframe": "5m"
+                })
+            except Exception as e:
+                logger.warning(f"[POSITION] AI record error: {e}")
+
+        try:
+            from app.notifications.discord_helpers import send_exit_alert
+            send_exit_alert(ticker, exit_price, exit_reason, final_pnl)
+        except Exception as e:
+            logger.warning(f"[POSITION] Discord exit alert failed: {e}")
+
     def close_all_eod(self, current_prices: Dict[str, float]):
         """Close all open positions at end of day (0DTE force close at 3:55 PM)."""
         open_positions = self.get_open_positions()
-        for pos in open_positions:
-            ticker = pos["ticker"]
-            price  = current_prices.get(ticker, pos["entry_price"])
-            self.close_position(pos["id"], price, "EOD CLOSE")
+        # PERF-PM-1: one transaction for the whole EOD flush
+        self.close_positions_bulk([
+            (pos["id"], current_prices.get(pos["ticker"], pos["entry_price"]), "EOD CLOSE")
+            for pos in open_positions
+        ])
 
         # M5 FIX: Reset streak counters after EOD force-close
         self.consecutive_wins = 0
@@ -44,7 +44,6 @@ UPDATED Apr 3 2026 (CFW6 transcript alignment):
 """
 from utils import config
 import numpy as np
-from datetime import time as dtime
 from typing import List, Dict, Tuple, Optional
 import logging
 logger = logging.getLogger(__name__)
@@ -53,23 +52,33 @@ logger = logging.getLogger(__name__)
 # ATR & VOLATILITY CALCULATIONS
 # ============================================================================
 
+# PERF-TC-1: session bounds as seconds-of-day integers
+_SESSION_START_S = 9 * 3600 + 30 * 60   # 09:30:00 ET
+_SESSION_END_S   = 16 * 3600            # 16:00:00 ET
+
+# PERF-TC-2: ATR stop multiplier per grade, built once instead of per call
+_ATR_MULT_BY_GRADE: Dict[str, float] = {"A+": 2.0, "A": 2.5, "A-": 3.0, "B+": 3.5, "B": 4.0}
+
+
 def _filter_session_bars(bars: List[Dict]) -> List[Dict]:
     """
     Filter bars to regular session hours only (09:30 - 16:00 ET).
     Pre-market and after-hours bars have artificially wide spreads that
     inflate ATR and push stops too far from entry.
     Falls back to all bars if none pass the filter.
+
+    PERF-TC-1: compares one seconds-of-day integer per bar instead of
+    building a datetime.time for each and comparing against two more.
     """
-    SESSION_START = dtime(9, 30)
-    SESSION_END   = dtime(16, 0)
     filtered = []
+    append = filtered.append
     for b in bars:
         dt = b.get("datetime")
-        if dt is None:
+        if dt is None or not hasattr(dt, "hour"):
             continue
-        t = dt.time() if hasattr(dt, "time") else None
-        if t is not None and SESSION_START <= t <= SESSION_END:
-            filtered.append(b)
+        sec = dt.hour * 3600 + dt.minute * 60 + dt.second
+        if _SESSION_START_S <= sec <= _SESSION_END_S:
+            append(b)
     return filtered if filtered else bars
 
 
@@ -336,8 +345,7 @@ def calculate_stop_loss_by_grade(
     has not yet been established. In that case the OR boundary comparison
     is skipped entirely so a zero stop is never produced.
     """
-    atr_multipliers = {"A+": 2.0, "A": 2.5, "A-": 3.0, "B+": 3.5, "B": 4.0}
-    atr_mult        = atr_multipliers.get(grade, 2.5)
+    atr_mult        = _ATR_MULT_BY_GRADE.get(grade, 2.5)
     stop_distance   = atr * atr_mult
 
     # M8 FIX: only use OR boundary when the range has actually formed
@@ -529,7 +529,8 @@ def run_all_passes(force_refresh: bool = False) -> List[Dict]:
 # ─────────────────────────────────────────────
 
 def _print_screener_summary(scored: List[Dict], top_n: int = 15) -> None:
-    if not scored:
+    # PERF-DS-1: the table is log output only — skip building it when INFO is filtered
+    if not scored or not logger.isEnabledFor(logging.INFO):
         return
     tc = {"A": 0, "B": 0, "C": 0}
     for t in scored:
@@ -538,16 +539,16 @@ def _print_screener_summary(scored: List[Dict], top_n: int = 15) -> None:
             tc[tier] += 1
 
     logger.info(f"\n{'='*90}")
-    print(f"[SCREENER] v3.1  |  {len(scored)} tickers  |  "
-          f"🔥 Tier A: {tc['A']}  ⚡ Tier B: {tc['B']}  📊 Tier C: {tc['C']}")
-    print(f"\n{'#':<4} {'Ticker':<7} {'Score':<7} {'Tier':<6} {'RVOL':<7} "
-          f"{'1d%':>7} {'5d%':>7} {'$Vol M':>8} {'Price':>8} {'MCap$B':>8}  Sector")
+    logger.info(f"[SCREENER] v3.1  |  {len(scored)} tickers  |  "
+                f"🔥 Tier A: {tc['A']}  ⚡ Tier B: {tc['B']}  📊 Tier C: {tc['C']}")
+    logger.info(f"\n{'#':<4} {'Ticker':<7} {'Score':<7} {'Tier':<6} {'RVOL':<7} "
+                f"{'1d%':>7} {'5d%':>7} {'$Vol M':>8} {'Price':>8} {'MCap$B':>8}  Sector")
     logger.info("-" * 90)
 
     icons = {"A": "🔥", "B": "⚡", "C": "📊"}
     for i, t in enumerate(scored[:top_n], 1):
         icon = icons.get(t["rvol_tier"], "")
-        print(
+        logger.info(
             f"{i:<4} {t['ticker']:<7} {t['score']:<7} "
             f"{icon}{t['rvol_tier']:<5} "
             f"{t['rvol']:<7.2f} "
@@ -23,10 +23,33 @@ PHASE 1.30a (MAR 25, 2026):
     iterations. Previously matched_kw was only reset before the downgrade
     block, leaving merger and FDA blocks able to inherit a stale value
     from an earlier for-loop iteration.
+
+PERF-NC-1 (OCT 18, 2026):
+  - detect_catalyst() cache stamps entries with time.monotonic() and compares
+    against a float TTL (CATALYST_CACHE_TTL_SEC) instead of building a
+    datetime and a timedelta on every lookup. Cache hits — the common case
+    once a ticker has been scanned — are a dict get plus one float compare.
+
+PERF-NC-2 (OCT 18, 2026):
+  - The catalyst cache (the source of the scanner's has_earnings flag) held
+    one entry per ticker ever queried for the life of the process. It is
+    now an OrderedDict capped at CATALYST_CACHE_MAX entries with LRU
+    eviction: hits move to the end, inserts past the cap drop the oldest.
+    Mutations hold a lock since scan_watchlist() runs detections in a pool.
+
+PERF-NC-3 (OCT 18, 2026):
+  - _is_recent() compared each news item against a fresh
+    datetime.utcnow() - timedelta(...).  _analyze_news() now computes one
+    epoch-seconds cutoff per call (time.time()); numeric item timestamps
+    compare as floats with no datetime built, ISO strings are parsed once
+    and compared as UTC epoch seconds.
 """
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 import re
+import threading
+import time
 import requests
 from utils import config
 import logging
@@ -86,8 +109,9 @@ def notify_news_catalyst(catalyst: 'NewsCatalyst') -> None:
     """
     Post a Discord embed to the dedicated news channel when a catalyst fires.
 
-    Uses DISCORD_NEWS_WEBHOOK_URL from config.  Fails silently if the webhook
-    is not configured or the request errors — never blocks the scan loop.
+    Uses DISCORD_NEWS_WEBHOOK_URL from config.  No-op if the webhook is not
+    configured; the post itself is queued on the discord_helpers send worker,
+    so it never blocks the scan loop.
     """
     webhook_url = getattr(config, 'DISCORD_NEWS_WEBHOOK_URL', '')
     if not webhook_url:
@@ -114,16 +138,9 @@ def notify_news_catalyst(catalyst: 'NewsCatalyst') -> None:
         }
     }
 
-    try:
-        resp = requests.post(
-            webhook_url,
-            json={'embeds': [embed]},
-            timeout=10
-        )
-        if resp.status_code not in (200, 204):
-            logger.info(f'[NEWS-DISCORD] Webhook error {resp.status_code} for {catalyst.ticker}')
-    except Exception as e:
-        logger.info(f'[NEWS-DISCORD] Failed to send alert for {catalyst.ticker}: {e}')
+    # PERF-DH-11: shared Discord send worker instead of a blocking requests.post
+    from app.notifications.discord_helpers import send_to_webhook
+    send_to_webhook(webhook_url, {'embeds': [embed]}, f'News {catalyst.ticker} ')
 
 
 class NewsCatalystDetector:
@@ -213,29 +230,48 @@ class NewsCatalystDetector:
         'nonfarm payroll',
     ]
 
+    CATALYST_CACHE_TTL_SEC = 30 * 60
+    CATALYST_CACHE_MAX = 2048
+
     def __init__(self):
-        self.cache = {}  # ticker -> (NewsCatalyst | None, fetched_at)
-        self.cache_ttl = timedelta(minutes=30)
+        # ticker -> (NewsCatalyst | None, fetched_at monotonic seconds), LRU order
+        self.cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self.cache_ttl = self.CATALYST_CACHE_TTL_SEC
+        # scan_watchlist() calls detect_catalyst() from a thread pool
+        self._cache_lock = threading.Lock()
+
+    def _cache_put(self, ticker: str, catalyst: Optional[NewsCatalyst]) -> None:
+        """PERF-NC-2: insert/refresh an entry and evict the oldest past the cap."""
+        cache = self.cache
+        with self._cache_lock:
+            cache[ticker] = (catalyst, time.monotonic())
+            cache.move_to_end(ticker)
+            while len(cache) > self.CATALYST_CACHE_MAX:
+                cache.popitem(last=False)
     
     def detect_catalyst(self, ticker: str, force_refresh: bool = False) -> Optional[NewsCatalyst]:
         """
         Detect news catalyst for a ticker.
         Fires a Discord notification automatically when a catalyst is found.
         """
-        if not force_refresh and ticker in self.cache:
-            cached_result, fetched_at = self.cache[ticker]
-            if (datetime.now() - fetched_at) < self.cache_ttl:
-                return cached_result
+        if not force_refresh:
+            cached = self.cache.get(ticker)
+            # PERF-NC-1: monotonic float TTL check
+            if cached is not None and (time.monotonic() - cached[1]) < self.cache_ttl:
+                with self._cache_lock:   # PERF-NC-2: LRU touch
+                    if ticker in self.cache:
+                        self.cache.move_to_end(ticker)
+                return cached[0]
         
         news_items = self._fetch_news(ticker)
         if not news_items:
             logger.info(f"[NEWS] {ticker}: No news items returned from API")
-            self.cache[ticker] = (None, datetime.now())
+            self._cache_put(ticker, None)
             return None
         
         logger.info(f"[NEWS] {ticker}: Fetched {len(news_items)} news items")
         catalyst = self._analyze_news(ticker, news_items)
-        self.cache[ticker] = (catalyst, datetime.now())
+        self._cache_put(ticker, catalyst)
         
         if catalyst:
             logger.info(f"[NEWS] {ticker}: Catalyst found - {catalyst.catalyst_type} (weight={catalyst.weight})")
@@ -272,25 +308,25 @@ class NewsCatalystDetector:
         combined = (title + ' ' + content).lower()
         return ticker.lower() in combined
 
-    def _is_recent(self, item: Dict) -> bool:
+    def _is_recent(self, item: Dict, cutoff_ts: float) -> bool:
+        """True if the item is newer than cutoff_ts (UTC epoch seconds) or undated."""
         raw = item.get('date') or item.get('published_at') or item.get('datetime')
         if not raw:
             return True
         try:
             if isinstance(raw, (int, float)):
-                pub = datetime.utcfromtimestamp(raw)
-            else:
-                raw_clean = re.sub(r'Z$', '', str(raw))
-                raw_clean = re.sub(r'[+-]\d{2}:\d{2}$', '', raw_clean).strip()
-                pub = datetime.fromisoformat(raw_clean)
-            cutoff = datetime.utcnow() - timedelta(hours=self.RECENCY_HOURS)
-            return pub >= cutoff
+                return raw >= cutoff_ts   # PERF-NC-3: already epoch seconds
+            raw_clean = re.sub(r'Z$', '', str(raw))
+            raw_clean = re.sub(r'[+-]\d{2}:\d{2}$', '', raw_clean).strip()
+            pub = datetime.fromisoformat(raw_clean)
+            return pub.replace(tzinfo=timezone.utc).timestamp() >= cutoff_ts
         except Exception:
             return True
     
     def _analyze_news(self, ticker: str, news_items: List[Dict]) -> Optional[NewsCatalyst]:
         catalysts = []
         ticker_specific_count = 0
+        cutoff_ts = time.time() - self.RECENCY_HOURS * 3600   # PERF-NC-3: once per call
         
         for item in news_items:
             title = item.get('title', '')
@@ -298,7 +334,7 @@ class NewsCatalystDetector:
 
             if not self._is_ticker_specific(ticker, title, content):
                 continue
-            if not self._is_recent(item):
+            if not self._is_recent(item, cutoff_ts):
                 continue
 
             ticker_specific_count += 1
@@ -115,12 +115,35 @@ PHASE 1.30a (MAR 25, 2026) - is_premarket_window() fix:
   - FIX: Replaced local implementation with a direct import from
     market_calendar.is_premarket_window(), which already wraps is_market_day()
     (weekend + NYSE holiday check) before the time comparison.
+
+PERF-PMS-1 (OCT 18, 2026) - Concurrent watchlist scan:
+  - scan_watchlist() runs scan_ticker() across a SCAN_WORKERS (8) thread
+    pool. Each ticker makes several independent EODHD round trips
+    (fundamentals, REST bar, news catalyst), so a 300-ticker premarket pass
+    now costs roughly N/8 serial latencies instead of N. Results are
+    consumed in input order, so logging and scoring are unchanged.
+
+PERF-PMS-2 (OCT 18, 2026) - Pooled EODHD session:
+  - The EOD, fundamentals and real-time GETs went through bare
+    requests.get(), i.e. a new TCP + TLS handshake per call (3 per ticker).
+    They now share a module-level requests.Session whose adapter keeps up to
+    SCAN_WORKERS keep-alive connections to eodhd.com, so the scan pool
+    reuses a handful of connections for the whole pass.
+
+PERF-PMS-3 (OCT 18, 2026) - No print() on the scan pool:
+  - scan_ticker() wrote five per-ticker print() lines (REST bar, RVOL clamp,
+    early exit, gap, fundamentals skip). With SCAN_WORKERS threads these
+    serialized on the stdout lock and bypassed logging_config. They now go
+    through the module logger with deferred %-formatting — DEBUG for the
+    per-ticker chatter (no formatting cost when disabled), INFO for the
+    fundamentals skip.
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, time as dt_time
 from typing import List, Dict, Optional, Tuple
 import statistics
-import requests
 from utils import config
+from utils.http import make_session
 import logging
 logger = logging.getLogger(__name__)
 
@@ -148,6 +171,12 @@ except ImportError as e:
 # Tickers below this threshold are dead volume and will never make the watchlist.
 EARLY_EXIT_RVOL_MIN = 0.10
 
+# PERF-PMS-1: concurrent scan_ticker() calls in scan_watchlist()
+SCAN_WORKERS = 8
+
+# PERF-PMS-2: keep-alive connections to EODHD shared by the scan pool
+_session = make_session(pool_maxsize=SCAN_WORKERS)
+
 
 # ===============================================================================
 # PHASE 1.30a: PREMARKET WINDOW GATE — delegated to market_calendar
@@ -387,7 +416,7 @@ def fetch_fundamental_data(ticker: str) -> Dict:
             'fmt': 'json'
         }
 
-        response = requests.get(url, params=params, timeout=10)
+        response = _session.get(url, params=params, timeout=10)
         if response.status_code != 200:
             logger.info(f"[PREMARKET] {ticker}: EOD API HTTP {response.status_code}")
             return _get_default_fundamentals(ticker)
@@ -408,7 +437,7 @@ def fetch_fundamental_data(ticker: str) -> Dict:
         float_shares = 0
         try:
             fund_url  = f"https://eodhd.com/api/fundamentals/{ticker}.US?api_token={config.EODHD_API_KEY}&fmt=json"
-            fund_resp = requests.get(fund_url, timeout=5)
+            fund_resp = _session.get(fund_url, timeout=5)
             if fund_resp.status_code == 200:
                 fund_data    = fund_resp.json()
                 highlights   = fund_data.get('Highlights', {})
@@ -545,9 +574,9 @@ def scan_ticker(ticker: str) -> Optional[Dict]:
 
     # ── PHASE 1.29: FIX #8 — bail out if fundamentals fetch failed ────────────
     if fundamentals['avg_daily_volume'] == 0:
-        print(
-            f"[PREMARKET] {ticker}: SKIPPED — fundamentals fetch failed "
-            f"(ADV=0, no EOD data). Returning None to avoid ghost score."
+        logger.info(
+            "[PREMARKET] %s: SKIPPED — fundamentals fetch failed "
+            "(ADV=0, no EOD data). Returning None to avoid ghost score.", ticker
         )
         return None
 
@@ -579,7 +608,7 @@ def scan_ticker(ticker: str) -> Optional[Dict]:
                 f"https://eodhd.com/api/real-time/{ticker}.US"
                 f"?api_token={config.EODHD_API_KEY}&fmt=json"
             )
-            rt_resp = requests.get(rt_url, timeout=5)
+            rt_resp = _session.get(rt_url, timeout=5)
             if rt_resp.status_code == 200:
                 rt = rt_resp.json()
                 premarket_price = rt.get('open') or rt.get('close') or rt.get('previousClose', 0)
@@ -589,9 +618,9 @@ def scan_ticker(ticker: str) -> Optional[Dict]:
                     'volume': rt.get('volume', 0)
                 }
                 bar_source = "REST"
-                print(
-                    f"[PREMARKET] {ticker}: REST bar used "
-                    f"(open={rt.get('open')}, previousClose={rest_prev_close})"
+                logger.debug(
+                    "[PREMARKET] %s: REST bar used (open=%s, previousClose=%s)",
+                    ticker, rt.get('open'), rest_prev_close
                 )
             else:
                 logger.info(f"[PREMARKET] {ticker}: REST API failed (HTTP {rt_resp.status_code})")
@@ -625,10 +654,10 @@ def scan_ticker(ticker: str) -> Optional[Dict]:
 
     # PHASE 1.23a: Clamp RVOL for REST-sourced bars
     if bar_source == "REST" and volume_metrics['rvol'] > REST_BAR_RVOL_MAX:
-        print(
-            f"[PREMARKET] {ticker}: REST bar RVOL clamped "
-            f"{volume_metrics['rvol']:.1f}x \u2192 {REST_BAR_RVOL_MAX:.1f}x "
-            f"(prior-day volume artifact)"
+        logger.debug(
+            "[PREMARKET] %s: REST bar RVOL clamped %.1fx \u2192 %.1fx "
+            "(prior-day volume artifact)",
+            ticker, volume_metrics['rvol'], REST_BAR_RVOL_MAX
         )
         volume_metrics['rvol'] = REST_BAR_RVOL_MAX
         rvol_score   = 100 if REST_BAR_RVOL_MAX >= 5.0 else 90
@@ -642,9 +671,10 @@ def scan_ticker(ticker: str) -> Optional[Dict]:
     # ──────────────────────────────────────────────────────────────────────────
     if volume_metrics['rvol'] < EARLY_EXIT_RVOL_MIN:
         composite_score = volume_score * 0.60
-        print(
-            f"[PREMARKET] {ticker}: EARLY EXIT — RVOL={volume_metrics['rvol']:.2f}x "
-            f"< {EARLY_EXIT_RVOL_MIN}x — skipping gap/news/sector (score={composite_score:.1f})"
+        logger.debug(
+            "[PREMARKET] %s: EARLY EXIT — RVOL=%.2fx < %sx — skipping "
+            "gap/news/sector (score=%.1f)",
+            ticker, volume_metrics['rvol'], EARLY_EXIT_RVOL_MIN, composite_score
         )
         result = {
             'ticker':           ticker,
@@ -701,10 +731,11 @@ def scan_ticker(ticker: str) -> Optional[Dict]:
             )
             gap_score = gap_result.quality_score
             gap_data  = gap_result.to_dict()
-            print(
-                f"[PREMARKET] {ticker}: Gap={gap_data.get('size_pct', 0):+.2f}% "
-                f"({gap_data.get('tier','?')}) score={gap_score:.1f} "
-                f"[prev_close={gap_prev_close:.2f}, price={price:.2f}]"
+            logger.debug(
+                "[PREMARKET] %s: Gap=%+.2f%% (%s) score=%.1f "
+                "[prev_close=%.2f, price=%.2f]",
+                ticker, gap_data.get('size_pct', 0), gap_data.get('tier', '?'),
+                gap_score, gap_prev_close, price
             )
         except Exception as e:
             logger.info(f"[PREMARKET] {ticker}: Gap analysis error: {e}")
@@ -782,20 +813,29 @@ def scan_watchlist(tickers: List[str], min_score: float = 60.0) -> List[Dict]:
     logger.info(f"[PREMARKET] Scanning {len(tickers)} tickers with min_score={min_score}...")
     results = []
 
-    for ticker in tickers:
+    # PERF-PMS-1: overlap the per-ticker HTTP round trips (fundamentals, REST
+    # bar, news catalyst) across a small pool; results are consumed in order.
+    def _scan(ticker: str):
         try:
-            scan_result = scan_ticker(ticker)
-            if scan_result:
-                if scan_result['composite_score'] >= min_score:
-                    results.append(scan_result)
-                    logger.info(f"[PREMARKET] {ticker}: PASS score={scan_result['composite_score']:.1f} >= {min_score}")
-                else:
-                    logger.info(f"[PREMARKET] {ticker}: FILTERED score={scan_result['composite_score']:.1f} < {min_score}")
-            else:
-                logger.info(f"[PREMARKET] {ticker}: SKIPPED (scan returned None)")
+            return scan_ticker(ticker), None
         except Exception as e:
-            logger.info(f"[PREMARKET] Error scanning {ticker}: {e}")
+            return None, e
+
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="pm_scan") as pool:
+        scanned = list(pool.map(_scan, tickers))
+
+    for ticker, (scan_result, error) in zip(tickers, scanned):
+        if error is not None:
+            logger.info(f"[PREMARKET] Error scanning {ticker}: {error}")
             continue
+        if scan_result:
+            if scan_result['composite_score'] >= min_score:
+                results.append(scan_result)
+                logger.info(f"[PREMARKET] {ticker}: PASS score={scan_result['composite_score']:.1f} >= {min_score}")
+            else:
+                logger.info(f"[PREMARKET] {ticker}: FILTERED score={scan_result['composite_score']:.1f} < {min_score}")
+        else:
+            logger.info(f"[PREMARKET] {ticker}: SKIPPED (scan returned None)")
 
     results.sort(key=lambda x: x['composite_score'], reverse=True)
     logger.info(f"[PREMARKET] Scan complete: {len(results)}/{len(tickers)} tickers passed")
@@ -28,6 +28,7 @@ from app.validation.validation import (
     get_options_filter,
     get_time_of_day_quality,
     get_options_recommendation,
+    get_options_recommendations,
 )
 from app.validation.cfw6_gate_validator import validate_signal
 
@@ -42,6 +43,7 @@ __all__ = [
     'get_options_filter',
     'get_time_of_day_quality',
     'get_options_recommendation',
+    'get_options_recommendations',
     # cfw6_gate_validator.py — scanner.py pipeline
     'validate_signal',
 ]
@@ -26,6 +26,11 @@ Bug fixes (Phase 1.17, Mar 12 2026):
 Mar 25 2026 — Add missing ZoneInfo import (Pylance reportUndefinedVariable
               on line 285: timestamp=datetime.now(ZoneInfo(...))).
 
+PERF-GP-1 (Oct 18 2026): _fetch_atm_options() used bare requests.get(),
+              so every cache refresh opened a new TCP + TLS connection to
+              eodhd.com. Fetches now go through a module-level keep-alive
+              requests.Session (same pool/retry setup as options_filter).
+
 DTE Responsibility Split:
   greeks_precheck  → answers "does ANY liquid contract exist?"  (0-30 DTE)
   options_selector → answers "which contract is best?"          (uses config.MIN/MAX/IDEAL_DTE)
@@ -45,14 +50,17 @@ from datetime import datetime, timedelta, date
 from zoneinfo import ZoneInfo
 from dataclasses import dataclass
 import time
-import requests
 
 from utils import config
+from utils.http import make_session
 import logging
 logger = logging.getLogger(__name__)
 
 ET = ZoneInfo("America/New_York")
 
+# PERF-GP-1: keep-alive connections to eodhd.com for chain refreshes
+_session = make_session(pool_maxsize=10, retries=2)
+
 # How long to suppress retries for tickers with no options (30 minutes)
 NO_OPTIONS_TTL = 1800
 
@@ -171,10 +179,10 @@ class GreeksCache:
             'no_options_skips': 0,
         }
 
-        print(
-            f"[GREEKS-CACHE] Initialized | TTL={cache_ttl}s "
-            f"| fetch window=0-{PRECHECK_DTE_MAX}DTE "
-            f"| no-options blacklist TTL={NO_OPTIONS_TTL}s"
+        logger.info(
+            "[GREEKS-CACHE] Initialized | TTL=%ss | fetch window=0-%sDTE "
+            "| no-options blacklist TTL=%ss",
+            cache_ttl, PRECHECK_DTE_MAX, NO_OPTIONS_TTL,
         )
 
     def _is_cache_valid(self, ticker: str) -> bool:
@@ -244,7 +252,7 @@ class GreeksCache:
 
         try:
             self.stats['api_calls'] += 1
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = _session.get(self.base_url, params=params, timeout=10)   # PERF-GP-1
             response.raise_for_status()
 
             raw   = response.json()
@@ -292,9 +300,9 @@ class GreeksCache:
                 )
                 snapshots.append(snapshot)
 
-            print(
-                f"[GREEKS-CACHE] {ticker}: Fetched {len(snapshots)} ATM options "
-                f"(0-{dte_max}DTE window) from EODHD"
+            logger.debug(
+                "[GREEKS-CACHE] %s: Fetched %d ATM options (0-%sDTE window) from EODHD",
+                ticker, len(snapshots), dte_max,
             )
             return snapshots
 
@@ -323,9 +331,9 @@ class GreeksCache:
             # FIX 2: Stamp the no-options blacklist so we don't hammer the
             # API again for this ticker for NO_OPTIONS_TTL seconds.
             self._no_options_set[ticker] = time.time()
-            print(
-                f"[GREEKS-CACHE] {ticker}: No options returned "
-                f"— blacklisted for {NO_OPTIONS_TTL // 60} min"
+            logger.info(
+                "[GREEKS-CACHE] %s: No options returned — blacklisted for %d min",
+                ticker, NO_OPTIONS_TTL // 60,
             )
             return False
 
@@ -353,9 +361,9 @@ class GreeksCache:
         self._cache_timestamps[ticker] = time.time()
 
         total_options = sum(len(opts) for opts in strike_cache.values())
-        print(
-            f"[GREEKS-CACHE] {ticker}: Cached {len(strike_cache)} strikes "
-            f"({total_options} options)"
+        logger.debug(
+            "[GREEKS-CACHE] %s: Cached %d strikes (%d options)",
+            ticker, len(strike_cache), total_options,
         )
         return True
 
@@ -650,11 +658,11 @@ if __name__ == "__main__":
     for i, strike_data in enumerate(calls[:3], 1):
         logger.info(f"{i}. ${strike_data['strike']:.0f} CALL  |  {strike_data['dte']}DTE")
         logger.info(f"   Delta: {strike_data['delta']:.3f} | IV: {strike_data['iv']*100:.1f}%")
-        print(
+        logger.info(
             f"   Bid/Ask: ${strike_data['bid']:.2f}/${strike_data['ask']:.2f} "
             f"(spread: {strike_data['spread_pct']:.1f}%)"
         )
-        print(
+        logger.info(
             f"   Liquid: {'✅' if strike_data['is_liquid'] else '❌'} "
             f"| Delta OK: {'✅' if abs(strike_data['delta']) >= 0.30 else '❌'}\n"
         )
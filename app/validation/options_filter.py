@@ -2,15 +2,79 @@
 options_filter.py — Options Chain Validation
 Extracted from validation.py (Phase 3A consolidation) to reduce file size.
 OptionsFilter + get_options_recommendation live here; validation.py re-exports.
+
+PERF-OF-1 (Oct 18 2026): chain fetches go through a module-level keep-alive
+requests.Session instead of bare requests.get(), so each ticker reuses the
+TLS connection to eodhd.com. Callers now share the PERF-OF-5
+get_options_filter() singleton; the session stays module-level so any
+OptionsFilter constructed directly still uses the same pool.
+
+PERF-OF-2 (Oct 18 2026): find_best_strike()'s per-contract loop called
+filter_by_liquidity() / filter_by_delta() (two method calls, five .get()s
+and repeated config attribute lookups per contract), tested the strike
+window only after both, and rebuilt the full result dict — including
+calculate_expected_move() — every time the best score improved. The
+thresholds are now bound to locals once, the cheap strike-window test runs
+first, the filters are inlined in the same order, and the result dict is
+built once for the winner. Same contract chosen, ties included.
+
+PERF-OF-3 (Oct 18 2026): filter_by_dte() built a ZoneInfo, read the clock
+and ran datetime.strptime() for every expiration. find_best_strike() now
+pins today's ET date once and passes it in; expirations are parsed with
+date.fromisoformat() (C parser). Called without `today` it reads the clock
+itself, as before.
+
+PERF-OF-4 (Oct 18 2026): the contracts response (up to 1000 contract
+objects) is decoded with orjson.loads(r.content) instead of r.json()
+(stdlib json). Falls back to r.json() if orjson is not installed.
+
+PERF-OF-5 (Oct 18 2026): get_options_recommendation() and the options
+chain cache built a new OptionsFilter for every ticker. Both now share the
+process-wide instance from get_options_filter(), which moved here from
+validation.py (still re-exported there).
+
+PERF-OF-6 (Oct 18 2026): find_best_strike() fetched the contracts chain
+from EODHD on every call, so re-validating a ticker (the other direction,
+the next scan cycle) paid a full HTTPS round trip each time. Successful
+chains are now cached per (ticker, ET date) for CHAIN_CACHE_TTL_SEC on the
+shared OptionsFilter — the same 5-minute TTL as the OptionsIntelligence
+chain cache. Failures and empty chains are not cached.
+  - Both caches use config.OPTIONS_CHAIN_CACHE_TTL_SEC. OptionsIntelligence
+    keeps its own cache and calls get_options_chain(use_cache=False), which
+    always fetches and refreshes this cache — no stacked TTLs, and
+    force_refresh still reaches the network.
+  - Cached chains are returned to every caller by reference: treat them as
+    read-only.
+
+PERF-OF-7 (Oct 18 2026): get_options_recommendations() validates a batch of
+signals on a thread pool (OPTIONS_BATCH_WORKERS, sized to the session's
+connection pool), so N chain fetches cost about ceil(N / workers) round
+trips instead of N. Each ticker gets exactly the single-call result.
+
+PERF-OF-8 (Oct 18 2026): find_best_strike() scores the chain with NumPy.
+Each (chain, calls/puts) side is converted once into column arrays
+(_chain_to_soa) and memoized on its PERF-OF-6 cache entry; the strike
+window, liquidity, spread and delta filters become boolean masks and the
+composite score one vector expression, so repeat lookups within the TTL
+skip the per-contract loop entirely. The conversion costs about 1.7x one
+PERF-OF-2 loop pass, so it only pays off through the cache — uncached
+chains (cache miss, empty chain) are converted per call. argmax keeps the
+loop's first-best-wins tie order, so picks and scores are unchanged.
+Null quote fields now count as 0 (filtered out) instead of raising.
 """
 from __future__ import annotations
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
-import requests
+import threading
+import time
 import logging
 
+import numpy as np
+
 from utils import config
+from utils.http import make_session
 from app.options.iv_tracker import store_iv_observation, compute_ivr, ivr_to_confidence_multiplier
 from app.options.gex_engine import compute_gex_levels, get_gex_signal_context
 
@@ -26,12 +90,28 @@ except ImportError:
                 'uoa_max_score': 0.0, 'uoa_top_aligned': [], 'uoa_top_opposing': []}
     def format_uoa_summary(d): return "UOA scanner unavailable"
 
+# PERF-OF-4: orjson for chain responses (stdlib json fallback if not installed)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from app.options.options_optimizer import get_optimal_strikes_sync
     _OPTIMIZER_AVAILABLE = True
 except ImportError:
     _OPTIMIZER_AVAILABLE = False
 
+_ET = ZoneInfo("America/New_York")
+
+# PERF-OF-1: keep-alive connections to eodhd.com shared by every OptionsFilter
+_session = make_session(pool_maxsize=10, retries=2)
+
+# PERF-OF-7: parallel chain fetches in get_options_recommendations()
+# (matches the session's pool_maxsize, so no request waits for a socket)
+OPTIONS_BATCH_WORKERS = 10
+
 # IVR gate thresholds (Phase P2-1)
 IVR_HARD_BLOCK = 80
 IVR_WARN       = 60
@@ -40,9 +120,16 @@ IVR_WARN       = 60
 class OptionsFilter:
     """Filters and analyzes options chains for trading signals."""
 
+    CHAIN_CACHE_TTL_SEC = config.OPTIONS_CHAIN_CACHE_TTL_SEC   # PERF-OF-6
+    CHAIN_CACHE_MAX     = 256
+
     def __init__(self):
         self.api_key  = config.EODHD_API_KEY
         self.base_url = "https://eodhd.com/api/mp/unicornbay/options/contracts"
+        # PERF-OF-6: (ticker, ET date) -> [chain, fetched_at monotonic seconds,
+        #                                  {"calls"/"puts": SoA} (PERF-OF-8)]
+        self._chain_cache: Dict[Tuple[str, date], list] = {}
+        self._chain_lock = threading.Lock()
 
     def _get_ivr_for_gate(self, ticker: str) -> Tuple[Optional[float], int, bool]:
         """Pull ATM IV from greeks_cache and compute IVR — zero extra API calls."""
@@ -92,7 +179,78 @@ class OptionsFilter:
             }
         return nested
 
-    def get_options_chain(self, ticker: str) -> Optional[Dict]:
+    def get_options_chain(self, ticker: str, use_cache: bool = True) -> Optional[Dict]:
+        """
+        Normalized contracts chain for `ticker`, cached per ET day (PERF-OF-6).
+
+        use_cache=False skips the cache read and always fetches; a successful
+        fetch still refreshes the cache. The returned dict is shared with
+        other callers — do not mutate it.
+        """
+        key = (ticker, datetime.now(_ET).date())
+        if use_cache:
+            cached = self._chain_cache.get(key)
+            if cached is not None and time.monotonic() - cached[1] < self.CHAIN_CACHE_TTL_SEC:
+                return cached[0]   # PERF-OF-6
+        chain = self._fetch_options_chain(ticker)
+        if chain and chain.get("data"):
+            self._cache_chain(key, chain)
+        return chain
+
+    def _cache_chain(self, key: Tuple[str, date], chain: Dict) -> None:
+        """PERF-OF-6: store a chain; past the cap, drop expired entries first."""
+        now = time.monotonic()
+        with self._chain_lock:
+            cache = self._chain_cache
+            cache[key] = [chain, now, {}]
+            if len(cache) > self.CHAIN_CACHE_MAX:
+                for k in [k for k, v in cache.items() if now - v[1] >= self.CHAIN_CACHE_TTL_SEC]:
+                    del cache[k]
+                while len(cache) > self.CHAIN_CACHE_MAX:
+                    del cache[next(iter(cache))]
+
+    @staticmethod
+    def _chain_to_soa(chain: Dict, option_type: str) -> Dict:
+        """
+        PERF-OF-8: one side ("calls"/"puts") of a normalized chain as float64
+        columns in chain iteration order, plus the expirations, a per-row
+        expiration index and the original contract dicts.
+        """
+        exps, counts, strikes, opts = [], [], [], []
+        for exp_date, options_data in chain.get("data", {}).items():
+            side = options_data.get(option_type, {})
+            exps.append(exp_date)
+            counts.append(len(side))
+            strikes.extend(side.keys())
+            opts.extend(side.values())
+        n = len(opts)
+
+        def col(field):
+            return np.fromiter((o.get(field) or 0 for o in opts), np.float64, n)
+
+        return {
+            "exps":   exps,
+            "exp":    np.repeat(np.arange(len(exps)), counts),
+            "strike": np.fromiter(map(float, strikes), np.float64, n),
+            "oi":     col("openInterest"),
+            "volume": col("volume"),
+            "bid":    col("bid"),
+            "ask":    col("ask"),
+            "delta":  col("delta"),
+            "opts":   opts,
+        }
+
+    def _chain_soa(self, ticker: str, chain: Dict, option_type: str, today: date) -> Dict:
+        """PERF-OF-8: SoA for `chain`, memoized on its cache entry when cached."""
+        entry = self._chain_cache.get((ticker, today))
+        if entry is None or entry[0] is not chain:
+            return self._chain_to_soa(chain, option_type)
+        soa = entry[2].get(option_type)
+        if soa is None:
+            soa = entry[2][option_type] = self._chain_to_soa(chain, option_type)
+        return soa
+
+    def _fetch_options_chain(self, ticker: str) -> Optional[Dict]:
         today  = datetime.now()
         params = {
             "filter[underlying_symbol]": ticker,
@@ -101,9 +259,9 @@ class OptionsFilter:
             "sort": "exp_date", "limit": 1000, "api_token": self.api_key,
         }
         try:
-            r = requests.get(self.base_url, params=params, timeout=10)
+            r = _session.get(self.base_url, params=params, timeout=10)   # PERF-OF-1
             r.raise_for_status()
-            raw   = r.json()
+            raw   = orjson.loads(r.content) if ORJSON_AVAILABLE else r.json()   # PERF-OF-4
             items = raw.get("data", [])
             return {"data": self._normalize_v2_chain(items)} if isinstance(items, list) else raw
         except Exception as e:
@@ -125,12 +283,12 @@ class OptionsFilter:
         d = abs(option.get("delta", 0))
         return config.TARGET_DELTA_MIN <= d <= config.TARGET_DELTA_MAX
 
-    def filter_by_dte(self, expiration_date: str) -> Tuple[bool, int]:
+    def filter_by_dte(self, expiration_date: str,
+                      today: Optional[date] = None) -> Tuple[bool, int]:
         try:
-            now_et = datetime.now(ZoneInfo("America/New_York")).replace(
-                hour=0, minute=0, second=0, microsecond=0, tzinfo=None
-            )
-            dte = (datetime.strptime(expiration_date, "%Y-%m-%d") - now_et).days
+            if today is None:
+                today = datetime.now(_ET).date()
+            dte = (date.fromisoformat(expiration_date) - today).days   # PERF-OF-3
             return (config.MIN_DTE <= dte <= config.MAX_DTE), dte
         except Exception:
             return False, 0
@@ -159,41 +317,68 @@ class OptionsFilter:
         if not chain:
             return None
 
-        best_option, best_score = None, -1
+        best, best_score = None, -1
         is_call     = (direction == "bull")
         option_type = "calls" if is_call else "puts"
 
-        for exp_date, options_data in chain.get("data", {}).items():
-            is_valid_dte, dte = self.filter_by_dte(exp_date)
-            if not is_valid_dte:
-                continue
-            for strike_str, option in options_data.get(option_type, {}).items():
-                strike = float(strike_str)
-                if not self.filter_by_liquidity(option) or not self.filter_by_delta(option):
-                    continue
-                if is_call  and not (entry_price * 0.95 <= strike <= entry_price * 1.10): continue
-                if not is_call and not (entry_price * 0.90 <= strike <= entry_price * 1.05): continue
-
-                bid, ask = option.get("bid", 0), option.get("ask", 0)
-                mid = (bid + ask) / 2 if (bid and ask) else 0
-                delta_score  = max(0, 50 - abs(abs(option.get("delta", 0)) - config.IDEAL_DELTA) * 200)
-                dte_score    = 100 - abs(dte - _ideal_dte)
-                oi_score     = min(option.get("openInterest", 0) / 1000, 100)
-                spread_pct   = (ask - bid) / mid if mid > 0 else 999
-                spread_score = max(0, 100 - spread_pct * 1000)
-                total_score  = dte_score + oi_score + spread_score + delta_score
-
-                if total_score > best_score:
-                    best_score = total_score
-                    iv = option.get("impliedVolatility", 0)
-                    best_option = {
-                        "strike": strike, "expiration": exp_date,
-                        "delta": option.get("delta", 0), "theta": option.get("theta", 0),
-                        "oi": option.get("openInterest", 0), "volume": option.get("volume", 0),
-                        "bid": bid, "ask": ask, "iv": iv, "dte": dte,
-                        "expected_move": self.calculate_expected_move(entry_price, iv, dte),
-                        "score": total_score
-                    }
+        # PERF-OF-2: loop invariants bound once
+        lo_px, hi_px = ((entry_price * 0.95, entry_price * 1.10) if is_call
+                        else (entry_price * 0.90, entry_price * 1.05))
+        min_oi, min_vol = config.MIN_OPTION_OI, config.MIN_OPTION_VOLUME
+        max_spread      = config.MAX_BID_ASK_SPREAD_PCT
+        d_min, d_max    = config.TARGET_DELTA_MIN, config.TARGET_DELTA_MAX
+        ideal_delta     = config.IDEAL_DELTA
+
+        today = datetime.now(_ET).date()   # PERF-OF-3: one clock read per call
+        soa   = self._chain_soa(ticker, chain, option_type, today)   # PERF-OF-8
+
+        # Per-expiration DTE gate and score, broadcast to contracts
+        dte_checks = [self.filter_by_dte(exp_date, today) for exp_date in soa["exps"]]
+        exp_ok     = np.array([ok for ok, _ in dte_checks], dtype=bool)
+        exp_dte    = np.array([dte for _, dte in dte_checks], dtype=np.int64)
+        exp_idx    = soa["exp"]
+
+        strike, oi, vol = soa["strike"], soa["oi"], soa["volume"]
+        bid, ask        = soa["bid"], soa["ask"]
+        abs_delta       = np.abs(soa["delta"])
+
+        # Same filters as the PERF-OF-2 loop (DTE, strike window,
+        # filter_by_liquidity(), filter_by_delta()) as one mask
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wide = (ask > 0) & (bid > 0) & ((ask - bid) / ((bid + ask) / 2) > max_spread)
+            mid  = np.where((bid != 0) & (ask != 0), (bid + ask) / 2, 0.0)
+            spread_pct = np.where(mid > 0, (ask - bid) / mid, 999.0)
+        mask = (exp_ok[exp_idx]
+                & (lo_px <= strike) & (strike <= hi_px)
+                & (oi >= min_oi) & (vol >= min_vol) & ~wide
+                & (d_min <= abs_delta) & (abs_delta <= d_max))
+
+        if mask.any():
+            dte_score    = 100 - np.abs(exp_dte - _ideal_dte)
+            delta_score  = np.maximum(0, 50 - np.abs(abs_delta - ideal_delta) * 200)
+            oi_score     = np.minimum(oi / 1000, 100)
+            spread_score = np.maximum(0, 100 - spread_pct * 1000)
+            total_score  = dte_score[exp_idx] + oi_score + spread_score + delta_score
+            # argmax returns the first maximum — the loop's tie order
+            i = int(np.argmax(np.where(mask, total_score, -np.inf)))
+            if total_score[i] > best_score:
+                best_score = float(total_score[i])
+                e = int(exp_idx[i])
+                best = (float(strike[i]), soa["exps"][e], soa["opts"][i], int(exp_dte[e]))
+
+        best_option = None
+        if best is not None:
+            strike, exp_date, option, dte = best
+            iv = option.get("impliedVolatility", 0)
+            best_option = {
+                "strike": strike, "expiration": exp_date,
+                "delta": option.get("delta", 0), "theta": option.get("theta", 0),
+                "oi": option.get("openInterest", 0), "volume": option.get("volume", 0),
+                "bid": option.get("bid", 0), "ask": option.get("ask", 0),
+                "iv": iv, "dte": dte,
+                "expected_move": self.calculate_expected_move(entry_price, iv, dte),
+                "score": best_score
+            }
 
         if not best_option:
             return None
@@ -231,19 +416,19 @@ class OptionsFilter:
         gex_stop = stop_price if stop_price > 0 else best_option.get("strike", entry_price)
         try:
             gex_data = compute_gex_levels(chain, entry_price)
-            if gex_data["has_data"]:
+            if gex_data.has_data:
                 gex_mult, gex_label, _ = get_gex_signal_context(
                     gex_data, direction, entry_price, gex_stop, target_price
                 )
                 best_option.update({
                     "gex_multiplier": gex_mult, "gex_label": gex_label,
-                    "gamma_pin": gex_data["gamma_pin"], "gamma_flip": gex_data["gamma_flip"],
-                    "neg_gex_zone": gex_data["neg_gex_zone"], "total_gex": gex_data["total_gex"],
-                    "gex_top_pos": gex_data["top_positive"], "gex_top_neg": gex_data["top_negative"]
+                    "gamma_pin": gex_data.gamma_pin, "gamma_flip": gex_data.gamma_flip,
+                    "neg_gex_zone": gex_data.neg_gex_zone, "total_gex": gex_data.total_gex,
+                    "gex_top_pos": gex_data.top_positive, "gex_top_neg": gex_data.top_negative
                 })
-                flip = f"${gex_data['gamma_flip']:.2f}" if gex_data["gamma_flip"] else "N/A"
-                pin  = f"${gex_data['gamma_pin']:.2f}" if gex_data["gamma_pin"] else "N/A"
-                zone = "NEG" if gex_data["neg_gex_zone"] else "POS"
+                flip = f"${gex_data.gamma_flip:.2f}" if gex_data.gamma_flip else "N/A"
+                pin  = f"${gex_data.gamma_pin:.2f}" if gex_data.gamma_pin else "N/A"
+                zone = "NEG" if gex_data.neg_gex_zone else "POS"
                 logger.info(f"[GEX] {ticker}: Pin={pin} | Flip={flip} | Zone={zone} | {gex_mult:.2f}x [{gex_label}]")
             else:
                 logger.info(f"[GEX] {ticker}: No gamma data")
@@ -338,9 +523,25 @@ class OptionsFilter:
         return True, best, f"Options signal validated{iv_warn}{ivr_warn}"
 
 
+# PERF-OF-5: one shared instance (re-exported by validation.py)
+_options_filter_instance: Optional[OptionsFilter] = None
+_options_filter_lock = threading.Lock()
+
+
+def get_options_filter() -> OptionsFilter:
+    global _options_filter_instance
+    if _options_filter_instance is None:
+        # Concurrent first calls (get_options_recommendations) must not
+        # build two filters and split the chain cache
+        with _options_filter_lock:
+            if _options_filter_instance is None:
+                _options_filter_instance = OptionsFilter()
+    return _options_filter_instance
+
+
 def get_options_recommendation(ticker, direction, entry_price, target_price,
                                stop_price: float = 0.0) -> Optional[Dict]:
-    f = OptionsFilter()
+    f = get_options_filter()   # PERF-OF-5
     is_valid, data, reason = f.validate_signal_for_options(
         ticker, direction, entry_price, target_price, stop_price=stop_price
     )
@@ -349,3 +550,35 @@ def get_options_recommendation(ticker, direction, entry_price, target_price,
         return data
     logger.info(f"[OPTIONS] WARNING {ticker}: {reason}")
     return None
+
+
+def get_options_recommendations(signals: Dict[str, Tuple],
+                                max_workers: int = OPTIONS_BATCH_WORKERS) -> Dict[str, Optional[Dict]]:
+    """
+    PERF-OF-7: get_options_recommendation() for many tickers at once.
+
+    signals: ticker -> (direction, entry_price, target_price[, stop_price])
+    Returns ticker -> recommendation dict, or None where the signal failed
+    validation or the lookup raised.
+
+    For batch callers (backtests, screeners, re-validation sweeps). The live
+    scanner does not use it: tickers go through process_ticker() one at a
+    time and entry/target only exist once a signal has formed inside it.
+    """
+    results: Dict[str, Optional[Dict]] = {}
+    if not signals:
+        return results
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(signals)),
+                            thread_name_prefix="options-batch") as pool:
+        futures = {
+            pool.submit(get_options_recommendation, ticker, *args): ticker
+            for ticker, args in signals.items()
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results[ticker] = future.result()
+            except Exception as e:
+                logger.info(f"[OPTIONS] {ticker}: batch lookup failed — {e}")
+                results[ticker] = None
+    return results
@@ -13,7 +13,9 @@ import logging
 
 # Re-export sub-modules so importers see no change
 from app.validation.regime_filter import RegimeFilter, RegimeState
-from app.validation.options_filter import OptionsFilter, get_options_recommendation
+from app.validation.options_filter import (
+    OptionsFilter, get_options_filter, get_options_recommendation, get_options_recommendations,
+)
 
 from app.indicators import technical_indicators as ti
 from utils import config
@@ -404,7 +406,7 @@ class SignalValidator:
 # ── Global instances ──────────────────────────────────────────────────────────
 _validator_instance:      Optional[SignalValidator] = None
 _regime_filter_instance:  Optional[RegimeFilter]   = None
-_options_filter_instance: Optional[OptionsFilter]  = None
+# get_options_filter() lives in options_filter.py (PERF-OF-5), re-exported above
 
 
 def get_validator() -> SignalValidator:
@@ -421,16 +423,9 @@ def get_regime_filter() -> RegimeFilter:
     return _regime_filter_instance
 
 
-def get_options_filter() -> OptionsFilter:
-    global _options_filter_instance
-    if _options_filter_instance is None:
-        _options_filter_instance = OptionsFilter()
-    return _options_filter_instance
-
-
 __all__ = [
     'SignalValidator', 'RegimeFilter', 'RegimeState', 'OptionsFilter',
     'get_validator', 'get_regime_filter', 'get_options_filter',
-    'get_time_of_day_quality', 'get_options_recommendation',
+    'get_time_of_day_quality', 'get_options_recommendation', 'get_options_recommendations',
     'IVR_HARD_BLOCK', 'IVR_WARN',
 ]
@@ -37,12 +37,14 @@ from pathlib import Path
 from zoneinfo import ZoneInfo
 from typing import List, Dict, Optional
 
+import numpy as np
+import pandas as pd
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).resolve().parents[2] / ".env")
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from app.data.data_manager import data_manager
-from app.data.db_connection import get_conn, return_conn, ph
+from app.data.db_connection import get_conn, return_conn, ph, execute_many
 
 ET = ZoneInfo("America/New_York")
 
@@ -105,46 +107,88 @@ def fetch_intraday_bars(ticker: str, from_date: str, to_date: str) -> List[Dict]
 
 
 def convert_to_storage_format(ticker: str, bars: List[Dict]) -> List[Dict]:
-    """Convert EODHD bars to War Machine format, keeping only market-hours bars."""
-    converted = []
-    for bar in bars:
-        try:
-            dt_str = bar.get("datetime", "")
-            if not dt_str:
-                continue
-            dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=ET)
-
-            # Skip weekends
-            if dt.weekday() >= 5:
-                continue
-
-            # Keep only regular session bars (9:30–16:00 ET)
-            bar_mins = dt.hour * 60 + dt.minute
-            open_mins  = MARKET_OPEN_H  * 60 + MARKET_OPEN_M
-            close_mins = MARKET_CLOSE_H * 60 + MARKET_CLOSE_M
-            if not (open_mins <= bar_mins < close_mins):
-                continue
+    """
+    Convert EODHD bars to War Machine format, keeping only market-hours bars.
+
+    Parsing, numeric coercion and the weekday/session filter run as one
+    vectorized pandas pass over the whole response (a multi-month 1m pull
+    is tens of thousands of bars); only the surviving rows are turned back
+    into dicts. Bars with no datetime are dropped silently; bars with an
+    unparseable datetime, non-numeric OHLCV or a volume int() rejects (e.g.
+    the string "12.5") are counted as malformed. A missing volume loads as 0.
+    """
+    if not bars:
+        return []
+    open_mins  = MARKET_OPEN_H  * 60 + MARKET_OPEN_M
+    close_mins = MARKET_CLOSE_H * 60 + MARKET_CLOSE_M
 
-            converted.append({
-                "ticker":    ticker,
-                "timestamp": dt,
-                "open":      float(bar["open"]),
-                "high":      float(bar["high"]),
-                "low":       float(bar["low"]),
-                "close":     float(bar["close"]),
-                "volume":    int(bar["volume"]) if bar.get("volume") else 0,
-            })
-        except Exception as e:
-            print(f"  ⚠️  Skipping malformed bar for {ticker}: {e}")
-    return converted
+    df = pd.DataFrame.from_records(
+        bars, columns=["datetime", "open", "high", "low", "close", "volume"]
+    )
+    has_dt = (df["datetime"].notna() & (df["datetime"] != "")).to_numpy()
+    dts    = pd.to_datetime(df["datetime"], format="%Y-%m-%d %H:%M:%S", errors="coerce")
+    ohlc   = df[["open", "high", "low", "close"]].apply(pd.to_numeric, errors="coerce")
+    raw_vol = df["volume"]
+    vol     = pd.to_numeric(raw_vol, errors="coerce")
+    # Missing / "" volume loads as 0; anything else int() rejects is malformed
+    bad_vol = (vol.isna() & raw_vol.notna() & raw_vol.ne("")).to_numpy()
+    if raw_vol.dtype == object:
+        # int("12.5") raises: a string volume must be an integer literal
+        bad_vol |= (raw_vol.str.fullmatch(r"\s*[+-]?\d+\s*").eq(False)
+                    & raw_vol.ne("")).to_numpy()
+
+    valid = (
+        dts.notna().to_numpy()
+        & ohlc.notna().all(axis=1).to_numpy()
+        & ~bad_vol
+    )
+    malformed = int((has_dt & ~valid).sum())
+    if malformed:
+        print(f"  ⚠️  Skipping {malformed} malformed bar(s) for {ticker}")
+
+    # Skip weekends; keep only regular session bars (9:30–16:00 ET)
+    mins = (dts.dt.hour * 60 + dts.dt.minute).to_numpy()
+    keep = valid & (dts.dt.weekday < 5).to_numpy() & (mins >= open_mins) & (mins < close_mins)
+
+    stamps = dts[keep].dt.to_pydatetime()
+    o, h, l, c = (ohlc[k].to_numpy(dtype=float)[keep].tolist()
+                  for k in ("open", "high", "low", "close"))
+    v = vol.fillna(0).to_numpy()[keep].astype(np.int64).tolist()
+    return [
+        {
+            "ticker":    ticker,
+            "timestamp": ts.replace(tzinfo=ET),
+            "open":      op,
+            "high":      hi,
+            "low":       lo,
+            "close":     cl,
+            "volume":    vo,
+        }
+        for ts, op, hi, lo, cl, vo in zip(stamps, o, h, l, c, v)
+    ]
 
 
 def cache_bars_to_database(ticker: str, bars: List[Dict]):
+    """
+    Write converted bars through DataManager.store_bars() — one batched
+    upsert and one commit per ticker (ET-naive datetimes, as the live
+    pipeline stores them).
+    """
     if not bars:
         return
-    for bar in bars:
-        data_manager.cache_bar(ticker, bar)
-    print(f"  ✅ Cached {len(bars)} bars for {ticker}")
+    rows = [
+        {
+            "datetime": b["timestamp"].replace(tzinfo=None),
+            "open":     b["open"],
+            "high":     b["high"],
+            "low":      b["low"],
+            "close":    b["close"],
+            "volume":   b["volume"],
+        }
+        for b in bars
+    ]
+    stored = data_manager.store_bars(ticker, rows, quiet=True)
+    print(f"  ✅ Cached {stored} bars for {ticker}")
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -295,17 +339,20 @@ def fetch_and_store_indicators(ticker: str, from_date: str, to_date: str) -> int
         f"ON CONFLICT (ticker, date) DO UPDATE SET "
         f"ema20={p}, adx14={p}, rsi14={p}, atr14={p}, prior_close={p}, fetched_at=NOW()"
     )
-    conn = get_conn()
-    cur  = conn.cursor()
-    for row in rows:
-        vals = (
+    vals = [
+        (
             row["ticker"], row["date"],
             row["ema20"], row["adx14"], row["rsi14"], row["atr14"], row["prior_close"],
             row["ema20"], row["adx14"], row["rsi14"], row["atr14"], row["prior_close"],
         )
-        cur.execute(sql, vals)
-    conn.commit()
-    return_conn(conn)
+        for row in rows
+    ]
+    conn = get_conn()
+    try:
+        execute_many(conn.cursor(), sql, vals)
+        conn.commit()
+    finally:
+        return_conn(conn)
 
     print(f"  ✅ {len(rows)} indicator rows upserted for {ticker}")
     return len(rows)
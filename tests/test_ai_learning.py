@@ -0,0 +1,70 @@
+"""
+tests/test_ai_learning.py
+
+Unit tests for AILearningEngine persistence against a throwaway SQLite file.
+
+Covers:
+  - a legacy learning_data.json is imported when ai_learning_state is empty,
+    and the next save_data() moves it into the table
+  - once the row exists, the table wins over the JSON file
+
+No network / Postgres access: db_connection.get_conn is pointed at tmp_path.
+"""
+import functools
+import json
+from unittest.mock import patch
+
+import pytest
+
+import app.ai.ai_learning as ail
+import app.data.db_connection as dbc
+
+
+@pytest.fixture
+def state_db(tmp_path):
+    db_file = str(tmp_path / "ai.db")
+    with patch.object(dbc, "get_conn", functools.partial(dbc.get_conn, db_file)), \
+         patch.object(dbc, "USE_POSTGRES", False):
+        yield db_file
+
+
+def _stored_row():
+    conn = dbc.get_conn()   # patched to db_file by state_db
+    try:
+        row = conn.cursor().execute(
+            "SELECT data FROM ai_learning_state WHERE id = 1"
+        ).fetchone()
+        return json.loads(row["data"]) if row else None
+    finally:
+        dbc.return_conn(conn)
+
+
+def test_legacy_json_imported_into_ai_learning_state(state_db, tmp_path):
+    legacy = tmp_path / "learning_data.json"
+    legacy.write_text(json.dumps({
+        "trades": [{"ticker": "AAA", "pnl": 120.0}],
+        "fvg_size_optimal": 0.0035,
+    }))
+
+    engine = ail.AILearningEngine(db_path=str(legacy))
+    assert engine.data["fvg_size_optimal"] == 0.0035
+    assert engine.data["trades"] == [{"ticker": "AAA", "pnl": 120.0}]
+    assert "confirmation_weights" in engine.data   # defaults fill the gaps
+    assert _stored_row() is None                   # import alone does not write
+
+    engine.save_data()
+    stored = _stored_row()
+    assert stored["fvg_size_optimal"] == 0.0035
+    assert stored["trades"] == [{"ticker": "AAA", "pnl": 120.0}]
+
+    # The row now wins: a changed or missing JSON file is ignored
+    legacy.write_text(json.dumps({"fvg_size_optimal": 0.9}))
+    assert ail.AILearningEngine(db_path=str(legacy)).data["fvg_size_optimal"] == 0.0035
+    legacy.unlink()
+    assert ail.AILearningEngine(db_path=str(legacy)).data["trades"] == stored["trades"]
+
+
+def test_missing_legacy_json_starts_from_defaults(state_db, tmp_path):
+    engine = ail.AILearningEngine(db_path=str(tmp_path / "absent.json"))
+    assert engine.data["trades"] == ail._DEFAULT_DATA["trades"]
+    assert engine.data["fvg_size_optimal"] == ail._DEFAULT_DATA["fvg_size_optimal"]
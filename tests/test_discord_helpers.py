@@ -0,0 +1,195 @@
+"""
+tests/test_discord_helpers.py
+
+Unit tests for the background send path in app/notifications/discord_helpers.
+
+Covers:
+  - _coalesce() merges queued embed-only payloads for the same webhook
+  - _coalesce() carries over payloads it cannot merge (other webhook,
+    plain content, per-message embed cap)
+  - _send_to_discord() only enqueues — no HTTP on the caller's thread
+  - _enqueue() drops payloads when the bounded queue is full
+  - _pack_embeds() splits embeds on the per-message limits
+  - _enqueue() starts the send worker lazily, exactly once
+  - _flush_on_exit() has the worker drain the queue at shutdown, in order
+    and including its carried-over item, only if the worker ran
+  - _flush_on_exit() gives up after _EXIT_FLUSH_TIMEOUT_S
+  - _enqueue() after an exit flush starts a fresh worker
+
+No network access: the send queue is a local queue.Queue and the session
+is patched wherever a send could happen.
+"""
+import queue
+import threading
+import time
+from unittest.mock import patch
+
+import app.notifications.discord_helpers as dh
+
+URL_A = "https://discord.test/a"
+URL_B = "https://discord.test/b"
+
+
+def _embed(title: str) -> dict:
+    return {"title": title, "description": "x" * 10}
+
+
+def _item(url: str, *titles: str) -> tuple:
+    return (url, {"embeds": [_embed(t) for t in titles]}, "")
+
+
+def _queue_of(*items) -> "queue.Queue":
+    q = queue.Queue()
+    for it in items:
+        q.put_nowait(it)
+    return q
+
+
+def test_coalesce_merges_same_webhook_embeds():
+    pending = _queue_of(_item(URL_A, "b"), _item(URL_A, "c"))
+    item, carry = dh._coalesce(_item(URL_A, "a"), pending)
+    assert carry is None
+    assert item[0] == URL_A
+    assert [e["title"] for e in item[1]["embeds"]] == ["a", "b", "c"]
+    assert pending.empty()
+
+
+def test_coalesce_carries_other_webhook():
+    other = _item(URL_B, "z")
+    pending = _queue_of(_item(URL_A, "b"), other, _item(URL_A, "c"))
+    item, carry = dh._coalesce(_item(URL_A, "a"), pending)
+    assert [e["title"] for e in item[1]["embeds"]] == ["a", "b"]
+    assert carry[0] == URL_B
+    # Anything after the carried item stays queued, order preserved
+    assert pending.get_nowait()[1]["embeds"][0]["title"] == "c"
+
+
+def test_coalesce_leaves_plain_content_alone():
+    first = (URL_A, {"content": "hello"}, "")
+    pending = _queue_of(_item(URL_A, "b"))
+    item, carry = dh._coalesce(first, pending)
+    assert item is first
+    assert carry is None
+    assert pending.qsize() == 1
+
+
+def test_coalesce_respects_embed_cap():
+    titles = [str(i) for i in range(dh._MAX_EMBEDS_PER_MESSAGE)]
+    pending = _queue_of(*[_item(URL_A, t) for t in titles])
+    item, carry = dh._coalesce(_item(URL_A, "first"), pending)
+    assert len(item[1]["embeds"]) == dh._MAX_EMBEDS_PER_MESSAGE
+    assert carry is None
+    assert pending.qsize() == 1
+
+
+def test_send_to_discord_only_enqueues():
+    q = queue.Queue()
+    with patch.object(dh, "_send_queue", q), \
+         patch.object(dh, "_ensure_worker"), \
+         patch.object(dh, "_SIGNALS_WEBHOOK", URL_A), \
+         patch.object(dh._session, "post") as post:
+        dh.send_simple_message("ping")
+    post.assert_not_called()
+    url, payload, _ = q.get_nowait()
+    assert url == URL_A
+    assert payload == {"content": "ping"}
+
+
+def test_pack_embeds_respects_limits():
+    small = [_embed(str(i)) for i in range(dh._MAX_EMBEDS_PER_MESSAGE + 3)]
+    batches = dh._pack_embeds(small)
+    assert [len(b) for b in batches] == [dh._MAX_EMBEDS_PER_MESSAGE, 3]
+
+    big = {"title": "t", "description": "x" * (dh._MAX_EMBED_CHARS // 2)}
+    assert [len(b) for b in dh._pack_embeds([big, big, big])] == [1, 1, 1]
+
+
+def test_enqueue_drops_when_queue_full():
+    q = queue.Queue(maxsize=1)
+    with patch.object(dh, "_send_queue", q), patch.object(dh, "_ensure_worker"):
+        dh._enqueue(URL_A, {"content": "one"}, "")
+        dh._enqueue(URL_A, {"content": "two"}, "")   # must not raise or block
+    assert q.qsize() == 1
+    assert q.get_nowait()[1] == {"content": "one"}
+
+
+def test_enqueue_starts_worker_once():
+    q = queue.Queue()
+    with patch.object(dh, "_send_queue", q), \
+         patch.object(dh, "_worker_thread", None), \
+         patch.object(dh.threading, "Thread") as thread:
+        dh._enqueue(URL_A, {"content": "one"}, "")
+        dh._enqueue(URL_A, {"content": "two"}, "")
+    assert thread.call_count == 1
+    assert thread.return_value.start.call_count == 1
+    assert q.qsize() == 2
+
+
+def _start_worker() -> threading.Thread:
+    t = threading.Thread(target=dh._discord_worker, daemon=True)
+    t.start()
+    return t
+
+
+def test_flush_on_exit_posts_pending():
+    q = _queue_of(
+        _item(URL_A, "a"), _item(URL_A, "b"),
+        (URL_B, {"content": "bye"}, ""),   # carried over by the first coalesce
+        _item(URL_A, "c"),
+    )
+    with patch.object(dh, "_send_queue", q), \
+         patch.object(dh, "_RATE_LIMIT_INTERVAL", 0), \
+         patch.object(dh, "_post") as post:
+        worker = _start_worker()
+        with patch.object(dh, "_worker_thread", worker):
+            dh._flush_on_exit()
+    assert not worker.is_alive()
+    assert q.empty()
+    assert [c.args[0] for c in post.call_args_list] == [URL_A, URL_B, URL_A]
+    assert len(post.call_args_list[0].args[1]["embeds"]) == 2
+
+
+def test_enqueue_after_flush_restarts_worker():
+    q = queue.Queue()
+    with patch.object(dh, "_send_queue", q), \
+         patch.object(dh, "_RATE_LIMIT_INTERVAL", 0), \
+         patch.object(dh, "_post") as post:
+        first = _start_worker()
+        with patch.object(dh, "_worker_thread", first):
+            dh._flush_on_exit()
+            assert not first.is_alive()
+            dh._enqueue(URL_A, {"content": "late"}, "")   # e.g. a later atexit hook
+            second = dh._worker_thread
+            assert second is not first
+            dh._flush_on_exit()
+            assert not second.is_alive()
+    assert q.empty()
+    assert [c.args[1] for c in post.call_args_list] == [{"content": "late"}]
+
+
+def test_flush_on_exit_times_out():
+    release = threading.Event()
+    q = _queue_of(_item(URL_A, "a"), (URL_B, {"content": "bye"}, ""))
+    with patch.object(dh, "_send_queue", q), \
+         patch.object(dh, "_RATE_LIMIT_INTERVAL", 0), \
+         patch.object(dh, "_EXIT_FLUSH_TIMEOUT_S", 0.2), \
+         patch.object(dh, "_post", side_effect=lambda *a: release.wait(5)):
+        worker = _start_worker()
+        with patch.object(dh, "_worker_thread", worker):
+            start = time.monotonic()
+            dh._flush_on_exit()
+            assert time.monotonic() - start < 1.0
+            assert worker.is_alive()
+        release.set()
+        worker.join(5)
+    assert not worker.is_alive()
+
+
+def test_flush_on_exit_noop_without_worker():
+    q = _queue_of(_item(URL_A, "a"))
+    with patch.object(dh, "_send_queue", q), \
+         patch.object(dh, "_worker_thread", None), \
+         patch.object(dh, "_post") as post:
+        dh._flush_on_exit()
+    post.assert_not_called()
+    assert q.qsize() == 1
@@ -0,0 +1,44 @@
+"""
+tests/test_dynamic_thresholds.py
+
+Unit tests for the memoized win-rate adjustment in
+app/risk/dynamic_thresholds.
+
+Covers:
+  - a result is cached and reused until invalidate_winrate_cache()
+  - a query that overlaps an invalidation does not republish its result
+
+No DB access: _query_winrate_adjustment() is patched throughout.
+"""
+from unittest.mock import patch
+
+import pytest
+
+import app.risk.dynamic_thresholds as dt
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    dt.invalidate_winrate_cache()
+    yield
+    dt.invalidate_winrate_cache()
+
+
+def test_winrate_adjustment_cached_until_invalidated():
+    with patch.object(dt, "_query_winrate_adjustment", return_value=0.02) as q:
+        assert dt._get_winrate_adjustment("CFW6_OR", "A") == 0.02
+        assert dt._get_winrate_adjustment("CFW6_OR", "A") == 0.02
+        assert q.call_count == 1
+        dt.invalidate_winrate_cache()
+        assert dt._get_winrate_adjustment("CFW6_OR", "A") == 0.02
+        assert q.call_count == 2
+
+
+def test_stale_query_not_stored_after_invalidation():
+    def query_then_close(signal_type, grade):
+        dt.invalidate_winrate_cache()   # a position closes mid-query
+        return -0.03
+
+    with patch.object(dt, "_query_winrate_adjustment", side_effect=query_then_close):
+        assert dt._get_winrate_adjustment("CFW6_OR", "A") == -0.03
+    assert ("CFW6_OR", "A") not in dt._winrate_cache
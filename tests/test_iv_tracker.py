@@ -0,0 +1,71 @@
+"""
+tests/test_iv_tracker.py
+
+Unit tests for app/options/iv_tracker against a throwaway SQLite file.
+
+Covers:
+  - compute_ivr_batch() matches compute_ivr() called per ticker, with
+    flushed rows, still-buffered observations, buffered-only tickers,
+    unknown tickers and zero IVs — on both a cold and a warm stats cache
+
+No network / Postgres access: db_connection.get_conn is pointed at tmp_path.
+"""
+import functools
+from unittest.mock import patch
+
+import pytest
+
+import app.options.iv_tracker as ivt
+import app.data.db_connection as dbc
+
+
+@pytest.fixture
+def iv_db(tmp_path):
+    """Fresh iv_history table, empty write buffer and empty stats cache."""
+    get_conn = functools.partial(dbc.get_conn, str(tmp_path / "iv.db"))
+    with patch.object(dbc, "get_conn", get_conn), \
+         patch.object(ivt, "IV_FLUSH_BATCH", 10_000), \
+         patch.object(ivt, "IV_FLUSH_INTERVAL_S", 1e9):
+        with ivt._iv_buf_lock:
+            ivt._iv_buf.clear()
+        ivt._ivr_stats.clear()
+        ivt._ensure_iv_history_table()
+        yield
+        with ivt._iv_buf_lock:
+            ivt._iv_buf.clear()
+        ivt._ivr_stats.clear()
+
+
+def test_batch_matches_scalar_with_buffered_observations(iv_db):
+    # Flushed history: AAA has enough rows, BBB is below MIN_OBSERVATIONS
+    for i in range(12):
+        ivt.store_iv_observation("AAA", 0.20 + i * 0.01)
+    for i in range(4):
+        ivt.store_iv_observation("BBB", 0.50 + i * 0.05)
+    ivt.store_iv_observation("FLAT", 0.30)
+    assert ivt.flush_iv_observations() == 17
+
+    # Still buffered: widens AAA's range, tips BBB over the threshold,
+    # and CCC exists only in the buffer
+    ivt.store_iv_observation("AAA", 0.90)
+    for i in range(8):
+        ivt.store_iv_observation("BBB", 0.40 + i * 0.02)
+    for i in range(10):
+        ivt.store_iv_observation("CCC", 0.10 + i * 0.03)
+    for _ in range(9):
+        ivt.store_iv_observation("FLAT", 0.30)
+    assert len(ivt._iv_buf) == 28
+
+    current = {"AAA": 0.35, "BBB": 0.70, "CCC": 0.22, "FLAT": 0.30,
+               "NONE": 0.25, "ZERO": 0.0}
+
+    for _ in range(2):   # cold stats cache, then warm
+        batch = ivt.compute_ivr_batch(current)
+        assert batch == {t: ivt.compute_ivr(t, iv) for t, iv in current.items()}
+
+    assert batch["AAA"][1:] == (13, True)
+    assert batch["BBB"][1:] == (12, True)
+    assert batch["CCC"][1:] == (10, True)
+    assert batch["FLAT"] == (50.0, 10, True)
+    assert batch["NONE"] == (None, 0, False)
+    assert batch["ZERO"] == (None, 0, False)
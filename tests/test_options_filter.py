@@ -0,0 +1,73 @@
+"""
+tests/test_options_filter.py
+
+Unit tests for the batch / shared-instance helpers in
+app/validation/options_filter.
+
+Covers:
+  - get_options_recommendations() runs lookups concurrently
+  - get_options_recommendations() maps a raising lookup to None
+  - get_options_filter() builds one instance under concurrent first calls
+
+No network access: validate_signal_for_options() is patched throughout.
+"""
+import threading
+import time
+from unittest.mock import patch
+
+import app.validation.options_filter as of
+
+
+def test_batch_runs_lookups_concurrently():
+    tickers = [f"T{i}" for i in range(4)]
+    barrier = threading.Barrier(len(tickers), timeout=5)
+
+    def validate(ticker, direction, entry, target, stop_price=0.0):
+        barrier.wait()   # only passes if all lookups are in flight together
+        return True, {"ticker": ticker, "direction": direction}, "ok"
+
+    with patch.object(of.OptionsFilter, "validate_signal_for_options",
+                      side_effect=validate):
+        results = of.get_options_recommendations(
+            {t: ("bull", 100.0, 105.0) for t in tickers}, max_workers=len(tickers)
+        )
+    assert results == {t: {"ticker": t, "direction": "bull"} for t in tickers}
+
+
+def test_batch_maps_errors_and_rejects_to_none():
+    def validate(ticker, direction, entry, target, stop_price=0.0):
+        if ticker == "BAD":
+            raise RuntimeError("boom")
+        if ticker == "REJ":
+            return False, None, "rejected"
+        return True, {"stop": stop_price}, "ok"
+
+    with patch.object(of.OptionsFilter, "validate_signal_for_options",
+                      side_effect=validate):
+        results = of.get_options_recommendations({
+            "OK":  ("bear", 100.0, 95.0, 102.0),
+            "BAD": ("bull", 100.0, 105.0),
+            "REJ": ("bull", 100.0, 105.0),
+        })
+    assert results == {"OK": {"stop": 102.0}, "BAD": None, "REJ": None}
+    assert of.get_options_recommendations({}) == {}
+
+
+def test_get_options_filter_single_instance_under_race():
+    original_init = of.OptionsFilter.__init__
+
+    def slow_init(self):
+        time.sleep(0.05)   # widen the check-then-set window
+        original_init(self)
+
+    seen = []
+    with patch.object(of, "_options_filter_instance", None), \
+         patch.object(of.OptionsFilter, "__init__", slow_init):
+        threads = [threading.Thread(target=lambda: seen.append(of.get_options_filter()))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert len(seen) == 8
+    assert len({id(f) for f in seen}) == 1
@@ -0,0 +1,111 @@
+"""
+tests/test_position_manager.py
+
+Unit tests for PositionManager.close_positions_bulk() against an in-memory
+SQLite positions table.
+
+Covers:
+  - N closes are written with a single commit
+  - final P&L per direction includes prior partial P&L
+  - unknown / already-CLOSED ids are skipped
+  - the streak is refreshed before the per-close side effects run
+
+No network access: per-close side effects and the circuit breaker are patched.
+"""
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import app.risk.position_manager as pm_mod
+
+
+class _CountingConn:
+    """sqlite3 connection proxy that counts commit() calls."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+        self._conn.commit()
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+@pytest.fixture
+def db():
+    raw = sqlite3.connect(":memory:")
+    raw.row_factory = sqlite3.Row
+    raw.execute("""
+        CREATE TABLE positions (
+            id INTEGER PRIMARY KEY, ticker TEXT, direction TEXT,
+            entry_price REAL, remaining_contracts INTEGER, pnl REAL,
+            grade TEXT, exit_price REAL, exit_reason TEXT,
+            exit_time TIMESTAMP, status TEXT DEFAULT 'OPEN'
+        )
+    """)
+    raw.executemany(
+        "INSERT INTO positions (id, ticker, direction, entry_price, "
+        "remaining_contracts, pnl, grade, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (1, "AAA", "bull", 2.00, 3, None, "A",  "OPEN"),
+            (2, "BBB", "bear", 1.50, 2, 40.0, "B+", "OPEN"),
+            (3, "CCC", "bull", 3.00, 1, None, "A",  "OPEN"),
+            (4, "DDD", "bull", 1.00, 5, 75.0, "A",  "CLOSED"),
+        ],
+    )
+    raw.commit()
+    conn = _CountingConn(raw)
+    with patch.object(pm_mod, "get_conn", return_value=conn), \
+         patch.object(pm_mod, "return_conn"), \
+         patch.object(pm_mod, "ph", return_value="?"):
+        yield conn
+    raw.close()
+
+
+@pytest.fixture
+def pm():
+    mgr = pm_mod.PositionManager.__new__(pm_mod.PositionManager)
+    mgr.positions = [{"id": i} for i in (1, 2, 3, 4)]
+    mgr._invalidate_caches = MagicMock()
+    mgr.get_todays_closed_trades = MagicMock(return_value=[])
+    mgr._update_performance_streak = MagicMock()
+    mgr._after_close = MagicMock()
+    mgr.get_daily_stats = MagicMock(return_value={})
+    mgr.check_circuit_breaker = MagicMock(return_value=(False, ""))
+    return mgr
+
+
+def test_bulk_close_single_commit_pnl_and_skips(db, pm):
+    order = []
+    pm._update_performance_streak.side_effect = lambda *_: order.append("streak")
+    pm._after_close.side_effect = lambda pos, *_: order.append(pos["id"])
+
+    pm.close_positions_bulk([
+        (1, 2.50, "T2"),          # bull: (2.50 - 2.00) * 100 * 3 = 150
+        (2, 1.80, "STOP"),        # bear: 40 + (1.50 - 1.80) * 100 * 2 = -20
+        (4, 9.99, "EOD CLOSE"),   # already CLOSED -> skipped
+        (99, 1.00, "EOD CLOSE"),  # unknown id -> skipped
+    ])
+
+    assert db.commits == 1
+    rows = {r["id"]: r for r in db.execute("SELECT * FROM positions")}
+    assert rows[1]["status"] == "CLOSED" and rows[1]["pnl"] == pytest.approx(150.0)
+    assert rows[2]["status"] == "CLOSED" and rows[2]["pnl"] == pytest.approx(-20.0)
+    assert rows[2]["exit_reason"] == "STOP"
+    assert rows[3]["status"] == "OPEN" and rows[3]["exit_price"] is None
+    assert rows[4]["pnl"] == 75.0 and rows[4]["exit_price"] is None
+
+    assert order == ["streak", 1, 2]
+    assert [p["id"] for p in pm.positions] == [3, 4]
+    pm.check_circuit_breaker.assert_called_once()
+
+
+def test_bulk_close_nothing_open_does_not_commit(db, pm):
+    pm.close_positions_bulk([(4, 1.0, "EOD CLOSE"), (99, 1.0, "EOD CLOSE")])
+    pm.close_positions_bulk([])
+    assert db.commits == 0
+    pm._after_close.assert_not_called()
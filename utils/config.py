@@ -52,6 +52,11 @@ DATABASE_URL = None  # Set to PostgreSQL URL if using Railway/Heroku
 DB_PATH = os.getenv('DB_PATH', '/app/data/war_machine.db')
 DBPATH = DB_PATH  # Alias used by WatchlistFunnel / VolumeAnalyzer
 
+# Postgres only: create intraday_bars as a monthly RANGE-partitioned table on a
+# fresh database. Existing (non-partitioned) tables are never converted.
+PARTITION_INTRADAY_BARS = os.getenv('PARTITION_INTRADAY_BARS', 'false').strip().lower() == 'true'
+BARS_PARTITION_MONTHS_BACK = 3   # months of partitions pre-created behind today
+
 # ========================================
 # OPENING RANGE THRESHOLDS
 # ========================================
@@ -133,6 +138,8 @@ MIN_OPTION_OI = 100
 MIN_OPTION_VOLUME = 50
 MAX_BID_ASK_SPREAD_PCT = 0.10
 MAX_THETA_DECAY_PCT = 0.05
+# One TTL for both options-chain caches (OptionsFilter, OptionsIntelligence)
+OPTIONS_CHAIN_CACHE_TTL_SEC = 300
 
 # ── P2-2: Delta range tightened to target 0.35–0.45Δ sweet spot ──────────────
 # Previous: MIN=0.40, MAX=0.70 (too wide — often selected deep ITM contracts)
@@ -168,6 +175,8 @@ DISCORD_NEWS_WEBHOOK_URL = os.getenv('DISCORD_NEWS_WEBHOOK_URL', '')
 
 DISCORD_WATCHLIST_WEBHOOK_URL = os.getenv('DISCORD_WATCHLIST_WEBHOOK_URL', '')
 
+DISCORD_REGIME_WEBHOOK_URL = os.getenv('DISCORD_REGIME_WEBHOOK_URL', '')
+
 # ========================================
 # BASELINE SCANNER CONFIGURATION
 # ========================================
@@ -0,0 +1,61 @@
+"""
+utils/http.py — Shared keep-alive HTTP session factory
+
+Every module that talks to EODHD or Discord holds one module-level
+requests.Session so repeated calls reuse TLS connections instead of
+re-handshaking. make_session() builds that session in one place: an
+HTTPAdapter sized to the caller's worker count, with an optional bounded
+urllib3 Retry (0 retries = plain adapter, the requests default).
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def make_session(pool_maxsize: int, retries: int = 0, *,
+                 backoff_factor: float = 0.3,
+                 status_forcelist=RETRY_STATUSES,
+                 allowed_methods=None,
+                 read=None,
+                 pool_connections: int = 1) -> requests.Session:
+    """
+    Return a requests.Session with a keep-alive HTTPS adapter.
+
+    Args:
+      pool_maxsize:     connections kept per host (match the caller's workers)
+      retries:          total retries on connect errors / status_forcelist;
+                        0 disables the Retry object entirely
+      backoff_factor:   urllib3 exponential backoff base (seconds)
+      status_forcelist: HTTP statuses that trigger a retry
+      allowed_methods:  methods eligible for retry; None keeps urllib3's
+                        idempotent default (GET/HEAD/...), so POST must be
+                        opted in explicitly
+      read:             cap on retries after a read error (the request may
+                        have been processed); None = bounded by `retries`.
+                        Pass 0 for non-idempotent methods like POST.
+      pool_connections: number of distinct hosts to keep pools for
+    """
+    max_retries = 0
+    if retries:
+        kwargs = {}
+        if allowed_methods is not None:
+            kwargs["allowed_methods"] = frozenset(allowed_methods)
+        if read is not None:
+            kwargs["read"] = read
+        max_retries = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=tuple(status_forcelist),
+            raise_on_status=False,
+            **kwargs,
+        )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+    ))
+    return session
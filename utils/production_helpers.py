@@ -15,7 +15,6 @@ FIX (MAR 25, 2026): SEMAPHORE LEAK IN _db_operation_safe()
 """
 
 import requests
-import traceback
 import logging
 logger = logging.getLogger(__name__)
 
@@ -76,10 +75,8 @@ def _fetch_data_safe(ticker, data_func, data_type="data"):
             logger.info(f"[{ticker}] ⚠️  No {data_type} available")
             return None
         return data
-    except Exception as e:
-        logger.info(f"[{ticker}] ❌ Failed to fetch {data_type}: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("[%s] ❌ Failed to fetch %s", ticker, data_type)
         return None
 
 # Usage: